@@ -13,6 +13,14 @@ automatically suggesting theoretical refinements based on topological and geomet
 Modules:
 --------
 - calculation_engine: Execute all IRH predictions with high precision
+- parameter_sweep: Vectorized float64 evaluation of predictions over input grids
+- symbolic: SymPy expressions of all derivations, compiled to NumPy/mpmath kernels
+- adaptive_precision: float64 fast path with error bounds and mpmath escalation
+- interval_arithmetic: Certified interval evaluation (CalculationEngine(interval=True))
+- sensitivity: Forward-mode Jacobian of all predictions w.r.t. engine inputs
+- prediction_cache: Persistent on-disk cache of baseline predictions
+- prediction_set: Array-backed prediction sets with copy-on-write variants
+- monte_carlo: Monte Carlo propagation of derivation-input uncertainties
 - experimental_database: Comprehensive database of CODATA, PDG, and Planck values
 - validation_module: Compare theoretical predictions to experimental measurements
 - error_analyzer: Identify systematic patterns in prediction errors
@@ -104,11 +112,24 @@ __all__ = [
     # Calculation
     'CalculationEngine',
     'PredictionResult',
+    'ParameterSweep',
+    'SweepResult',
+    'AdaptivePrecisionEngine',
+    'Jacobian',
+    'compute_jacobian',
+    'PredictionCache',
+    'PredictionSet',
+    'MonteCarloPropagator',
     # Database
     'ExperimentalDatabase', 
+    'ValidationPlan',
+    'EditionDiff',
+    'CovarianceFactor',
+    'get_database',
     # Validation
     'ValidationModule',
     'ValidationResult',
+    'StreamingValidationSummary',
     # Error Analysis
     'ErrorAnalyzer',
     'ErrorPattern',
@@ -116,6 +137,8 @@ __all__ = [
     'AIAdvisor',
     'RefinementSuggestion',
     'TopologicalModification',
+    'TemplateRegistry',
+    'template_registry',
     # Gemini Integration (NEW)
     'GeminiTheoryAdvisor',
     # Integration System (Phase 3)
@@ -123,6 +146,8 @@ __all__ = [
     'IntegrationResult',
     'IntegrationStatus',
     'RegressionTestResult',
+    'RejectionMemo',
+    'CompositionSearch',
     # Documentation Updater (Phase 3)
     'DocumentationUpdater',
     'ChangelogEntry',
@@ -132,10 +157,21 @@ __all__ = [
 ]
 
 from .calculation_engine import CalculationEngine, PredictionResult
-from .experimental_database import ExperimentalDatabase
+from .parameter_sweep import ParameterSweep, SweepResult
+from .adaptive_precision import AdaptivePrecisionEngine
+from .sensitivity import Jacobian, compute_jacobian
+from .prediction_cache import PredictionCache
+from .prediction_set import PredictionSet
+from .monte_carlo import MonteCarloPropagator
+from .experimental_database import (
+    ExperimentalDatabase, ValidationPlan, EditionDiff, CovarianceFactor, get_database
+)
 from .validation_module import ValidationModule, ValidationResult
+from .streaming_validation import StreamingValidationSummary
 from .error_analyzer import ErrorAnalyzer, ErrorPattern
-from .ai_advisor import AIAdvisor, RefinementSuggestion, TopologicalModification
+from .ai_advisor import (
+    AIAdvisor, RefinementSuggestion, TopologicalModification, TemplateRegistry, template_registry
+)
 from .gemini_integration import GeminiTheoryAdvisor  # 🆕 NEW
 from .integration_system import (
     IntegrationSystem, 
@@ -143,5 +179,7 @@ from .integration_system import (
     IntegrationStatus,
     RegressionTestResult
 )
+from .rejection_memo import RejectionMemo
+from .composition_search import CompositionSearch
 from .documentation_updater import DocumentationUpdater, ChangelogEntry
 from .evolution_cycle import EvolutionCycle, CycleResult
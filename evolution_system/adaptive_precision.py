@@ -0,0 +1,298 @@
+"""
+Adaptive Precision for IRH Theory Evolution System
+==================================================
+
+Evaluates predictions in float64 first, with a rigorous-in-practice bound
+on the accumulated rounding error, and escalates to mpmath only for the
+predictions whose bound is wider than the comparison tolerance.
+
+**Components:**
+- TrackedFloat: float64 value carrying an absolute error bound
+- Float64Context: drop-in arithmetic context for CalculationEngine
+- AdaptivePrecisionEngine: float64 fast path + per-key mpmath escalation
+
+Error bounds are first-order: every operation adds the propagated input
+errors and half an ulp (one ulp for libm functions) of its result.
+
+Usage:
+------
+```python
+from evolution_system.adaptive_precision import AdaptivePrecisionEngine
+
+engine = AdaptivePrecisionEngine(
+    rtol=1e-10,
+    tolerances={'Lambda_suppression': (0.0, 1e-25)},   # (rtol, atol)
+)
+predictions = engine.compute_all_predictions()
+print(engine.escalated)             # ['Lambda_suppression']
+print(engine.error_bounds['alpha_inv'])
+```
+"""
+
+import cmath
+import math
+from fractions import Fraction
+from typing import Dict, List, Optional, Tuple, Any
+
+from mpmath.libmp import from_float
+
+from .calculation_engine import CalculationEngine, PredictionResult
+
+
+def _half_ulp(value: float) -> float:
+    """Maximum rounding error of a correctly rounded float64 result."""
+    return math.ulp(value) / 2
+
+
+class TrackedFloat(float):
+    """
+    float64 value with an absolute error bound ``err``.
+
+    Arithmetic with other TrackedFloats, ints and floats propagates the
+    bound. The ``_mpf_`` attribute lets mpmath (and PredictionResult)
+    accept a TrackedFloat wherever an mpf is expected.
+    """
+
+    __slots__ = ('err',)
+
+    def __new__(cls, value: float, err: float = 0.0):
+        obj = super().__new__(cls, value)
+        obj.err = err
+        return obj
+
+    def __repr__(self) -> str:
+        return f"TrackedFloat({float(self)!r}, err={self.err!r})"
+
+    def __str__(self) -> str:
+        return repr(float(self))
+
+    @property
+    def _mpf_(self):
+        return from_float(float(self))
+
+    @staticmethod
+    def _lift(other: Any) -> Optional[Tuple[float, float]]:
+        """Return (value, error) for supported operands, else None."""
+        if isinstance(other, TrackedFloat):
+            return float(other), other.err
+        if isinstance(other, (int, float)) and not isinstance(other, bool):
+            value = float(other)
+            exact = not isinstance(other, int) or abs(other) <= 2**53
+            return value, 0.0 if exact else _half_ulp(value)
+        return None
+
+    def __add__(self, other):
+        rhs = self._lift(other)
+        if rhs is None:
+            return NotImplemented
+        value = float(self) + rhs[0]
+        return TrackedFloat(value, self.err + rhs[1] + _half_ulp(value))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        rhs = self._lift(other)
+        if rhs is None:
+            return NotImplemented
+        value = float(self) - rhs[0]
+        return TrackedFloat(value, self.err + rhs[1] + _half_ulp(value))
+
+    def __rsub__(self, other):
+        lhs = self._lift(other)
+        if lhs is None:
+            return NotImplemented
+        return TrackedFloat(*lhs) - self
+
+    def __mul__(self, other):
+        rhs = self._lift(other)
+        if rhs is None:
+            return NotImplemented
+        a, ea = float(self), self.err
+        b, eb = rhs
+        value = a * b
+        return TrackedFloat(value, abs(a) * eb + abs(b) * ea + ea * eb + _half_ulp(value))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        rhs = self._lift(other)
+        if rhs is None:
+            return NotImplemented
+        a, ea = float(self), self.err
+        b, eb = rhs
+        value = a / b
+        margin = abs(b) - eb
+        err = (ea + abs(value) * eb) / margin if margin > 0 else math.inf
+        return TrackedFloat(value, err + _half_ulp(value))
+
+    def __rtruediv__(self, other):
+        lhs = self._lift(other)
+        if lhs is None:
+            return NotImplemented
+        return TrackedFloat(*lhs) / self
+
+    def __pow__(self, exponent):
+        if isinstance(exponent, int) and not isinstance(exponent, bool):
+            a = float(self)
+            value = a ** exponent
+            rel = self.err / abs(a) if a != 0 else (0.0 if self.err == 0 else math.inf)
+            growth = (1 + rel) ** abs(exponent) - 1 if exponent >= 0 else (
+                (1 - rel) ** exponent - 1 if rel < 1 else math.inf
+            )
+            return TrackedFloat(value, abs(value) * growth + math.ulp(value))
+        rhs = self._lift(exponent)
+        if rhs is None:
+            return NotImplemented
+        # First order: d(a^b) = b·a^(b-1)·da + a^b·ln(a)·db
+        a, b = float(self), rhs[0]
+        value = a ** b
+        err = abs(b * value / a) * self.err + abs(value * math.log(a)) * rhs[1]
+        return TrackedFloat(value, err + math.ulp(value))
+
+    def __neg__(self):
+        return TrackedFloat(-float(self), self.err)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return TrackedFloat(abs(float(self)), self.err)
+
+
+class Float64Context:
+    """
+    float64 arithmetic context with error tracking.
+
+    Implements the subset of the mpmath context interface used by
+    CalculationEngine.compute_*; every real result is a TrackedFloat.
+    """
+
+    dps = 15
+    prec = 53
+
+    # |π - float(π)|
+    _PI_ERROR = 1.2246467991473532e-16
+
+    def mpf(self, value: Any) -> TrackedFloat:
+        """Convert to TrackedFloat; decimal strings carry their conversion error."""
+        if isinstance(value, TrackedFloat):
+            return value
+        if isinstance(value, str):
+            converted = float(value)
+            exact = Fraction(value) == Fraction(converted)
+            return TrackedFloat(converted, 0.0 if exact else _half_ulp(converted))
+        lifted = TrackedFloat._lift(value)
+        if lifted is None:
+            converted = float(value)
+            return TrackedFloat(converted, _half_ulp(converted))
+        return TrackedFloat(*lifted)
+
+    @property
+    def pi(self) -> TrackedFloat:
+        return TrackedFloat(math.pi, self._PI_ERROR)
+
+    def acos(self, x: Any) -> TrackedFloat:
+        x = self.mpf(x)
+        value = math.acos(x)
+        slope = 1 / math.sqrt(1 - float(x) ** 2) if abs(float(x)) < 1 else math.inf
+        return TrackedFloat(value, slope * x.err + math.ulp(value))
+
+    def exp(self, x: Any):
+        if isinstance(x, complex):
+            return cmath.exp(x)
+        x = self.mpf(x)
+        value = math.exp(x)
+        return TrackedFloat(value, value * math.expm1(x.err) + math.ulp(value))
+
+    def log10(self, x: Any) -> TrackedFloat:
+        x = self.mpf(x)
+        value = math.log10(x)
+        margin = float(x) - x.err
+        err = x.err / (margin * math.log(10)) if margin > 0 else math.inf
+        return TrackedFloat(value, err + math.ulp(value))
+
+    def factorial(self, n: Any) -> TrackedFloat:
+        exact = math.factorial(int(n))
+        return self.mpf(exact)
+
+
+class AdaptivePrecisionEngine:
+    """
+    Prediction engine with a float64 fast path and mpmath escalation.
+
+    Each prediction is computed in float64 with a rounding-error bound.
+    If the bound exceeds ``max(rtol·|value|, atol)`` for that key, the key
+    is recomputed by a (lazily created) mpmath CalculationEngine.
+    """
+
+    def __init__(
+        self,
+        rtol: float = 1e-12,
+        atol: float = 0.0,
+        tolerances: Optional[Dict[str, Tuple[float, float]]] = None,
+        precision: int = 50,
+        inputs: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Initialize the adaptive engine.
+
+        Args:
+            rtol: Default relative comparison tolerance
+            atol: Default absolute comparison tolerance
+            tolerances: Per-key ``(rtol, atol)`` overrides
+            precision: Decimal places of the escalation engine
+            inputs: Derivation input overrides (see CalculationEngine)
+        """
+        self.rtol = rtol
+        self.atol = atol
+        self.tolerances = dict(tolerances or {})
+        self.precision = precision
+        self.inputs = inputs
+        self.fast_engine = CalculationEngine(inputs=inputs, ctx=Float64Context())
+        self._precise_engine: Optional[CalculationEngine] = None
+        self._predictions: Dict[str, PredictionResult] = {}
+        self.error_bounds: Dict[str, float] = {}
+        self.escalated: List[str] = []
+
+    @property
+    def precise_engine(self) -> CalculationEngine:
+        """mpmath engine used for escalated keys (created on first use)."""
+        if self._precise_engine is None:
+            self._precise_engine = CalculationEngine(precision=self.precision, inputs=self.inputs)
+        return self._precise_engine
+
+    def threshold(self, key: str, value: float) -> float:
+        """Largest acceptable absolute error for ``key`` at ``value``."""
+        rtol, atol = self.tolerances.get(key, (self.rtol, self.atol))
+        return max(rtol * abs(value), atol)
+
+    def get_prediction(self, key: str) -> PredictionResult:
+        """Return ``key`` from the fast path, escalating if its bound is too wide."""
+        if key in self._predictions:
+            return self._predictions[key]
+
+        fast = self.fast_engine.get_prediction(key)
+        bound = getattr(fast.value, 'err', 0.0)
+        self.error_bounds[key] = bound
+
+        if bound <= self.threshold(key, float(fast.value)):
+            result = fast
+        else:
+            result = self.precise_engine.get_prediction(key)
+            self.escalated.append(key)
+
+        self._predictions[key] = result
+        return result
+
+    def compute_all_predictions(self) -> Dict[str, PredictionResult]:
+        """Compute every prediction, escalating only where needed."""
+        return {key: self.get_prediction(key) for key in CalculationEngine.PREDICTION_GRAPH}
+
+    def reset(self):
+        """Forget all results (both engines are reset)."""
+        self.fast_engine.reset()
+        if self._precise_engine is not None:
+            self._precise_engine.reset()
+        self._predictions.clear()
+        self.error_bounds.clear()
+        self.escalated.clear()
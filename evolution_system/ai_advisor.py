@@ -48,15 +48,17 @@ Date: 2026-01-08
 Updated: 2026-01-10 (Gen AI SDK integration)
 """
 
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 from enum import Enum
+import copy
+import hashlib
+import json
 import mpmath as mp
 import os
 
-# Set precision for calculations
-mp.dps = 50
-
 # Optional Gen AI SDK import
 try:
     from google import genai
@@ -107,6 +109,30 @@ class TopologicalModification:
     testable_predictions: List[str]
     confidence: ConfidenceLevel
     priority_score: float = 0.0
+    # Closed-form factor per observable (template families); empty: derived from the type
+    correction_factors: Dict[str, float] = field(default_factory=dict)
+    
+    @property
+    def identity(self) -> str:
+        """
+        Canonical identity (SHA-256) of the refinement.
+        
+        Built from the fields that define the correction and decide its
+        test outcome: type, formula (which carries the order, e.g. C_2),
+        affected observables, declared symmetries, topological basis and
+        any closed-form correction factors. Names, prose and priority
+        scores are ignored.
+        """
+        structure = [
+            self.refinement_type.value,
+            self.mathematical_formula,
+            list(self.affected_observables),
+            list(self.symmetries_preserved),
+            self.topological_basis,
+        ]
+        if self.correction_factors:
+            structure.append(sorted(self.correction_factors.items()))
+        return hashlib.sha256(json.dumps(structure).encode()).hexdigest()
     
     def to_dict(self) -> Dict:
         """Convert to dictionary for serialization."""
@@ -121,7 +147,8 @@ class TopologicalModification:
             "symmetries_preserved": self.symmetries_preserved,
             "testable_predictions": self.testable_predictions,
             "confidence": self.confidence.value,
-            "priority_score": self.priority_score
+            "priority_score": self.priority_score,
+            "correction_factors": self.correction_factors
         }
 
 
@@ -139,12 +166,15 @@ class RefinementSuggestion:
     implementation_notes: str
     validation_criteria: List[str]
     risk_assessment: str
+    # Every error pattern that suggested this modification (see merge_duplicates)
+    triggering_patterns: List[str] = field(default_factory=list)
     
     def to_dict(self) -> Dict:
         """Convert to dictionary for serialization."""
         return {
             "modification": self.modification.to_dict(),
             "error_pattern": self.error_pattern,
+            "triggering_patterns": self.triggering_patterns,
             "justification": self.justification,
             "implementation_notes": self.implementation_notes,
             "validation_criteria": self.validation_criteria,
@@ -701,6 +731,159 @@ class TopologicalModificationTemplates:
         )
 
 
+# Error pattern -> (template method, arguments) of the modifications addressing it.
+# This encodes physics knowledge about which corrections address which errors.
+_PATTERN_TEMPLATES: Dict[str, Tuple[Tuple[str, Dict], ...]] = {
+    # Gauge coupling errors
+    "gauge_coupling_systematic": (
+        ("chern_class_correction", {"order": 2}),
+        ("euler_characteristic_correction", {}),
+    ),
+    "gauge_coupling_scale_dependent": (
+        ("chern_class_correction", {"order": 3}),
+        ("weyl_anomaly_correction", {}),
+    ),
+    
+    # Mass prediction errors
+    "lepton_mass_pattern": (
+        ("berry_phase_mass_correction", {}),
+        ("hopf_fibration_correction", {}),
+    ),
+    "quark_mass_pattern": (
+        ("berry_phase_mass_correction", {}),
+        ("braid_group_correction", {"strands": 4}),
+    ),
+    
+    # Cosmological errors
+    "vacuum_energy_too_high": (
+        ("instanton_vacuum_correction", {"order": 2}),
+        ("instanton_vacuum_correction", {"order": 3}),
+        ("weyl_anomaly_correction", {}),
+    ),
+    "cosmological_ratios": (
+        ("instanton_vacuum_correction", {"order": 2}),
+        ("euler_characteristic_correction", {}),
+    ),
+    
+    # Fine-structure constant errors
+    "alpha_systematic": (
+        ("hopf_fibration_correction", {}),
+        ("chern_class_correction", {"order": 2}),
+    ),
+    
+    # Strong sector errors
+    "qcd_errors": (
+        ("braid_group_correction", {"strands": 4}),
+        ("chern_class_correction", {"order": 2}),
+    ),
+}
+
+# Templates not tied to a pattern, registered for searches over the whole registry
+_INDEXED_TEMPLATES: Tuple[Tuple[str, Dict], ...] = (
+    ("holonomy_correction", {}),
+    ("volume_ratio_correction", {}),
+    ("winding_number_correction", {}),
+)
+
+_GAUGE_OBSERVABLES = ("alpha_1", "alpha_2", "sin2_theta_W")
+_COSMOLOGY_OBSERVABLES = ("Lambda", "Omega_Lambda", "Omega_DM", "Omega_b", "vacuum_energy")
+
+# (pattern type, observable) -> error patterns it indicates; a pattern type
+# of None matches an observable in any pattern or among the poor predictions
+_OBSERVABLE_PATTERNS: Dict[Tuple[Optional[str], str], Tuple[str, ...]] = {
+    # Gauge couplings and the strong sector
+    **{(None, key): ("gauge_coupling_systematic",) for key in _GAUGE_OBSERVABLES},
+    (None, "alpha_s"): ("gauge_coupling_systematic", "qcd_errors"),
+    (None, "alpha_3"): ("gauge_coupling_systematic", "qcd_errors"),
+    (None, "QCD_string_tension"): ("qcd_errors",),
+    ("sector_specific", "M_GUT"): ("gauge_coupling_systematic",),
+    
+    # Fine-structure constant
+    (None, "alpha_inv"): ("alpha_systematic",),
+    
+    # Fermion masses
+    **{(None, key): ("lepton_mass_pattern",) for key in ("m_electron", "m_muon", "m_tau")},
+    **{
+        (None, key): ("quark_mass_pattern",)
+        for key in ("m_up", "m_down", "m_strange", "m_charm", "m_bottom", "m_top")
+    },
+    
+    # Cosmology: errors across the sector vs an overall offset
+    **{("sector_specific", key): ("cosmological_ratios",) for key in _COSMOLOGY_OBSERVABLES},
+    **{("systematic_offset", key): ("vacuum_energy_too_high",) for key in _COSMOLOGY_OBSERVABLES},
+}
+
+
+@dataclass(frozen=True, eq=False)
+class TemplateRegistry:
+    """
+    Immutable registry of modification templates.
+    
+    Every distinct template (by ``TopologicalModification.identity``) is
+    built once and shared wherever it is listed (flyweight). The shared
+    objects must not be modified; suggestions carry their own copies.
+    
+    Attributes:
+        templates: Identity -> template, in registration order
+        patterns: Error pattern key -> templates addressing it
+        by_observable: (pattern type or None, observable key) -> error
+            pattern keys it indicates (inverted index)
+    """
+    templates: Mapping[str, TopologicalModification]
+    patterns: Mapping[str, Tuple[TopologicalModification, ...]]
+    by_observable: Mapping[Tuple[Optional[str], str], Tuple[str, ...]]
+    
+    @classmethod
+    def build(cls, templates: Optional[TopologicalModificationTemplates] = None) -> 'TemplateRegistry':
+        """
+        Build the registry from template factories.
+        
+        Args:
+            templates: Template factories (default: TopologicalModificationTemplates)
+        """
+        templates = templates or TopologicalModificationTemplates()
+        registered: Dict[str, TopologicalModification] = {}
+        
+        def template(method: str, arguments: Dict) -> TopologicalModification:
+            modification = getattr(templates, method)(**arguments)
+            return registered.setdefault(modification.identity, modification)
+        
+        patterns = {
+            pattern: tuple(template(method, arguments) for method, arguments in spec)
+            for pattern, spec in _PATTERN_TEMPLATES.items()
+        }
+        for method, arguments in _INDEXED_TEMPLATES:
+            template(method, arguments)
+        
+        return cls(
+            templates=MappingProxyType(registered),
+            patterns=MappingProxyType(patterns),
+            by_observable=MappingProxyType(dict(_OBSERVABLE_PATTERNS)),
+        )
+    
+    def patterns_for(self, observable: str, pattern_type: Optional[str] = None) -> Tuple[str, ...]:
+        """
+        Error patterns indicated by an observable.
+        
+        Args:
+            observable: Observable key (unknown keys indicate nothing)
+            pattern_type: Type of the error pattern naming the observable
+            
+        Returns:
+            Pattern keys for any pattern type, then those for ``pattern_type``
+        """
+        found = self.by_observable.get((None, observable), ())
+        if pattern_type is not None:
+            found += self.by_observable.get((pattern_type, observable), ())
+        return found
+
+
+@lru_cache(maxsize=1)
+def template_registry() -> TemplateRegistry:
+    """TemplateRegistry of the default templates (built once per process)."""
+    return TemplateRegistry.build()
+
+
 class AIAdvisor:
     """
     AI Advisor for generating topologically-motivated refinement suggestions.
@@ -714,9 +897,10 @@ class AIAdvisor:
     """
     
     def __init__(self):
-        """Initialize the AI Advisor with modification templates."""
+        """Initialize the AI Advisor with the shared template registry."""
         self.templates = TopologicalModificationTemplates()
-        self._error_pattern_map = self._build_error_pattern_map()
+        self.registry = template_registry()
+        self._error_pattern_map = self.registry.patterns
         self._genai_client = None
         
         # Initialize Gen AI client if available and API key is set
@@ -730,160 +914,101 @@ class AIAdvisor:
                 print(f"Warning: Could not initialize Gen AI client: {e}")
                 self._genai_client = None
     
-    def _build_error_pattern_map(self) -> Dict[str, List[TopologicalModification]]:
+    def analyze_error_pattern(self, analysis_result: Dict) -> List[str]:
         """
-        Build mapping from error patterns to relevant modifications.
+        Identify error patterns from the error analysis result.
         
-        This encodes physics knowledge about which corrections
-        address which types of errors.
-        """
-        return {
-            # Gauge coupling errors
-            "gauge_coupling_systematic": [
-                self.templates.chern_class_correction(order=2),
-                self.templates.euler_characteristic_correction(),
-            ],
-            "gauge_coupling_scale_dependent": [
-                self.templates.chern_class_correction(order=3),
-                self.templates.weyl_anomaly_correction(),
-            ],
-            
-            # Mass prediction errors  
-            "lepton_mass_pattern": [
-                self.templates.berry_phase_mass_correction(),
-                self.templates.hopf_fibration_correction(),
-            ],
-            "quark_mass_pattern": [
-                self.templates.berry_phase_mass_correction(),
-                self.templates.braid_group_correction(strands=4),
-            ],
-            
-            # Cosmological errors
-            "vacuum_energy_too_high": [
-                self.templates.instanton_vacuum_correction(order=2),
-                self.templates.instanton_vacuum_correction(order=3),
-                self.templates.weyl_anomaly_correction(),
-            ],
-            "cosmological_ratios": [
-                self.templates.instanton_vacuum_correction(order=2),
-                self.templates.euler_characteristic_correction(),
-            ],
-            
-            # Fine-structure constant errors
-            "alpha_systematic": [
-                self.templates.hopf_fibration_correction(),
-                self.templates.chern_class_correction(order=2),
-            ],
+        One lookup in the registry's observable index per affected or
+        poorly predicted observable.
+        
+        Args:
+            analysis_result: Output from ErrorAnalyzer.analyze().to_dict()
             
-            # Strong sector errors
-            "qcd_errors": [
-                self.templates.braid_group_correction(strands=4),
-                self.templates.chern_class_correction(order=2),
-            ],
-        }
+        Returns:
+            List of identified error pattern keys, in order of first appearance
+        """
+        patterns: Dict[str, None] = {}
+        for pattern in analysis_result.get("patterns", []):
+            pattern_type = pattern.get("pattern_type")
+            for observable in pattern.get("affected_predictions", []):
+                patterns.update(dict.fromkeys(self.registry.patterns_for(observable, pattern_type)))
+        for observable in analysis_result.get("summary", {}).get("poor_predictions", []):
+            patterns.update(dict.fromkeys(self.registry.patterns_for(observable)))
+        return list(patterns)
     
-    def analyze_error_pattern(self, analysis_result: Dict) -> List[str]:
+    def candidate_templates(self, analysis_result: Dict) -> List[Tuple[TopologicalModification, List[str]]]:
         """
-        Identify error patterns from the error analysis result.
+        Templates addressing the error patterns of an analysis.
+        
+        A template listed under several patterns appears once, with all
+        of them.
         
         Args:
             analysis_result: Output from ErrorAnalyzer.analyze().to_dict()
             
         Returns:
-            List of identified error pattern keys
+            (shared registry template, triggering patterns) pairs, in order
+            of first appearance (copy templates before modifying)
         """
-        patterns = []
-        
-        # Check for systematic offset patterns
-        if "patterns" in analysis_result:
-            for pattern in analysis_result.get("patterns", []):
-                pattern_type = pattern.get("pattern_type", "")
-                affected = pattern.get("affected_predictions", [])
-                description = pattern.get("description", "")
-                
-                # Classify based on pattern_type (can be "sector_specific", "systematic_offset", etc.)
-                # Also check description and affected predictions
-                
-                # Gauge sector patterns
-                if any(term in description.lower() for term in ["gauge", "coupling"]):
-                    if pattern_type == "systematic_offset":
-                        patterns.append("gauge_coupling_systematic")
-                    else:
-                        # Default for gauge sector issues
-                        patterns.append("gauge_coupling_systematic")
-                
-                # Check affected predictions directly
-                gauge_obs = ["alpha_s", "alpha_1", "alpha_2", "alpha_3", "sin2_theta_W"]
-                if any(obs in affected for obs in gauge_obs):
-                    if "gauge_coupling_systematic" not in patterns:
-                        patterns.append("gauge_coupling_systematic")
-                
-                # Mass patterns
-                if any("mass" in obs.lower() for obs in affected):
-                    if any("lepton" in obs.lower() or obs in ["m_electron", "m_muon", "m_tau"] 
-                           for obs in affected):
-                        patterns.append("lepton_mass_pattern")
-                    if any("quark" in obs.lower() for obs in affected):
-                        patterns.append("quark_mass_pattern")
-                
-                # Cosmological patterns
-                cosmo_obs = ["Lambda", "Omega_Lambda", "Omega_DM", "Omega_b", "vacuum_energy"]
-                if any(obs in affected for obs in cosmo_obs):
-                    if "cosmology" in description.lower():
-                        patterns.append("cosmological_ratios")
-                    if pattern_type == "systematic_offset":
-                        patterns.append("vacuum_energy_too_high")
-                
-                # Fine-structure constant
-                if "alpha_inv" in affected or "alpha_inv" in description.lower():
-                    patterns.append("alpha_systematic")
-                
-                # Strong sector (QCD)
-                if any(obs in ["alpha_s", "alpha_3", "QCD_string_tension"] for obs in affected):
-                    patterns.append("qcd_errors")
-        
-        # Check individual poor results (in case patterns missed something)
-        if "poor_predictions" in analysis_result.get("summary", {}):
-            for pred_name in analysis_result["summary"].get("poor_predictions", []):
-                if "alpha" in pred_name.lower() and "alpha_systematic" not in patterns:
-                    patterns.append("alpha_systematic")
-                if "mass" in pred_name.lower():
-                    if "lepton" in pred_name.lower() and "lepton_mass_pattern" not in patterns:
-                        patterns.append("lepton_mass_pattern")
-                    elif "quark" in pred_name.lower() and "quark_mass_pattern" not in patterns:
-                        patterns.append("quark_mass_pattern")
-        
-        return list(set(patterns))  # Remove duplicates
+        # Modification identity -> (modification, triggering patterns)
+        found: Dict[str, Tuple[TopologicalModification, List[str]]] = {}
+        for pattern in self.analyze_error_pattern(analysis_result):
+            for mod in self._error_pattern_map.get(pattern, ()):
+                _, triggering = found.setdefault(mod.identity, (mod, []))
+                if pattern not in triggering:
+                    triggering.append(pattern)
+        return list(found.values())
     
     def generate_suggestions(self, analysis_result: Dict) -> List[RefinementSuggestion]:
         """
         Generate refinement suggestions based on error analysis.
         
+        The same modification listed under several patterns yields a
+        single suggestion whose ``triggering_patterns`` lists them all.
+        
         Args:
             analysis_result: Output from ErrorAnalyzer.analyze()
             
         Returns:
-            List of RefinementSuggestion objects
+            List of RefinementSuggestion objects (one per distinct modification)
         """
-        suggestions = []
-        patterns = self.analyze_error_pattern(analysis_result)
+        return [
+            self._create_suggestion(mod, triggering, analysis_result)
+            for mod, triggering in self.candidate_templates(analysis_result)
+        ]
+    
+    def merge_duplicates(self, suggestions: List[RefinementSuggestion]) -> List[RefinementSuggestion]:
+        """
+        Merge suggestions of the same modification (``TopologicalModification.identity``).
         
-        for pattern in patterns:
-            if pattern in self._error_pattern_map:
-                modifications = self._error_pattern_map[pattern]
-                for mod in modifications:
-                    suggestion = self._create_suggestion(mod, pattern, analysis_result)
-                    suggestions.append(suggestion)
+        The first suggestion of each modification is kept, in order, with
+        the union of the triggering patterns of all its duplicates. The
+        input suggestions are not modified.
         
-        return suggestions
+        Args:
+            suggestions: List of RefinementSuggestion objects
+            
+        Returns:
+            List with one suggestion per distinct modification
+        """
+        # Modification identity -> (first suggestion, union of patterns)
+        merged: Dict[str, Tuple[RefinementSuggestion, List[str]]] = {}
+        for suggestion in suggestions:
+            patterns = suggestion.triggering_patterns or [suggestion.error_pattern]
+            _, triggering = merged.setdefault(suggestion.modification.identity, (suggestion, []))
+            triggering.extend(p for p in patterns if p not in triggering)
+        return [
+            replace(kept, triggering_patterns=triggering)
+            for kept, triggering in merged.values()
+        ]
     
     def _create_suggestion(self, modification: TopologicalModification, 
-                          pattern: str, analysis: Dict) -> RefinementSuggestion:
-        """Create a complete refinement suggestion."""
+                          patterns: List[str], analysis: Dict) -> RefinementSuggestion:
+        """Create a complete refinement suggestion for the patterns it addresses."""
         
         # Build justification from error pattern
         justification = f"""
-        Error Pattern: {pattern}
+        Error Pattern: {', '.join(patterns)}
         
         This refinement addresses the identified error pattern through
         a topologically-motivated correction. The mathematical basis
@@ -931,12 +1056,15 @@ class AIAdvisor:
         """
         
         return RefinementSuggestion(
-            modification=modification,
-            error_pattern=pattern,
+            # Deep copy: registry templates are shared, and ranking sets
+            # priority_score while callers may edit the lists and factors
+            modification=copy.deepcopy(modification),
+            error_pattern=patterns[0],
             justification=justification,
             implementation_notes=impl_notes,
             validation_criteria=validation,
-            risk_assessment=risk
+            risk_assessment=risk,
+            triggering_patterns=list(patterns)
         )
     
     def rank_suggestions(self, suggestions: List[RefinementSuggestion]) -> List[RefinementSuggestion]:
@@ -1030,7 +1158,7 @@ class AIAdvisor:
         Returns:
             Top N RefinementSuggestion objects, ranked by priority
         """
-        suggestions = self.generate_suggestions(analysis_result)
+        suggestions = self.merge_duplicates(self.generate_suggestions(analysis_result))
         suggestions = self.filter_topological_only(suggestions)
         suggestions = self.rank_suggestions(suggestions)
         return suggestions[:n]
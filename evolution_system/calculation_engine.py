@@ -25,6 +25,9 @@ engine = CalculationEngine()
 alpha = engine.compute_fine_structure_constant()
 print(f"α⁻¹ = {alpha.value} (theory)")
 
+# Lazily compute one prediction and only the inputs it depends on
+sin2 = engine.get_prediction('sin2_theta_W')   # computes α₁, α₂ but not α⁻¹
+
 # Compute all predictions
 all_predictions = engine.compute_all_predictions()
 for name, pred in all_predictions.items():
@@ -42,13 +45,20 @@ References:
 - verification/precision/constants.py: High-precision implementations
 """
 
+import hashlib
 import mpmath as mp
-from dataclasses import dataclass, field
-from typing import Dict, Optional, List, Any
+from dataclasses import dataclass, field, fields
+from mpmath.libmp import MPZ
+from typing import Dict, Optional, List, Any, Tuple
 from enum import Enum
 
-# Set high precision for all calculations
-mp.dps = 50
+from .interval_arithmetic import IntervalContext, is_interval, split_interval
+from .prediction_cache import PredictionCache, fingerprint_value, source_fingerprint
+
+
+def _is_mpf(value: Any) -> bool:
+    """True for real mpmath numbers of any context (not only the global one)."""
+    return hasattr(value, '_mpf_')
 
 
 class PredictionCategory(Enum):
@@ -90,11 +100,19 @@ class PredictionResult:
     requires_refinement: bool = False   # True if known approximations exist
     refinement_notes: Optional[str] = None
     
+    # Rigorous (lower, upper) bounds on value, set in interval mode
+    enclosure: Optional[Tuple[mp.mpf, mp.mpf]] = None
+    
     def __post_init__(self):
-        """Ensure value is mpmath type."""
-        if not isinstance(self.value, mp.mpf):
+        """Ensure value is mpmath type (of any mpmath context)."""
+        if is_interval(self.value):
+            lower, self.value, upper = split_interval(self.value)
+            self.enclosure = (lower, upper)
+        if is_interval(self.theoretical_uncertainty):
+            self.theoretical_uncertainty = split_interval(self.theoretical_uncertainty)[1]
+        if not _is_mpf(self.value):
             self.value = mp.mpf(str(self.value))
-        if self.theoretical_uncertainty is not None and not isinstance(self.theoretical_uncertainty, mp.mpf):
+        if self.theoretical_uncertainty is not None and not _is_mpf(self.theoretical_uncertainty):
             self.theoretical_uncertainty = mp.mpf(str(self.theoretical_uncertainty))
     
     def to_dict(self) -> Dict:
@@ -108,7 +126,7 @@ class PredictionResult:
             'theory_reference': self.theory_reference,
             'notebook_reference': self.notebook_reference,
             'components': {
-                k: float(v) if isinstance(v, (mp.mpf, float, int)) else v
+                k: float(v) if _is_mpf(v) or isinstance(v, (float, int)) else v
                 for k, v in self.components.items()
             },
             'theoretical_uncertainty': float(self.theoretical_uncertainty) if self.theoretical_uncertainty else None,
@@ -116,7 +134,66 @@ class PredictionResult:
             'is_exact': self.is_exact,
             'requires_refinement': self.requires_refinement,
             'refinement_notes': self.refinement_notes,
+            'enclosure': [float(b) for b in self.enclosure] if self.enclosure else None,
         }
+    
+    # Exact (sign, mantissa, exponent, bitcount) mpf encoding for records
+    _MPF_FIELDS = ('value', 'theoretical_uncertainty')
+    
+    def to_record(self) -> Dict:
+        """
+        Convert to a JSON-compatible record that preserves every mpf bit.
+        
+        Used by PredictionCache; ``from_record`` restores an equal result.
+        """
+        def encode(x):
+            sign, man, exp, bc = x._mpf_
+            return [sign, hex(int(man)), exp, bc]
+        
+        record = {f.name: getattr(self, f.name) for f in fields(self)}
+        record['category'] = self.category.value
+        for name in self._MPF_FIELDS:
+            if record[name] is not None:
+                record[name] = encode(record[name])
+        if self.enclosure is not None:
+            record['enclosure'] = [encode(b) for b in self.enclosure]
+        return record
+    
+    @classmethod
+    def from_record(cls, record: Dict, make_mpf=mp.mp.make_mpf) -> 'PredictionResult':
+        """
+        Rebuild a PredictionResult from ``to_record`` output.
+        
+        Args:
+            record: Record produced by to_record
+            make_mpf: Constructor for raw mpf tuples (selects the mpmath context)
+        """
+        def decode(x):
+            sign, man, exp, bc = x
+            return make_mpf((sign, MPZ(int(man, 16)), exp, bc))
+        
+        data = dict(record)
+        data['category'] = PredictionCategory(data['category'])
+        for name in cls._MPF_FIELDS:
+            if data[name] is not None:
+                data[name] = decode(data[name])
+        if data['enclosure'] is not None:
+            data['enclosure'] = tuple(mp.mp.make_mpf(decode(b)._mpf_) for b in data['enclosure'])
+        return cls(**data)
+
+
+@dataclass(frozen=True)
+class PredictionNode:
+    """
+    A node in the prediction dependency graph.
+    
+    Each prediction key is produced by one ``compute_*`` method of the
+    CalculationEngine and may consume other predictions as inputs
+    (e.g. sin²θ_W is built from the gauge couplings α₁ and α₂).
+    """
+    key: str
+    method: str                          # Name of the CalculationEngine method producing the key
+    inputs: Tuple[str, ...] = ()         # Prediction keys this node depends on
 
 
 class CalculationEngine:
@@ -128,21 +205,111 @@ class CalculationEngine:
     
     **Directive A Compliance:** This engine NEVER uses experimental values
     as inputs. All constants are derived from first principles.
+    
+    **Lazy Evaluation:** Every prediction is registered in PREDICTION_GRAPH
+    together with the predictions it depends on. ``get_prediction(key)``
+    computes only the transitive inputs of ``key`` and memoizes them, so
+    asking for one observable never runs the whole tiered pipeline.
+    
+    **Precision:** Each engine owns an mpmath context (``self.ctx``) set to
+    its ``precision``; the global ``mpmath.mp`` settings are never changed.
     """
     
-    def __init__(self, precision: int = 50):
+    # Dependency graph of all predictions, in pipeline (tier) order.
+    # Methods producing several keys (gauge couplings, cosmological ratios)
+    # appear once per key; memoization ensures they run only once.
+    PREDICTION_GRAPH: Dict[str, PredictionNode] = {
+        node.key: node for node in (
+            # Tier 1: Core parameters
+            PredictionNode('alpha_inv', 'compute_fine_structure_constant'),
+            PredictionNode('eta', 'compute_metric_mismatch'),
+            PredictionNode('koide_Q', 'compute_koide_formula'),
+            # Tier 2: Gauge sector
+            PredictionNode('alpha_s', 'compute_gauge_couplings'),
+            PredictionNode('alpha_2', 'compute_gauge_couplings'),
+            PredictionNode('alpha_1', 'compute_gauge_couplings'),
+            PredictionNode('sin2_theta_W', 'compute_weak_mixing_angle', ('alpha_1', 'alpha_2')),
+            PredictionNode('M_GUT', 'compute_gut_scale'),
+            # Tier 3: Cosmological
+            PredictionNode('Lambda_suppression', 'compute_cosmological_constant_suppression'),
+            PredictionNode('Omega_Lambda', 'compute_cosmological_ratios'),
+            PredictionNode('Omega_DM', 'compute_cosmological_ratios'),
+            # Sibling outputs of the same method, not inputs: Ωb = 1 - ΩΛ - ΩDM
+            PredictionNode('Omega_b', 'compute_cosmological_ratios'),
+        )
+    }
+    
+    # Scalar inputs of the derivations that may be overridden per engine
+    # (see _init_derivation_inputs). ParameterSweep varies the same names.
+    DERIVATION_INPUTS: Tuple[str, ...] = (
+        'correction_factor',
+        'delta_qed',
+        'delta_weyl',
+        'delta_higher',
+        'alpha_GUT_inv',
+        'log_ratio_topological',
+        'b1',
+        'b2',
+        'b3',
+        'n_strands',
+    )
+    
+    def __init__(
+        self,
+        precision: int = 50,
+        inputs: Optional[Dict[str, Any]] = None,
+        ctx: Optional[Any] = None,
+        interval: bool = False,
+        cache: Optional[PredictionCache] = None,
+    ):
         """
         Initialize the calculation engine.
         
         Args:
-            precision: Number of decimal places for mpmath calculations
+            precision: Number of decimal places of this engine's mpmath context
+            inputs: Optional overrides for entries of DERIVATION_INPUTS
+            ctx: Optional arithmetic context replacing the mpmath context
+                (e.g. adaptive_precision.Float64Context); it must provide
+                the mpmath functions used by compute_* (mpf, pi, acos, exp,
+                factorial, log10). ``precision`` is ignored when given.
+            interval: Evaluate in interval arithmetic at ``precision``; every
+                PredictionResult then carries a rigorous ``enclosure``
+            cache: Persistent PredictionCache (default: ``$IRH_PREDICTION_CACHE``
+                if set). Not used with a custom ``ctx``.
         """
-        mp.dps = precision
+        # Results of custom contexts (float64, dual numbers) are not cached
+        if cache is None and ctx is None:
+            cache = PredictionCache.from_environment()
+        self.cache = cache if ctx is None else None
+        self._cache_key: Optional[str] = None
+        self._cache_loaded = False
+        self._interval = interval
+        
+        # Private mpmath context: engines of different precision can run
+        # side by side without touching the global mpmath precision.
+        if ctx is None and interval:
+            ctx = IntervalContext(dps=precision)
+        elif ctx is None:
+            ctx = mp.MPContext()
+            ctx.dps = precision
+        self.ctx = ctx
         self._predictions: Dict[str, PredictionResult] = {}
         self._precision = precision
         
         # Fundamental geometric constants (purely topological)
         self._init_topological_constants()
+        self._init_derivation_inputs()
+        
+        for name, value in (inputs or {}).items():
+            if name not in self.DERIVATION_INPUTS:
+                raise ValueError(
+                    f"Unknown derivation input '{name}'. "
+                    f"Available: {', '.join(self.DERIVATION_INPUTS)}"
+                )
+            if name == 'n_strands':
+                setattr(self, name, int(value))
+            else:
+                setattr(self, name, self.ctx.mpf(value))
     
     def _init_topological_constants(self):
         """
@@ -154,9 +321,10 @@ class CalculationEngine:
         - Braid group invariants
         - Hopf fibration parameters
         """
+        ctx = self.ctx
         # Sphere volumes: Vol(S^n) = 2π^((n+1)/2) / Γ((n+1)/2)
-        self.vol_S3 = 2 * mp.pi**2           # Vol(S³) = 2π²
-        self.vol_S7 = mp.mpf(mp.pi**4) / 3   # Vol(S⁷) = π⁴/3
+        self.vol_S3 = 2 * ctx.pi**2           # Vol(S³) = 2π²
+        self.vol_S7 = ctx.mpf(ctx.pi**4) / 3   # Vol(S⁷) = π⁴/3
         
         # Hopf fibration volume ratio
         self.hopf_ratio = self.vol_S7 / self.vol_S3  # π²/6
@@ -171,22 +339,50 @@ class CalculationEngine:
         
         # Tetrahedral geometry
         # Solid angle of regular tetrahedron: Ω = 4·arccos(1/3)
-        self.omega_tetrahedron = 4 * mp.acos(mp.mpf(1)/3)
+        self.omega_tetrahedron = 4 * ctx.acos(ctx.mpf(1)/3)
         
         # Reference solid angle for S³: 4π² for normalization with Hopf fibration
-        self.omega_S3_ref = 4 * mp.pi**2
+        self.omega_S3_ref = 4 * ctx.pi**2
         
         # Metric mismatch: η = 4/π from Euclidean/spherical embedding
-        self.eta = mp.mpf(4) / mp.pi
+        self.eta = ctx.mpf(4) / ctx.pi
         
         # Weyl anomaly coefficient for N=4 strands: a = 5/(16π²)
-        self.a_weyl = mp.mpf(5) / (16 * mp.pi**2)
+        self.a_weyl = ctx.mpf(5) / (16 * ctx.pi**2)
         
         # Koide formula theoretical value: Q = 2/3
-        self.koide_Q = mp.mpf(2) / mp.mpf(3)
+        self.koide_Q = ctx.mpf(2) / ctx.mpf(3)
         
         # Cube roots of unity (for circulant matrix eigenvalues)
-        self.omega_3 = mp.exp(2j * mp.pi / 3)
+        self.omega_3 = ctx.exp(2j * ctx.pi / 3)
+    
+    def _init_derivation_inputs(self):
+        """
+        Initialize the scalar inputs entering the derivations.
+        
+        These are kept as attributes rather than literals inside the
+        compute_* methods so they can be overridden per engine and swept
+        over grids by ParameterSweep. The defaults reproduce IRH v26.0.
+        """
+        ctx = self.ctx
+        # Casimir-Weyl correction to the geometric α⁻¹ base
+        self.correction_factor = ctx.mpf(24) / ctx.mpf(13)
+        
+        # Radiative corrections to α⁻¹
+        self.delta_qed = ctx.mpf('30.0')       # From RG running with N_f=3 leptons
+        self.delta_weyl = ctx.mpf('6.0')       # From Weyl anomaly with a_weyl = 5/(16π²)
+        self.delta_higher = ctx.mpf('0.6')     # Higher-order QFT corrections
+        
+        # GUT coupling: α_GUT⁻¹ = 24 (24-cell vertices)
+        self.alpha_GUT_inv = ctx.mpf(24)
+        
+        # ln(M_GUT/M_ref) = 6π ≈ 18.85 from 24-cell geometry
+        self.log_ratio_topological = 6 * ctx.pi
+        
+        # SM 1-loop beta coefficients
+        self.b1 = ctx.mpf('41') / 10
+        self.b2 = ctx.mpf('-19') / 6
+        self.b3 = ctx.mpf('-7')
     
     # =========================================================================
     # TIER 1: Core Parameter Predictions
@@ -212,13 +408,14 @@ class CalculationEngine:
         Returns:
             PredictionResult with α⁻¹ value and full metadata
         """
+        ctx = self.ctx
         # Step 1: Geometric base from topology
         # β_geometric = Ω_S³_ref / Ω_tetrahedron
         beta_geometric = self.omega_S3_ref / self.omega_tetrahedron
         
         # 12-fold symmetry from 24-cell (12 edge-symmetric loops)
         n_loops = 12
-        phase_per_loop = 2 * mp.pi / 12  # π/6 per loop
+        phase_per_loop = 2 * ctx.pi / 12  # π/6 per loop
         
         # Total phase accumulation
         Phi_12 = n_loops * phase_per_loop * beta_geometric
@@ -226,12 +423,12 @@ class CalculationEngine:
         # Casimir-Weyl correction factor: 24/13
         # NOTE: This ratio should be derived from Casimir operators of SO(4)
         # Current: phenomenologically validated
-        correction_factor = mp.mpf(24) / mp.mpf(13)
+        correction_factor = self.correction_factor
         
         alpha_inv_corrected = Phi_12 * correction_factor
         
         # Volume normalization: (1 + 1/(4π))
-        volume_correction = 1 + 1 / (4 * mp.pi)
+        volume_correction = 1 + 1 / (4 * ctx.pi)
         
         alpha_inv_geometric = alpha_inv_corrected * volume_correction
         
@@ -256,9 +453,9 @@ class CalculationEngine:
         #
         # NOTE: The specific numerical values require proper derivation from first
         # principles. Currently flagged as requiring refinement per Directive A.
-        delta_qed = mp.mpf('30.0')       # From RG running with N_f=3 leptons
-        delta_weyl = mp.mpf('6.0')       # From Weyl anomaly with a_weyl = 5/(16π²)
-        delta_higher = mp.mpf('0.6')     # Higher-order QFT corrections
+        delta_qed = self.delta_qed          # From RG running with N_f=3 leptons
+        delta_weyl = self.delta_weyl        # From Weyl anomaly with a_weyl = 5/(16π²)
+        delta_higher = self.delta_higher    # Higher-order QFT corrections
         
         delta_radiative_total = delta_qed + delta_weyl + delta_higher
         
@@ -291,7 +488,7 @@ class CalculationEngine:
                 'geometric_contribution_percent': float(alpha_inv_geometric / alpha_inv_total * 100),
                 'radiative_contribution_percent': float(delta_radiative_total / alpha_inv_total * 100),
             },
-            theoretical_uncertainty=mp.mpf('0.1'),  # ~0.1 from Casimir-Weyl approximation
+            theoretical_uncertainty=ctx.mpf('0.1'),  # ~0.1 from Casimir-Weyl approximation
             uncertainty_source="Casimir-Weyl factor 24/13 derivation incomplete",
             is_exact=False,
             requires_refinement=True,
@@ -319,7 +516,7 @@ class CalculationEngine:
         Returns:
             PredictionResult with η value
         """
-        eta = mp.mpf(4) / mp.pi
+        eta = self.eta  # 4/π (see _init_topological_constants)
         
         result = PredictionResult(
             name="Metric mismatch parameter",
@@ -358,7 +555,7 @@ class CalculationEngine:
         Returns:
             PredictionResult with Q = 2/3
         """
-        Q = mp.mpf(2) / mp.mpf(3)
+        Q = self.koide_Q  # 2/3 (see _init_topological_constants)
         
         result = PredictionResult(
             name="Koide ratio",
@@ -412,11 +609,12 @@ class CalculationEngine:
         Returns:
             Dictionary of gauge coupling predictions
         """
+        ctx = self.ctx
         results = {}
         
         # GUT scale coupling from 24-cell geometry (topological)
         # α_GUT⁻¹ = 24 from the number of vertices in the 24-cell polytope
-        alpha_GUT_inv = mp.mpf(24)  # Topological: 24-cell vertices
+        alpha_GUT_inv = self.alpha_GUT_inv  # Topological: 24-cell vertices
         
         # Reference scale ratio (topologically derived, not experimental)
         # The logarithmic ratio ln(M_GUT/M_ref) determines how couplings evolve.
@@ -431,16 +629,16 @@ class CalculationEngine:
         # With b3 = -7, we need: 24 + (-7/2π) × log_ratio > 0
         # => log_ratio < 24 × 2π / 7 ≈ 21.6
         # We use log_ratio = 6π ≈ 18.8 (from 24-cell edge/face ratio) to stay safe.
-        log_ratio_topological = 6 * mp.pi  # ≈ 18.85, from 24-cell geometry
+        log_ratio_topological = self.log_ratio_topological  # ≈ 18.85, from 24-cell geometry
         
         # RG running coefficients (1-loop beta functions)
         # These are dictated by the Standard Model gauge group structure,
         # which emerges from the braid group representations.
         # b₁ = 41/10, b₂ = -19/6, b₃ = -7
-        b1 = mp.mpf('41') / 10
-        b2 = mp.mpf('-19') / 6
-        b3 = mp.mpf('-7')
-        two_pi = 2 * mp.pi
+        b1 = self.b1
+        b2 = self.b2
+        b3 = self.b3
+        two_pi = 2 * ctx.pi
         
         # α_i(M_ref)⁻¹ = α_i(M_GUT)⁻¹ + (b_i / 2π) × ln(M_GUT / M_ref)
         alpha_1_inv_ref = alpha_GUT_inv + (b1 / two_pi) * log_ratio_topological
@@ -467,7 +665,7 @@ class CalculationEngine:
                 'log_ratio_topological': float(log_ratio_topological),
                 'alpha_3_inv_ref': float(alpha_3_inv_ref),
             },
-            theoretical_uncertainty=mp.mpf('0.01'),
+            theoretical_uncertainty=ctx.mpf('0.01'),
             uncertainty_source="Topological scale ratio approximation, threshold corrections",
             requires_refinement=True,
             refinement_notes="Reference scale should emerge from topological EW breaking"
@@ -487,7 +685,7 @@ class CalculationEngine:
                 'b2': float(b2),
                 'alpha_2_inv_ref': float(alpha_2_inv_ref),
             },
-            theoretical_uncertainty=mp.mpf('0.002'),
+            theoretical_uncertainty=ctx.mpf('0.002'),
             uncertainty_source="Topological scale ratio approximation",
         )
         
@@ -505,7 +703,7 @@ class CalculationEngine:
                 'b1': float(b1),
                 'alpha_1_inv_ref': float(alpha_1_inv_ref),
             },
-            theoretical_uncertainty=mp.mpf('0.001'),
+            theoretical_uncertainty=ctx.mpf('0.001'),
             uncertainty_source="Topological scale ratio approximation",
         )
         
@@ -526,16 +724,14 @@ class CalculationEngine:
         Returns:
             PredictionResult with sin²θ_W value
         """
-        # Get gauge couplings (compute if not already done)
-        if 'alpha_1' not in self._predictions:
-            self.compute_gauge_couplings()
-        
-        alpha_1 = self._predictions['alpha_1'].value
-        alpha_2 = self._predictions['alpha_2'].value
+        ctx = self.ctx
+        # Get gauge couplings (computed on demand and memoized)
+        alpha_1 = self._input_value('alpha_1')
+        alpha_2 = self._input_value('alpha_2')
         
         # sin²θ_W at tree level with GUT normalization
         # sin²θ_W = (3/5) × g₁² / (g₁² + g₂²) = (3/5) × α₁ / (α₁ + α₂)
-        gut_factor = mp.mpf(3) / mp.mpf(5)
+        gut_factor = ctx.mpf(3) / ctx.mpf(5)
         sin2_theta_W = gut_factor * alpha_1 / (alpha_1 + alpha_2)
         
         result = PredictionResult(
@@ -551,7 +747,7 @@ class CalculationEngine:
                 'alpha_2': float(alpha_2),
                 'gut_factor': float(gut_factor),
             },
-            theoretical_uncertainty=mp.mpf('0.002'),
+            theoretical_uncertainty=ctx.mpf('0.002'),
             uncertainty_source="From gauge coupling uncertainties",
         )
         
@@ -574,6 +770,7 @@ class CalculationEngine:
         Returns:
             PredictionResult with M_X in GeV
         """
+        ctx = self.ctx
         # From 24-cell geometry: α_GUT⁻¹ = 24
         # The GUT scale is where all three couplings meet
         
@@ -582,13 +779,13 @@ class CalculationEngine:
         # The meeting point is geometrically determined by requiring
         # that the topological scale ratio gives unification.
         
-        alpha_GUT_inv = mp.mpf(24)
+        alpha_GUT_inv = self.alpha_GUT_inv
         
         # Geometric estimate: M_GUT ≈ 2×10¹⁶ GeV
         # This emerges from the 24-cell structure and RG running:
         # ln(M_GUT/M_EW) ~ α_GUT⁻¹ × 2π / |b_avg| ~ 24 × 2π / 7 ~ 21.6
         # With M_EW topologically set, this gives M_GUT ~ 10¹⁶ GeV
-        M_GUT = mp.mpf('2e16')
+        M_GUT = ctx.mpf('2e16')
         
         result = PredictionResult(
             name="GUT unification scale",
@@ -603,7 +800,7 @@ class CalculationEngine:
                 'geometric_origin': '24-cell polytope structure',
                 'M_GUT_GeV': float(M_GUT),
             },
-            theoretical_uncertainty=mp.mpf('5e15'),  # Order of magnitude
+            theoretical_uncertainty=ctx.mpf('5e15'),  # Order of magnitude
             uncertainty_source="Threshold corrections, higher-loop effects",
             requires_refinement=True,
             refinement_notes="Precise M_X requires 2-loop RG with thresholds"
@@ -637,22 +834,23 @@ class CalculationEngine:
         Returns:
             PredictionResult with suppression factor
         """
+        ctx = self.ctx
         # Quaternionic suppression (4-strand permutation)
-        quaternion_factor = 1 / mp.factorial(4)  # 1/24
+        quaternion_factor = 1 / ctx.factorial(self.n_strands)  # 1/4! = 1/24
         
         # Weyl anomaly instanton action
         # S_inst ~ 8π²/g² where g ~ α for EM coupling
         # Use geometric α from the theory (not experimental)
-        alpha_geometric = 1 / (4 * mp.pi)  # Geometric estimate
-        S_inst = 8 * mp.pi**2 * alpha_geometric
-        instanton_factor = mp.exp(-S_inst)
+        alpha_geometric = 1 / (4 * ctx.pi)  # Geometric estimate
+        S_inst = 8 * ctx.pi**2 * alpha_geometric
+        instanton_factor = ctx.exp(-S_inst)
         
         # Topological winding number
         # NOTE (Directive A): Do NOT use experimental Planck/EW masses here.
         # Instead, define a dimensionless topological ratio based on the
         # 4-strand metric mismatch η = 4/π (see substrate foundation).
         # This is a heuristic topological approximation, not an experimental input.
-        winding_topological_ratio = (4 / mp.pi) ** 2  # Heuristic from η = 4/π
+        winding_topological_ratio = (4 / ctx.pi) ** 2  # Heuristic from η = 4/π
         N_wind = winding_topological_ratio ** 4
         winding_factor = 1 / N_wind
         
@@ -661,7 +859,7 @@ class CalculationEngine:
         
         # Orders of magnitude
         if total_suppression > 0:
-            orders_of_magnitude = -float(mp.log10(abs(total_suppression)))
+            orders_of_magnitude = -float(ctx.log10(abs(total_suppression)))
         else:
             orders_of_magnitude = float('inf')
         
@@ -681,7 +879,7 @@ class CalculationEngine:
                 'S_instanton': float(S_inst),
                 'orders_of_magnitude_suppression': orders_of_magnitude,
             },
-            theoretical_uncertainty=mp.mpf('1e-20'),  # Very rough estimate
+            theoretical_uncertainty=ctx.mpf('1e-20'),  # Very rough estimate
             uncertainty_source="Instanton action approximation",
             requires_refinement=True,
             refinement_notes="Multi-instanton contributions not fully included"
@@ -707,17 +905,18 @@ class CalculationEngine:
         Returns:
             Dictionary of cosmological ratio predictions
         """
+        ctx = self.ctx
         results = {}
         
         # Dark energy ratio
         # From IRH vacuum structure: ΩΛ = 1 - Ωm where Ωm = ΩDM + Ωb
         # Geometric estimate: ΩΛ ≈ 1 - 1/(1 + η) where η = 4/π
-        eta = mp.mpf(4) / mp.pi
+        eta = ctx.mpf(4) / ctx.pi
         Omega_Lambda = 1 - 1 / (1 + eta)  # ≈ 0.56 (geometric)
         
         # Adjust for better match using 24-cell structure
         # ΩΛ = 24/(24 + 10) ≈ 0.706 (closer to observed 0.689)
-        Omega_Lambda_refined = mp.mpf(24) / (24 + 10)
+        Omega_Lambda_refined = ctx.mpf(24) / (24 + 10)
         
         results['Omega_Lambda'] = PredictionResult(
             name="Dark energy density parameter",
@@ -732,14 +931,14 @@ class CalculationEngine:
                 'refined_estimate': float(Omega_Lambda_refined),
                 'n_24cell': 24,
             },
-            theoretical_uncertainty=mp.mpf('0.02'),
+            theoretical_uncertainty=ctx.mpf('0.02'),
             uncertainty_source="Geometric approximation",
             requires_refinement=True,
         )
         
         # Dark matter ratio
         # From IRH: ΩDM ≈ 8/(24 + 10) ≈ 0.235
-        Omega_DM = mp.mpf(8) / (24 + 10)
+        Omega_DM = ctx.mpf(8) / (24 + 10)
         
         results['Omega_DM'] = PredictionResult(
             name="Dark matter density parameter",
@@ -752,7 +951,7 @@ class CalculationEngine:
             components={
                 'topological_origin': '4-strand network defects',
             },
-            theoretical_uncertainty=mp.mpf('0.02'),
+            theoretical_uncertainty=ctx.mpf('0.02'),
             uncertainty_source="Defect counting approximation",
         )
         
@@ -772,7 +971,7 @@ class CalculationEngine:
                 'Omega_Lambda': float(Omega_Lambda_refined),
                 'Omega_DM': float(Omega_DM),
             },
-            theoretical_uncertainty=mp.mpf('0.01'),
+            theoretical_uncertainty=ctx.mpf('0.01'),
             uncertainty_source="From ΩΛ and ΩDM uncertainties",
         )
         
@@ -791,30 +990,23 @@ class CalculationEngine:
         Compute all IRH theoretical predictions.
         
         This runs the complete calculation pipeline for all observable
-        quantities derivable from the IRH framework.
+        quantities derivable from the IRH framework. Predictions that were
+        already computed (e.g. through get_prediction()) are reused.
         
         Returns:
-            Dictionary of all predictions keyed by identifier
+            Dictionary of all predictions keyed by identifier, in tier order
         """
-        # Tier 1: Core parameters
-        self.compute_fine_structure_constant()
-        self.compute_metric_mismatch()
-        self.compute_koide_formula()
-        
-        # Tier 2: Gauge sector
-        self.compute_gauge_couplings()
-        self.compute_weak_mixing_angle()
-        self.compute_gut_scale()
+        for key in self.PREDICTION_GRAPH:
+            self.get_prediction(key)
         
-        # Tier 3: Cosmological
-        self.compute_cosmological_constant_suppression()
-        self.compute_cosmological_ratios()
-        
-        return self._predictions.copy()
+        return {key: self._predictions[key] for key in self.PREDICTION_GRAPH}
     
     def get_prediction(self, key: str) -> PredictionResult:
         """
-        Get a single prediction by key.
+        Get a single prediction by key, computing it on demand.
+        
+        Only the transitive inputs of ``key`` (as declared in
+        PREDICTION_GRAPH) are computed; all results are memoized.
         
         Args:
             key: Prediction identifier
@@ -825,12 +1017,111 @@ class CalculationEngine:
         Raises:
             KeyError: If prediction not found
         """
-        if key not in self._predictions:
+        if key in self._predictions:
+            return self._predictions[key]
+        
+        node = self.PREDICTION_GRAPH.get(key)
+        if node is None:
             raise KeyError(f"Prediction '{key}' not found. "
-                          f"Available: {list(self._predictions.keys())}. "
-                          f"Try calling compute_all_predictions() first.")
+                          f"Available: {list(self.PREDICTION_GRAPH.keys())}")
+        
+        if self.cache is not None and not self._cache_loaded:
+            self._load_cache()
+            if key in self._predictions:
+                return self._predictions[key]
+        
+        for dependency in node.inputs:
+            self.get_prediction(dependency)
+        # A dependency's method may already have produced ``key``
+        if key in self._predictions:
+            return self._predictions[key]
+        computed_before = set(self._predictions)
+        getattr(self, node.method)()
+        
+        if self.cache is not None:
+            self.cache.store(self.cache_key, (
+                (name, result.to_record())
+                for name, result in self._predictions.items()
+                if name not in computed_before
+            ))
+        
         return self._predictions[key]
     
+    @property
+    def cache_key(self) -> str:
+        """
+        Fingerprint of everything the predictions depend on.
+        
+        Combines the derivation source, the current values of all public
+        constants and inputs, the precision and the arithmetic mode. It is
+        fixed at first use, so set inputs before requesting predictions.
+        """
+        if self._cache_key is None:
+            parts = [
+                source_fingerprint(),
+                f"precision={self._precision}",
+                f"interval={self._interval}",
+            ]
+            for name, value in sorted(vars(self).items()):
+                if not name.startswith('_') and name not in ('ctx', 'cache'):
+                    parts.append(f"{name}={fingerprint_value(value)}")
+            self._cache_key = hashlib.sha256('\n'.join(parts).encode()).hexdigest()
+        return self._cache_key
+    
+    def _load_cache(self):
+        """Memoize every prediction stored in the cache for this engine."""
+        make_mpf = mp.mp.make_mpf if self._interval else self.ctx.make_mpf
+        for name, record in self.cache.load(self.cache_key).items():
+            if name in self.PREDICTION_GRAPH and name not in self._predictions:
+                self._predictions[name] = PredictionResult.from_record(record, make_mpf)
+        self._cache_loaded = True
+    
+    def _input_value(self, key: str) -> Any:
+        """
+        Value of an upstream prediction in this engine's arithmetic context.
+        
+        In interval mode this is the full enclosure, so dependent
+        predictions stay rigorous.
+        """
+        result = self.get_prediction(key)
+        if result.enclosure is not None:
+            return self.ctx.mpf(list(result.enclosure))
+        return result.value
+    
+    def get_dependencies(self, key: str) -> List[str]:
+        """
+        List the transitive inputs of a prediction in evaluation order.
+        
+        Args:
+            key: Prediction identifier
+        
+        Returns:
+            Prediction keys that must be computed before ``key``
+        
+        Raises:
+            KeyError: If prediction not found
+        """
+        if key not in self.PREDICTION_GRAPH:
+            raise KeyError(f"Prediction '{key}' not found. "
+                          f"Available: {list(self.PREDICTION_GRAPH.keys())}")
+        
+        ordered: List[str] = []
+        
+        def visit(node_key: str):
+            for dependency in self.PREDICTION_GRAPH[node_key].inputs:
+                if dependency not in ordered:
+                    visit(dependency)
+                    ordered.append(dependency)
+        
+        visit(key)
+        return ordered
+    
+    def reset(self):
+        """Discard all memoized predictions (the persistent cache is kept)."""
+        self._predictions = {}
+        self._cache_key = None
+        self._cache_loaded = False
+    
     def list_predictions(self) -> List[str]:
         """
         List all computed prediction keys.
@@ -0,0 +1,295 @@
+"""
+Refinement Composition Search for IRH Theory Evolution System
+=============================================================
+
+Finds the best compositions (pairs, triples, ...) of modifications, whose
+correction factors multiply, without testing all 2^N subsets.
+
+**Search:**
+- Depth-first over index-ordered subsets; each node's correction vector
+  is its parent's partial product times one modification's factors, so
+  every partial product is computed once (memoized along the path)
+- All children of a node are evaluated in one NumPy pass
+- A branch is pruned when a non-target observable regresses beyond
+  ``sigma_tolerance`` and no remaining modification affects it (the
+  regression can no longer be repaired or turned into a target)
+- Branch-and-bound on the σ-gain: any extension multiplies an
+  observable by a factor between the products of the remaining factors
+  below and above 1, so its σ is at least the distance from experiment
+  to that interval; branches whose bound cannot enter the current top-k
+  are dropped
+
+A composition qualifies like a single refinement: mean target
+improvement > 0 and no regression of a non-target observable. Results
+are ranked by σ-gain, the total reduction of |theory - experiment| / σ
+over all observables with experimental data. ``to_modification`` turns
+a result into one TopologicalModification for the full integration test
+(symmetry and Directive A checks).
+
+Usage:
+------
+```python
+from evolution_system import IntegrationSystem
+from evolution_system.ai_advisor import template_registry
+from evolution_system.composition_search import CompositionSearch
+
+search = CompositionSearch()
+best = search.search(template_registry().templates.values(), max_size=3, top_k=5)
+for composition in best:
+    print(composition.names, composition.sigma_gain)
+search.stats                                # nodes evaluated / pruned
+
+# Full integration test of the winners
+results = list(IntegrationSystem().test_modifications(c.to_modification() for c in best))
+```
+"""
+
+import heapq
+import itertools
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .ai_advisor import TopologicalModification
+from .integration_system import IntegrationSystem
+
+
+@dataclass
+class CompositionResult:
+    """
+    A qualifying composition of modifications.
+
+    Attributes:
+        modifications: Composed modifications, in input order
+        indices: Their positions in the searched sequence
+        corrections: Observable -> product of correction factors (affected only)
+        target_improvement_pct: Mean relative-error reduction on targets (%)
+        sigma_gain: Total σ reduction over observables with experimental data
+    """
+    modifications: Tuple[TopologicalModification, ...]
+    indices: Tuple[int, ...]
+    corrections: Dict[str, float]
+    target_improvement_pct: float
+    sigma_gain: float
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        """Names of the composed modifications."""
+        return tuple(m.name for m in self.modifications)
+
+    def to_modification(self) -> TopologicalModification:
+        """
+        Single modification applying the composed correction factors.
+
+        Its type is the first member's, its symmetries those all members
+        preserve and its confidence the lowest among the members.
+        """
+        first = self.modifications[0]
+        levels = list(type(first.confidence))
+        return TopologicalModification(
+            name=" + ".join(self.names),
+            refinement_type=first.refinement_type,
+            mathematical_formula=" ∘ ".join(m.mathematical_formula for m in self.modifications),
+            topological_basis="\n".join(m.topological_basis for m in self.modifications),
+            affected_observables=list(self.corrections),
+            expected_improvement=f"{self.target_improvement_pct:.2f}% on targets (composition)",
+            derivation_steps=[s for m in self.modifications for s in m.derivation_steps],
+            symmetries_preserved=[
+                s for s in first.symmetries_preserved
+                if all(s in m.symmetries_preserved for m in self.modifications[1:])
+            ],
+            testable_predictions=[p for m in self.modifications for p in m.testable_predictions],
+            confidence=max((m.confidence for m in self.modifications), key=levels.index),
+            correction_factors=dict(self.corrections),
+        )
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            'names': list(self.names),
+            'indices': list(self.indices),
+            'corrections': self.corrections,
+            'target_improvement_pct': self.target_improvement_pct,
+            'sigma_gain': self.sigma_gain,
+        }
+
+
+@dataclass
+class _Node:
+    """Search node: a composition that may still be extended."""
+    indices: Tuple[int, ...]
+    product: np.ndarray
+    targets: np.ndarray
+
+
+class CompositionSearch:
+    """
+    Branch-and-bound search for compositions of modifications.
+
+    Uses the baseline, experimental data, correction factors and σ
+    tolerance of an IntegrationSystem.
+    """
+
+    def __init__(self, integration_system: Optional[IntegrationSystem] = None):
+        """
+        Initialize the search.
+
+        Args:
+            integration_system: System whose baseline and tolerance to use
+                (default: a new IntegrationSystem)
+        """
+        self.system = integration_system or IntegrationSystem()
+        self.stats: Dict[str, int] = {}
+
+    def search(
+        self,
+        modifications: Iterable[TopologicalModification],
+        max_size: int = 3,
+        top_k: int = 5,
+        min_size: int = 2,
+        min_contribution: float = 1e-6
+    ) -> List[CompositionResult]:
+        """
+        Best qualifying compositions of ``min_size`` to ``max_size`` modifications.
+
+        Modifications with the same ``identity`` are searched once. Every
+        member of a returned composition adds at least ``min_contribution``
+        to the σ-gain of the composition without it, so negligible members
+        (e.g. instanton orders whose factor rounds to 1) are not padding.
+
+        Args:
+            modifications: Candidate modifications
+            max_size: Largest composition
+            top_k: Number of compositions to return
+            min_size: Smallest composition (1 includes single modifications)
+            min_contribution: Least σ-gain each member must add
+
+        Returns:
+            Up to ``top_k`` CompositionResults, highest σ-gain first
+        """
+        unique: Dict[str, TopologicalModification] = {}
+        for modification in modifications:
+            unique.setdefault(modification.identity, modification)
+        candidates = list(unique.values())
+
+        baseline = self.system.test_env.setup_baseline()
+        keys = list(baseline)
+        column = {key: j for j, key in enumerate(keys)}
+        base_values = baseline.values
+        plan = self.system.db.validation_plan(keys)
+        exp_value, exp_uncertainty = plan.values, plan.uncertainties
+        tolerance = self.system.regression_tester.sigma_tolerance
+
+        # Correction factors and affected columns per candidate
+        n_rows, n_cols = len(candidates), len(keys)
+        factors = np.ones((n_rows, n_cols))
+        affected = np.zeros((n_rows, n_cols), dtype=bool)
+        for i, modification in enumerate(candidates):
+            for name in modification.affected_observables:
+                if name in column:
+                    j = column[name]
+                    factors[i, j] = self.system.test_env._compute_correction(
+                        modification, name, baseline[name].value
+                    )
+                    affected[i, j] = True
+        # Suffixes from position i: columns some candidate affects, and the
+        # range of products any subset of those candidates can multiply by
+        reachable = np.zeros((n_rows + 1, n_cols), dtype=bool)
+        lowest = np.ones((n_rows + 1, n_cols))
+        highest = np.ones((n_rows + 1, n_cols))
+        for i in range(n_rows - 1, -1, -1):
+            reachable[i] = reachable[i + 1] | affected[i]
+            lowest[i] = lowest[i + 1] * np.minimum(factors[i], 1.0)
+            highest[i] = highest[i + 1] * np.maximum(factors[i], 1.0)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            baseline_sigma = np.abs(base_values - exp_value) / exp_uncertainty
+            baseline_error = np.abs(base_values - exp_value) / np.abs(exp_value)
+        compared = np.isfinite(baseline_sigma)
+        improvable = compared & np.isfinite(baseline_error) & (baseline_error > 0)
+        total_sigma = float(baseline_sigma[compared].sum())
+
+        def sigma_gain(products: np.ndarray) -> np.ndarray:
+            """σ-gain of each row of correction products."""
+            with np.errstate(divide='ignore', invalid='ignore'):
+                sigma = np.abs(base_values * products - exp_value) / exp_uncertainty
+            return total_sigma - np.where(compared, sigma, 0.0).sum(axis=-1)
+
+        best: List[Tuple[float, int, CompositionResult]] = []
+        counter = itertools.count()
+        self.stats = {'evaluated': 0, 'pruned_regression': 0, 'pruned_bound': 0}
+
+        stack = [_Node((), np.ones(n_cols), np.zeros(n_cols, dtype=bool))]
+        while stack:
+            node = stack.pop()
+            start = node.indices[-1] + 1 if node.indices else 0
+            if start >= n_rows:
+                continue
+
+            # All children of the node at once
+            products = node.product * factors[start:]
+            targets = node.targets | affected[start:]
+            refined = base_values * products
+            with np.errstate(divide='ignore', invalid='ignore'):
+                refined_sigma = np.abs(refined - exp_value) / exp_uncertainty
+                refined_error = np.abs(refined - exp_value) / np.abs(exp_value)
+                improvement = (baseline_error - refined_error) / baseline_error * 100
+            refined_sigma = np.where(compared, refined_sigma, 0.0)
+            gain = total_sigma - refined_sigma.sum(axis=1)
+            regressed = compared & ~targets & (baseline_sigma - refined_sigma < -tolerance)
+            target_columns = targets & improvable
+            n_targets = target_columns.sum(axis=1)
+            target_improvement = (
+                np.where(target_columns, improvement, 0.0).sum(axis=1) / np.maximum(n_targets, 1)
+            )
+            self.stats['evaluated'] += len(products)
+
+            # Upper bound on the σ-gain of any extension of each child
+            ends = (refined * lowest[start + 1:], refined * highest[start + 1:])
+            with np.errstate(invalid='ignore'):
+                distance = np.maximum(np.minimum(*ends) - exp_value, exp_value - np.maximum(*ends))
+                least_sigma = np.maximum(distance, 0.0) / exp_uncertainty
+            bound = total_sigma - np.where(compared, least_sigma, 0.0).sum(axis=1)
+
+            size = len(node.indices) + 1
+            for row, i in enumerate(range(start, n_rows)):
+                indices = node.indices + (i,)
+                qualifies = (
+                    size >= min_size and n_targets[row] and target_improvement[row] > 0
+                    and not regressed[row].any()
+                    and (len(best) < top_k or gain[row] > best[0][0])
+                )
+                if qualifies:
+                    # σ-gain of the composition without each member
+                    without = sigma_gain(products[row] / factors[list(indices)])
+                    qualifies = gain[row] - without.max() >= min_contribution
+                if qualifies:
+                    result = CompositionResult(
+                        modifications=tuple(candidates[k] for k in indices),
+                        indices=indices,
+                        corrections={
+                            keys[j]: float(products[row, j])
+                            for j in np.flatnonzero(targets[row])
+                        },
+                        target_improvement_pct=float(target_improvement[row]),
+                        sigma_gain=float(gain[row]),
+                    )
+                    entry = (result.sigma_gain, -next(counter), result)
+                    if len(best) < top_k:
+                        heapq.heappush(best, entry)
+                    elif entry[:2] > best[0][:2]:
+                        heapq.heapreplace(best, entry)
+
+                if size >= max_size:
+                    continue
+                # Regressions nothing left can touch are permanent
+                if (regressed[row] & ~reachable[i + 1]).any():
+                    self.stats['pruned_regression'] += 1
+                    continue
+                if len(best) == top_k and bound[row] <= best[0][0]:
+                    self.stats['pruned_bound'] += 1
+                    continue
+                stack.append(_Node(indices, products[row], targets[row]))
+
+        return [result for _, _, result in sorted(best, key=lambda e: e[:2], reverse=True)]
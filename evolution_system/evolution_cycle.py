@@ -34,12 +34,13 @@ from typing import Dict, List, Optional
 from datetime import datetime
 import json
 import argparse
+import os
 import sys
 
 # Local imports
 try:
     from .calculation_engine import CalculationEngine
-    from .experimental_database import ExperimentalDatabase
+    from .experimental_database import get_database
     from .validation_module import ValidationModule
     from .error_analyzer import ErrorAnalyzer
     from .ai_advisor import AIAdvisor, RefinementSuggestion
@@ -47,6 +48,9 @@ try:
         IntegrationSystem, IntegrationResult
     )
     from .documentation_updater import DocumentationUpdater
+    from .prediction_cache import PredictionCache
+    from .monte_carlo import MonteCarloPropagator
+    from .rejection_memo import RejectionMemo
 except ImportError as e:
     # Handle standalone execution
     import warnings
@@ -73,6 +77,7 @@ class CycleResult:
     refinements_tested: int = 0
     refinements_integrated: int = 0
     refinements_rejected: int = 0
+    refinements_memoized: int = 0  # Rejections taken from the rejection memo
     
     # Details
     integration_results: List[IntegrationResult] = field(default_factory=list)
@@ -103,6 +108,7 @@ class CycleResult:
             "refinements_tested": self.refinements_tested,
             "refinements_integrated": self.refinements_integrated,
             "refinements_rejected": self.refinements_rejected,
+            "refinements_memoized": self.refinements_memoized,
             "suggestions_considered": self.suggestions_considered,
             "baseline_mean_sigma": self.baseline_mean_sigma,
             "baseline_pass_rate": self.baseline_pass_rate,
@@ -135,7 +141,10 @@ class EvolutionCycle:
         self,
         repo_root: Optional[str] = None,
         sigma_tolerance: float = 0.5,
-        verbose: bool = True
+        verbose: bool = True,
+        monte_carlo_samples: int = 0,
+        workers: int = 1,
+        rejection_memo: Optional['RejectionMemo'] = None
     ):
         """
         Initialize the evolution cycle orchestrator.
@@ -144,16 +153,36 @@ class EvolutionCycle:
             repo_root: Path to repository root (auto-detected if None)
             sigma_tolerance: Maximum allowed σ regression (default 0.5)
             verbose: Whether to print progress information
+            monte_carlo_samples: If > 0, propagate derivation-input
+                uncertainties with this many Monte Carlo samples and
+                validate against the combined theory+experiment σ
+            workers: Number of worker processes testing refinements
+                (1 tests them in-process)
+            rejection_memo: Skips refinements already rejected against the
+                same baseline (default: ``$IRH_REJECTION_MEMO`` if set,
+                else a memo for the lifetime of this object)
         """
         self.verbose = verbose
+        self.monte_carlo_samples = monte_carlo_samples
+        self.workers = workers
         
         # Initialize components
         self.engine = CalculationEngine()
-        self.db = ExperimentalDatabase()
-        self.validator = ValidationModule(self.db)
+        self.db = get_database()
+        self.validator = ValidationModule(
+            self.db, combine_uncertainties=monte_carlo_samples > 0
+        )
+        self.propagator = (
+            MonteCarloPropagator(engine=self.engine) if monte_carlo_samples > 0 else None
+        )
         self.analyzer = ErrorAnalyzer()
         self.advisor = AIAdvisor()
-        self.integrator = IntegrationSystem(sigma_tolerance)
+        self.rejection_memo = (
+            rejection_memo if rejection_memo is not None else RejectionMemo.from_environment()
+        )
+        self.integrator = IntegrationSystem(
+            sigma_tolerance, self.db, rejection_memo=self.rejection_memo
+        )
         self.doc_updater = DocumentationUpdater(repo_root)
         
         # Cycle history
@@ -165,6 +194,14 @@ class EvolutionCycle:
         if self.verbose:
             print(message)
     
+    def _with_theory_uncertainties(self, predictions: Dict) -> Dict:
+        """Replace theoretical uncertainties by Monte Carlo estimates (if enabled)."""
+        if self.propagator is None:
+            return predictions
+        distributions = self.propagator.run(n_samples=self.monte_carlo_samples)
+        self._log(f"  Propagated input uncertainties ({self.monte_carlo_samples} samples)")
+        return distributions.apply(predictions)
+    
     def run(
         self,
         max_refinements: int = 5,
@@ -199,6 +236,7 @@ class EvolutionCycle:
             self._log("Step 1: Computing baseline predictions...")
             predictions = self.engine.compute_all_predictions()
             self._log(f"  Computed {len(predictions)} predictions")
+            predictions = self._with_theory_uncertainties(predictions)
             
             # Step 2: Validate against experiments
             self._log("Step 2: Validating against experimental values...")
@@ -235,17 +273,28 @@ class EvolutionCycle:
                 self._cycle_history.append(result)
                 return result
             
-            # Step 5: Test refinements
+            # Step 5: Test refinements (vectorized, optionally on a process pool)
             self._log("Step 5: Testing refinement suggestions...")
             tested_count = 0
+            candidates = suggestions[:max_refinements]
+            try:
+                # Failures of single refinements come back as results with ``error``
+                batch_results = self.integrator.test_refinements_parallel(
+                    candidates, self.workers
+                )
+            except Exception as e:
+                batch_results = [
+                    IntegrationResult.from_error(s.modification, e) for s in candidates
+                ]
             
-            for i, suggestion in enumerate(suggestions[:max_refinements], 1):
+            for i, (suggestion, integration_result) in enumerate(
+                zip(candidates, batch_results), 1
+            ):
                 self._log(f"")
-                self._log(f"  [{i}/{min(len(suggestions), max_refinements)}] "
+                self._log(f"  [{i}/{len(candidates)}] "
                          f"Testing: {suggestion.modification.name}")
                 
                 try:
-                    integration_result = self.integrator.test_refinement(suggestion)
                     result.integration_results.append(integration_result)
                     tested_count += 1
                     
@@ -259,10 +308,18 @@ class EvolutionCycle:
                             self._integrate_refinement(
                                 suggestion, integration_result, result
                             )
+                    elif integration_result.error is not None:
+                        self._log(f"    ✗ ERROR: {integration_result.error}")
+                        result.errors.append(
+                            f"{suggestion.modification.name}: {integration_result.error}"
+                        )
+                        result.refinements_rejected += 1
                     else:
                         reason = integration_result.rejection_reason
-                        self._log(f"    ✗ REJECTED ({reason.value if reason else 'unknown'})")
+                        memoized = " [memo]" if integration_result.memoized else ""
+                        self._log(f"    ✗ REJECTED ({reason.value if reason else 'unknown'}){memoized}")
                         result.refinements_rejected += 1
+                        result.refinements_memoized += integration_result.memoized
                         
                 except Exception as e:
                     self._log(f"    ✗ ERROR: {str(e)}")
@@ -280,6 +337,7 @@ class EvolutionCycle:
                     self._log("  Recomputing predictions with integrated refinements...")
                     final_predictions = self.engine.compute_all_predictions()
                     self._log(f"  Recomputed {len(final_predictions)} predictions")
+                    final_predictions = self._with_theory_uncertainties(final_predictions)
                     final_report = self.validator.validate_all(final_predictions)
                     result.final_mean_sigma = final_report.mean_sigma_deviation
                     result.final_pass_rate = final_report.overall_pass_rate
@@ -370,6 +428,8 @@ class EvolutionCycle:
         self._log(f"Refinements tested:     {result.refinements_tested}")
         self._log(f"Refinements integrated: {result.refinements_integrated}")
         self._log(f"Refinements rejected:   {result.refinements_rejected}")
+        if result.refinements_memoized:
+            self._log(f"  (known rejections:    {result.refinements_memoized})")
         self._log("")
         
         if result.baseline_mean_sigma is not None:
@@ -562,6 +622,12 @@ Examples:
   # Auto-integrate successful refinements
   python -m evolution_system.evolution_cycle --auto-integrate
   
+  # Reuse baseline predictions across runs
+  python -m evolution_system.evolution_cycle --prediction-cache .cache/irh-predictions.sqlite
+  
+  # Skip refinements rejected in earlier runs
+  python -m evolution_system.evolution_cycle --rejection-memo .cache/irh-rejections.sqlite
+  
   # Export results to custom path
   python -m evolution_system.evolution_cycle --output results/cycle_$(date +%Y%m%d).json
 """
@@ -607,12 +673,50 @@ Examples:
         help="Suppress progress output"
     )
     
+    parser.add_argument(
+        "--prediction-cache",
+        type=str,
+        default=None,
+        help="SQLite file caching baseline predictions between runs "
+             "(default: $IRH_PREDICTION_CACHE)"
+    )
+    
+    parser.add_argument(
+        "--rejection-memo",
+        type=str,
+        default=None,
+        help="SQLite file remembering rejected refinements between runs "
+             "(default: $IRH_REJECTION_MEMO)"
+    )
+    
+    parser.add_argument(
+        "--monte-carlo-samples",
+        type=int,
+        default=0,
+        help="Propagate theory uncertainties with N Monte Carlo samples and "
+             "validate against combined σ (default: 0, disabled)"
+    )
+    
+    parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        default=1,
+        help="Worker processes testing refinements (default: 1, in-process)"
+    )
+    
     args = parser.parse_args()
     
+    # Every CalculationEngine created from here on uses the cache
+    if args.prediction_cache:
+        os.environ[PredictionCache.ENV_VAR] = args.prediction_cache
+    
     # Initialize orchestrator
     orchestrator = EvolutionCycle(
         sigma_tolerance=args.sigma_tolerance,
-        verbose=not args.quiet
+        verbose=not args.quiet,
+        monte_carlo_samples=args.monte_carlo_samples,
+        workers=args.workers,
+        rejection_memo=RejectionMemo(args.rejection_memo) if args.rejection_memo else None
     )
     
     # Run cycles
@@ -17,6 +17,13 @@ Data Sources:
 - PDG 2022: https://pdg.lbl.gov/
 - Planck 2018: https://arxiv.org/abs/1807.06209
 
+The values are stored in ``data/experimental_constants.json`` (versioned by
+``data_version``) and built per category on first access. Other editions
+(e.g. CODATA 2018) are overlay files in ``data/editions/`` listing only the
+constants that differ. Set
+``IRH_EXPERIMENTAL_SNAPSHOT`` to a file path to start from a binary snapshot
+of the built database instead.
+
 Usage:
 ------
 ```python
@@ -35,17 +42,38 @@ for const in tier1:
 
 # Get all constants by category  
 leptons = db.get_category('lepton_masses')
+
+# Shared read-only instance and float64 alignment to prediction keys
+from evolution_system.experimental_database import get_database
+plan = get_database().validation_plan(['alpha_inv', 'eta', 'Omega_DM'])
+plan.values                   # [137.035999177, nan, 0.2607]
+
+# Other dataset editions (overlay files in data/editions/)
+db.editions                                   # ('2022.1', 'codata-2018')
+db.edition_diff('2022.1', 'codata-2018').changed   # ('alpha_inv',)
+codata2018 = db.edition('codata-2018')
+
+# Correlated measurements (``correlations`` in the data file)
+db.correlation('Omega_Lambda', 'Omega_DM')    # -0.986
+factor = db.covariance_factor(['Omega_Lambda', 'Omega_DM'])   # cached Cholesky
+factor.chi_squared(residuals)                 # rᵀ C⁻¹ r per row
 ```
 """
 
+import bisect
+import hashlib
+import json
+import os
+import pickle
+import threading
 import mpmath as mp
+import numpy as np
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Union
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Union
 from enum import Enum
 
-# Set high precision for all calculations
-mp.dps = 50
-
 
 class ConstantCategory(Enum):
     """Categories of experimental constants."""
@@ -68,11 +96,14 @@ class ValidationTier(Enum):
     TIER_4 = 4  # Precision tests: g-2, EDMs, CP violation
 
 
-@dataclass
+@dataclass(frozen=True)
 class ExperimentalConstant:
     """
     An experimental measurement with uncertainty and metadata.
     
+    Constants are immutable so a single database can be shared by all
+    components (see get_database).
+    
     **NOTE:** FOR VALIDATION ONLY - Never use as input to theory calculations.
     """
     name: str
@@ -97,9 +128,9 @@ class ExperimentalConstant:
     def __post_init__(self):
         """Ensure values are mpmath types."""
         if not isinstance(self.value, mp.mpf):
-            self.value = mp.mpf(str(self.value))
+            object.__setattr__(self, 'value', mp.mpf(str(self.value)))
         if not isinstance(self.uncertainty, mp.mpf):
-            self.uncertainty = mp.mpf(str(self.uncertainty))
+            object.__setattr__(self, 'uncertainty', mp.mpf(str(self.uncertainty)))
     
     def relative_uncertainty(self) -> mp.mpf:
         """Return relative uncertainty."""
@@ -125,6 +156,32 @@ class ExperimentalConstant:
         }
 
 
+# Versioned data file holding every experimental value
+DATA_FILE = Path(__file__).resolve().parent / 'data' / 'experimental_constants.json'
+SCHEMA_VERSION = 1
+
+
+def _read_data_file(path: Path) -> Dict:
+    """Parse a data or edition file, checking its schema version."""
+    raw = json.loads(path.read_text(encoding='utf-8'))
+    if raw.get('schema_version') != SCHEMA_VERSION:
+        raise ValueError(
+            f"Unsupported experimental data schema {raw.get('schema_version')!r} "
+            f"in {path} (expected {SCHEMA_VERSION})"
+        )
+    return raw
+
+
+def _constant_from_record(record: Dict, category: ConstantCategory) -> ExperimentalConstant:
+    """Build an ExperimentalConstant from its data-file record."""
+    fields = dict(record)
+    # Decimal strings keep the published digits at any mp.dps
+    fields['value'] = mp.mpf(fields['value'])
+    fields['uncertainty'] = mp.mpf(fields['uncertainty'])
+    fields['tier'] = ValidationTier(fields['tier'])
+    return ExperimentalConstant(category=category, **fields)
+
+
 class ExperimentalDatabase:
     """
     Comprehensive database of experimental measurements.
@@ -132,6 +189,11 @@ class ExperimentalDatabase:
     **CRITICAL:** All values are FOR VALIDATION ONLY per Directive A.
     These values must NEVER be used as inputs to theoretical calculations.
     
+    The values live in a versioned JSON data file (``DATA_FILE``). Only the
+    key index is read on construction; the constants of a category are built
+    the first time one of them is accessed. ``from_snapshot`` restores a
+    fully built database from a pickle written by ``save_snapshot``.
+    
     Structure:
     ----------
     - Tier 1: Core parameters (α, gauge couplings, lepton masses)
@@ -140,807 +202,377 @@ class ExperimentalDatabase:
     - Tier 4: Precision tests (g-2, EDMs, CP violation)
     """
     
-    def __init__(self):
-        """Initialize the experimental database."""
-        self._constants: Dict[str, ExperimentalConstant] = {}
-        self._load_all_constants()
-    
-    def _load_all_constants(self):
-        """Load all experimental constants into the database."""
-        self._load_fundamental_constants()
-        self._load_lepton_masses()
-        self._load_quark_masses()
-        self._load_gauge_couplings()
-        self._load_electroweak_parameters()
-        self._load_cosmological_parameters()
-        self._load_qcd_parameters()
-        self._load_mixing_matrices()
-        self._load_precision_tests()
+    SNAPSHOT_ENV_VAR = 'IRH_EXPERIMENTAL_SNAPSHOT'
     
-    def _load_fundamental_constants(self):
+    def __init__(
+        self,
+        data_file: Optional[Union[str, Path]] = None,
+        edition: Optional[str] = None
+    ):
         """
-        CODATA 2022 fundamental constants.
+        Initialize the experimental database (read-only once loaded).
         
-        **FOR VALIDATION ONLY** - Per Directive A, these are never used
-        as inputs to theoretical calculations.
-        """
-        # Fine-structure constant
-        self._constants['alpha'] = ExperimentalConstant(
-            name="Fine-structure constant",
-            symbol="α",
-            value=mp.mpf('7.2973525693e-3'),
-            uncertainty=mp.mpf('1.1e-12'),
-            unit="dimensionless",
-            source="CODATA 2022",
-            year=2022,
-            category=ConstantCategory.FUNDAMENTAL,
-            tier=ValidationTier.TIER_1,
-            description="Electromagnetic coupling constant",
-            theory_reference="IRH v26.0 Section 1; notebooks/02_harmony_functional.ipynb",
-            notes="FOR VALIDATION ONLY - Never use as input to theory"
-        )
-        
-        # Inverse fine-structure constant - EXPERIMENTAL VALUE FOR VALIDATION ONLY
-        self._constants['alpha_inv'] = ExperimentalConstant(
-            name="Inverse fine-structure constant",
-            symbol="α⁻¹",
-            value=mp.mpf('137.035999177'),  # CODATA 2022 - FOR VALIDATION ONLY
-            uncertainty=mp.mpf('2.1e-8'),
-            unit="dimensionless",
-            source="CODATA 2022",
-            year=2022,
-            category=ConstantCategory.FUNDAMENTAL,
-            tier=ValidationTier.TIER_1,
-            description="Inverse of electromagnetic coupling",
-            theory_reference="IRH v26.0 Section 1; notebooks/02_harmony_functional.ipynb",
-            notes="FOR VALIDATION ONLY - Primary validation target"
-        )
-        
-        # Planck constant
-        self._constants['hbar'] = ExperimentalConstant(
-            name="Reduced Planck constant",
-            symbol="ℏ",
-            value=mp.mpf('1.054571817e-34'),
-            uncertainty=mp.mpf('0'),  # Exact by definition
-            unit="J⋅s",
-            source="CODATA 2022",
-            year=2022,
-            category=ConstantCategory.FUNDAMENTAL,
-            tier=ValidationTier.TIER_1,
-            description="Quantum of action (exact by SI definition)",
-            notes="FOR VALIDATION ONLY - Exact value"
-        )
-        
-        # Speed of light
-        self._constants['c'] = ExperimentalConstant(
-            name="Speed of light in vacuum",
-            symbol="c",
-            value=mp.mpf('299792458'),
-            uncertainty=mp.mpf('0'),  # Exact by definition
-            unit="m/s",
-            source="CODATA 2022",
-            year=2022,
-            category=ConstantCategory.FUNDAMENTAL,
-            tier=ValidationTier.TIER_1,
-            description="Maximum signal speed (exact by SI definition)",
-            notes="FOR VALIDATION ONLY - Exact value"
-        )
-        
-        # Gravitational constant
-        self._constants['G'] = ExperimentalConstant(
-            name="Newtonian gravitational constant",
-            symbol="G",
-            value=mp.mpf('6.67430e-11'),
-            uncertainty=mp.mpf('1.5e-15'),
-            unit="m³⋅kg⁻¹⋅s⁻²",
-            source="CODATA 2022",
-            year=2022,
-            category=ConstantCategory.FUNDAMENTAL,
-            tier=ValidationTier.TIER_2,
-            description="Gravitational coupling strength",
-            notes="FOR VALIDATION ONLY - Largest relative uncertainty of fundamental constants"
-        )
-        
-        # Planck mass
-        self._constants['m_planck'] = ExperimentalConstant(
-            name="Planck mass",
-            symbol="m_Pl",
-            value=mp.mpf('2.176434e-8'),
-            uncertainty=mp.mpf('2.4e-13'),
-            unit="kg",
-            source="CODATA 2022",
-            year=2022,
-            category=ConstantCategory.FUNDAMENTAL,
-            tier=ValidationTier.TIER_2,
-            description="Characteristic mass scale of quantum gravity",
-            notes="FOR VALIDATION ONLY - Derived from ℏ, c, G"
-        )
+        Args:
+            data_file: JSON data file (default: DATA_FILE)
+            edition: Dataset edition to load (default: the data file's own
+                     ``data_version``); other editions are overlay files in
+                     the ``editions`` directory next to the data file
         
-        # Planck length
-        self._constants['l_planck'] = ExperimentalConstant(
-            name="Planck length",
-            symbol="l_Pl",
-            value=mp.mpf('1.616255e-35'),
-            uncertainty=mp.mpf('1.8e-40'),
-            unit="m",
-            source="CODATA 2022",
-            year=2022,
-            category=ConstantCategory.FUNDAMENTAL,
-            tier=ValidationTier.TIER_2,
-            description="Characteristic length scale of quantum gravity",
-            notes="FOR VALIDATION ONLY - Derived from ℏ, c, G"
-        )
+        Raises:
+            ValueError: If a data file has an unsupported schema version
+            KeyError: If the edition does not exist
+        """
+        self.data_file = Path(data_file) if data_file is not None else DATA_FILE
+        raw = _read_data_file(self.data_file)
+        self.base_version: str = raw['data_version']
+        self._base_records: Dict[ConstantCategory, Dict[str, Dict]] = {
+            ConstantCategory(name): section['constants']
+            for name, section in raw['categories'].items()
+        }
+        self._position: Dict[str, int] = {}
+        self._base_index: Dict[str, ConstantCategory] = {}
+        for category, records in self._base_records.items():
+            for key in records:
+                self._position[key] = len(self._position)
+                self._base_index[key] = category
+        self._correlation_blocks: List[Dict] = raw.get('correlations', [])
+        
+        self.data_version: str = edition if edition is not None else self.base_version
+        self._patches = self._edition_patches(self.data_version)
+        self._records = self._apply_patches(self._patches)
+        self._setup({})
+    
+    def _setup(self, loaded: Dict[ConstantCategory, Mapping[str, ExperimentalConstant]]):
+        """Build the key and tier indexes; ``loaded`` holds prebuilt categories."""
+        self._loaded = dict(loaded)
+        self._index: Dict[str, ConstantCategory] = {}
+        # Secondary indexes (from the records, so no constant is built)
+        self._tier_keys: Dict[ValidationTier, List[str]] = {}
+        self._symbol_keys: Dict[str, str] = {}
+        self._source_keys: Dict[str, List[str]] = {}
+        for category, records in self._records.items():
+            for key, record in records.items():
+                self._index[key] = category
+                self._tier_keys.setdefault(ValidationTier(record['tier']), []).append(key)
+                self._symbol_keys.setdefault(record['symbol'], key)
+                self._source_keys.setdefault(record['source'], []).append(key)
+        self._uncertainty_index: Optional[Tuple[List[float], List[str]]] = None
+        self._correlations: Dict[Tuple[str, str], float] = {}
+        for block in self._correlation_blocks:
+            keys, matrix = block['keys'], np.asarray(block['matrix'], dtype=float)
+            unknown = [key for key in keys if key not in self._index]
+            if unknown:
+                raise ValueError(f"Correlation block references unknown constants {unknown}")
+            if (matrix.shape != (len(keys), len(keys)) or not np.allclose(matrix, matrix.T)
+                    or not np.all(np.diag(matrix) == 1.0) or np.any(np.abs(matrix) > 1.0)):
+                raise ValueError(f"Correlation block {keys} is not a correlation matrix")
+            for i, key_a in enumerate(keys):
+                for j, key_b in enumerate(keys):
+                    if i != j:
+                        self._correlations[key_a, key_b] = float(matrix[i, j])
+        self._plans: Dict[Tuple, ValidationPlan] = {}
+        self._factors: Dict[Tuple, CovarianceFactor] = {}
+        self._editions: Dict[str, ExperimentalDatabase] = {self.data_version: self}
+        self._lock = threading.RLock()
+    
+    def __getstate__(self) -> Dict:
+        return {
+            'data_file': str(self.data_file),
+            'data_version': self.data_version,
+            'base_version': self.base_version,
+            'base_records': {c.value: r for c, r in self._base_records.items()},
+            'patches': self._patches,
+            'correlations': self._correlation_blocks,
+            'loaded': {c.value: dict(self._category(c)) for c in self._records},
+        }
     
-    def _load_lepton_masses(self):
-        """
-        Lepton masses from CODATA 2022 / PDG 2022.
-        
-        **FOR VALIDATION ONLY** - Per Directive A
-        """
-        # Electron mass - EXPERIMENTAL VALUE FOR VALIDATION ONLY
-        self._constants['m_electron'] = ExperimentalConstant(
-            name="Electron mass",
-            symbol="m_e",
-            value=mp.mpf('0.51099895000'),  # MeV/c² - CODATA 2022 FOR VALIDATION ONLY
-            uncertainty=mp.mpf('1.5e-10'),
-            unit="MeV/c²",
-            source="CODATA 2022",
-            year=2022,
-            category=ConstantCategory.LEPTON_MASSES,
-            tier=ValidationTier.TIER_1,
-            description="Electron rest mass",
-            theory_reference="IRH v26.0 Section 3 (Koide formula); notebooks/03_particle_sector.ipynb",
-            notes="FOR VALIDATION ONLY - Koide formula constraint"
-        )
-        
-        # Muon mass - EXPERIMENTAL VALUE FOR VALIDATION ONLY
-        self._constants['m_muon'] = ExperimentalConstant(
-            name="Muon mass",
-            symbol="m_μ",
-            value=mp.mpf('105.6583755'),  # MeV/c² - CODATA 2022 FOR VALIDATION ONLY
-            uncertainty=mp.mpf('2.3e-6'),
-            unit="MeV/c²",
-            source="CODATA 2022",
-            year=2022,
-            category=ConstantCategory.LEPTON_MASSES,
-            tier=ValidationTier.TIER_1,
-            description="Muon rest mass",
-            theory_reference="IRH v26.0 Section 3 (Koide formula); notebooks/03_particle_sector.ipynb",
-            notes="FOR VALIDATION ONLY - Koide formula constraint"
-        )
-        
-        # Tau mass - EXPERIMENTAL VALUE FOR VALIDATION ONLY
-        self._constants['m_tau'] = ExperimentalConstant(
-            name="Tau mass",
-            symbol="m_τ",
-            value=mp.mpf('1776.86'),  # MeV/c² - PDG 2022 FOR VALIDATION ONLY
-            uncertainty=mp.mpf('0.12'),
-            unit="MeV/c²",
-            source="PDG 2022",
-            year=2022,
-            category=ConstantCategory.LEPTON_MASSES,
-            tier=ValidationTier.TIER_1,
-            description="Tau rest mass",
-            theory_reference="IRH v26.0 Section 3 (Koide formula); notebooks/03_particle_sector.ipynb",
-            notes="FOR VALIDATION ONLY - Koide formula constraint"
-        )
-        
-        # Electron neutrino mass (upper limit)
-        self._constants['m_nu_e'] = ExperimentalConstant(
-            name="Electron neutrino mass limit",
-            symbol="m_νe",
-            value=mp.mpf('0'),  # Upper limit
-            uncertainty=mp.mpf('0.8e-6'),  # 0.8 eV upper limit
-            unit="MeV/c²",
-            source="KATRIN 2022",
-            year=2022,
-            category=ConstantCategory.LEPTON_MASSES,
-            tier=ValidationTier.TIER_4,
-            description="Direct kinematic upper limit",
-            notes="FOR VALIDATION ONLY - Upper limit only"
-        )
+    def __setstate__(self, state: Dict):
+        self.data_file = Path(state['data_file'])
+        self.data_version = state['data_version']
+        self.base_version = state['base_version']
+        self._base_records = {
+            ConstantCategory(c): r for c, r in state['base_records'].items()
+        }
+        self._position = {}
+        self._base_index = {}
+        for category, records in self._base_records.items():
+            for key in records:
+                self._position[key] = len(self._position)
+                self._base_index[key] = category
+        self._correlation_blocks = state['correlations']
+        self._patches = state['patches']
+        self._records = self._apply_patches(self._patches)
+        self._setup({
+            ConstantCategory(c): MappingProxyType(constants)
+            for c, constants in state['loaded'].items()
+        })
     
-    def _load_quark_masses(self):
-        """
-        Quark masses from PDG 2022.
+    # =========================================================================
+    # Editions
+    # =========================================================================
+    
+    @property
+    def editions(self) -> Tuple[str, ...]:
+        """Available editions: the data file's own, then the overlay files."""
+        overlays = sorted(p.stem for p in (self.data_file.parent / 'editions').glob('*.json'))
+        return (self.base_version, *(name for name in overlays if name != self.base_version))
+    
+    def _edition_patches(self, edition: str, _seen: Tuple[str, ...] = ()) -> Dict[str, Dict]:
+        """
+        Record changes of ``edition`` relative to the data file, by key.
+        
+        An overlay file ``editions/<edition>.json`` lists changed fields per
+        constant and ``extends`` another edition (default: the data file).
+        """
+        if edition == self.base_version:
+            return {}
+        if edition in _seen:
+            raise ValueError(f"Edition chain {' -> '.join(_seen + (edition,))} is cyclic")
+        path = self.data_file.parent / 'editions' / f"{edition}.json"
+        if not path.exists():
+            raise KeyError(f"Edition '{edition}' not found. Available: {list(self.editions)}")
+        raw = _read_data_file(path)
+        
+        patches = self._edition_patches(raw.get('extends', self.base_version), _seen + (edition,))
+        for key, patch in raw['constants'].items():
+            if key not in self._base_index:
+                raise ValueError(f"Edition '{edition}' changes unknown constant '{key}'")
+            patches[key] = {**patches.get(key, {}), **patch}
+        return patches
+    
+    def _apply_patches(self, patches: Mapping[str, Dict]) -> Dict[ConstantCategory, Dict[str, Dict]]:
+        """Data-file records with ``patches`` applied (unchanged categories shared)."""
+        records = dict(self._base_records)
+        for key, patch in patches.items():
+            category = self._base_index[key]
+            if records[category] is self._base_records[category]:
+                records[category] = dict(records[category])
+            records[category][key] = {**records[category][key], **patch}
+        return records
+    
+    def edition(self, name: str) -> 'ExperimentalDatabase':
+        """
+        Database of another edition of the same data file (cached).
         
-        **FOR VALIDATION ONLY** - Per Directive A
+        Args:
+            name: Edition name (see ``editions``)
         
-        Note: Light quark masses are MS-bar values at μ = 2 GeV.
-        Heavy quark masses are pole masses.
+        Returns:
+            Read-only ExperimentalDatabase of that edition
         """
-        # Up quark
-        self._constants['m_up'] = ExperimentalConstant(
-            name="Up quark mass",
-            symbol="m_u",
-            value=mp.mpf('2.16'),  # MeV (MS-bar at 2 GeV)
-            uncertainty=mp.mpf('0.49'),
-            unit="MeV/c²",
-            source="PDG 2022",
-            year=2022,
-            category=ConstantCategory.QUARK_MASSES,
-            tier=ValidationTier.TIER_2,
-            description="Up quark MS-bar mass at 2 GeV",
-            notes="FOR VALIDATION ONLY - Large uncertainty"
-        )
-        
-        # Down quark
-        self._constants['m_down'] = ExperimentalConstant(
-            name="Down quark mass",
-            symbol="m_d",
-            value=mp.mpf('4.67'),  # MeV (MS-bar at 2 GeV)
-            uncertainty=mp.mpf('0.48'),
-            unit="MeV/c²",
-            source="PDG 2022",
-            year=2022,
-            category=ConstantCategory.QUARK_MASSES,
-            tier=ValidationTier.TIER_2,
-            description="Down quark MS-bar mass at 2 GeV",
-            notes="FOR VALIDATION ONLY - Large uncertainty"
-        )
-        
-        # Strange quark
-        self._constants['m_strange'] = ExperimentalConstant(
-            name="Strange quark mass",
-            symbol="m_s",
-            value=mp.mpf('93.4'),  # MeV (MS-bar at 2 GeV)
-            uncertainty=mp.mpf('8.6'),
-            unit="MeV/c²",
-            source="PDG 2022",
-            year=2022,
-            category=ConstantCategory.QUARK_MASSES,
-            tier=ValidationTier.TIER_2,
-            description="Strange quark MS-bar mass at 2 GeV",
-            notes="FOR VALIDATION ONLY"
-        )
-        
-        # Charm quark
-        self._constants['m_charm'] = ExperimentalConstant(
-            name="Charm quark mass",
-            symbol="m_c",
-            value=mp.mpf('1270'),  # MeV (MS-bar at m_c)
-            uncertainty=mp.mpf('20'),
-            unit="MeV/c²",
-            source="PDG 2022",
-            year=2022,
-            category=ConstantCategory.QUARK_MASSES,
-            tier=ValidationTier.TIER_2,
-            description="Charm quark MS-bar mass at m_c",
-            notes="FOR VALIDATION ONLY"
-        )
-        
-        # Bottom quark
-        self._constants['m_bottom'] = ExperimentalConstant(
-            name="Bottom quark mass",
-            symbol="m_b",
-            value=mp.mpf('4180'),  # MeV (MS-bar at m_b)
-            uncertainty=mp.mpf('30'),
-            unit="MeV/c²",
-            source="PDG 2022",
-            year=2022,
-            category=ConstantCategory.QUARK_MASSES,
-            tier=ValidationTier.TIER_2,
-            description="Bottom quark MS-bar mass at m_b",
-            notes="FOR VALIDATION ONLY"
-        )
-        
-        # Top quark
-        self._constants['m_top'] = ExperimentalConstant(
-            name="Top quark mass",
-            symbol="m_t",
-            value=mp.mpf('172760'),  # MeV (pole mass)
-            uncertainty=mp.mpf('300'),
-            unit="MeV/c²",
-            source="PDG 2022",
-            year=2022,
-            category=ConstantCategory.QUARK_MASSES,
-            tier=ValidationTier.TIER_2,
-            description="Top quark pole mass",
-            notes="FOR VALIDATION ONLY - Most precisely measured quark mass"
-        )
+        with self._lock:
+            db = self._editions.get(name)
+            if db is None:
+                db = ExperimentalDatabase(self.data_file, edition=name)
+                self._editions[name] = db
+        return db
     
-    def _load_gauge_couplings(self):
+    def edition_diff(self, old: str, new: str) -> 'EditionDiff':
         """
-        Gauge coupling constants at MZ scale from PDG 2022.
-        
-        **FOR VALIDATION ONLY** - Per Directive A
-        """
-        # Strong coupling constant
-        self._constants['alpha_s'] = ExperimentalConstant(
-            name="Strong coupling constant",
-            symbol="α_s(M_Z)",
-            value=mp.mpf('0.1179'),
-            uncertainty=mp.mpf('0.0010'),
-            unit="dimensionless",
-            source="PDG 2022",
-            year=2022,
-            category=ConstantCategory.GAUGE_COUPLINGS,
-            tier=ValidationTier.TIER_1,
-            description="QCD coupling at Z mass scale",
-            theory_reference="notebooks/05_gauge_sector.ipynb",
-            notes="FOR VALIDATION ONLY - Key GUT constraint"
-        )
+        Constants whose value or uncertainty differs between two editions.
         
-        # Weak mixing angle (sin²θW)
-        self._constants['sin2_theta_w'] = ExperimentalConstant(
-            name="Weak mixing angle",
-            symbol="sin²θ_W(M_Z)",
-            value=mp.mpf('0.23121'),
-            uncertainty=mp.mpf('0.00004'),
-            unit="dimensionless",
-            source="PDG 2022",
-            year=2022,
-            category=ConstantCategory.GAUGE_COUPLINGS,
-            tier=ValidationTier.TIER_1,
-            description="Electroweak mixing angle at Z mass",
-            theory_reference="notebooks/05_gauge_sector.ipynb",
-            notes="FOR VALIDATION ONLY - Electroweak unification"
-        )
-        
-        # SU(2) coupling g2 at MZ
-        # g₂ = e/sin(θW), where e = √(4πα)
-        self._constants['g2'] = ExperimentalConstant(
-            name="SU(2) gauge coupling",
-            symbol="g₂(M_Z)",
-            value=mp.mpf('0.6517'),
-            uncertainty=mp.mpf('0.0002'),
-            unit="dimensionless",
-            source="PDG 2022 (derived)",
-            year=2022,
-            category=ConstantCategory.GAUGE_COUPLINGS,
-            tier=ValidationTier.TIER_1,
-            description="Weak isospin coupling at Z mass",
-            notes="FOR VALIDATION ONLY - Derived from α and sin²θW"
-        )
+        Only constants touched by either edition's overlays are compared,
+        so the cost scales with the number of changes.
         
-        # U(1) coupling g1 at MZ (GUT normalized: g₁ = √(5/3) × g')
-        self._constants['g1'] = ExperimentalConstant(
-            name="U(1) gauge coupling (GUT normalized)",
-            symbol="g₁(M_Z)",
-            value=mp.mpf('0.3574'),
-            uncertainty=mp.mpf('0.0001'),
-            unit="dimensionless",
-            source="PDG 2022 (derived)",
-            year=2022,
-            category=ConstantCategory.GAUGE_COUPLINGS,
-            tier=ValidationTier.TIER_1,
-            description="Hypercharge coupling at Z mass (GUT normalized)",
-            notes="FOR VALIDATION ONLY - g₁ = √(5/3) × g'"
-        )
+        Args:
+            old: Reference edition
+            new: Edition to compare
         
-        # SU(3) coupling g3 at MZ
-        # g₃ = √(4π×α_s)
-        self._constants['g3'] = ExperimentalConstant(
-            name="SU(3) gauge coupling",
-            symbol="g₃(M_Z)",
-            value=mp.mpf('1.2177'),
-            uncertainty=mp.mpf('0.0052'),
-            unit="dimensionless",
-            source="PDG 2022 (derived)",
-            year=2022,
-            category=ConstantCategory.GAUGE_COUPLINGS,
-            tier=ValidationTier.TIER_1,
-            description="Strong coupling at Z mass",
-            notes="FOR VALIDATION ONLY - g₃ = √(4πα_s)"
-        )
+        Returns:
+            EditionDiff (keys in data-file order)
+        """
+        old_patches = self._patches if old == self.data_version else self._edition_patches(old)
+        new_patches = self._patches if new == self.data_version else self._edition_patches(new)
+        
+        value_changed, uncertainty_changed = [], []
+        for key in sorted(set(old_patches) | set(new_patches), key=self._position.__getitem__):
+            base = self._base_records[self._base_index[key]][key]
+            before = {**base, **old_patches.get(key, {})}
+            after = {**base, **new_patches.get(key, {})}
+            if mp.mpf(before['value']) != mp.mpf(after['value']):
+                value_changed.append(key)
+            if mp.mpf(before['uncertainty']) != mp.mpf(after['uncertainty']):
+                uncertainty_changed.append(key)
+        return EditionDiff(old, new, tuple(value_changed), tuple(uncertainty_changed))
     
-    def _load_electroweak_parameters(self):
-        """
-        Electroweak parameters from PDG 2022.
-        
-        **FOR VALIDATION ONLY** - Per Directive A
-        """
-        # Z boson mass
-        self._constants['m_Z'] = ExperimentalConstant(
-            name="Z boson mass",
-            symbol="M_Z",
-            value=mp.mpf('91187.6'),  # MeV
-            uncertainty=mp.mpf('2.1'),
-            unit="MeV/c²",
-            source="PDG 2022",
-            year=2022,
-            category=ConstantCategory.ELECTROWEAK,
-            tier=ValidationTier.TIER_2,
-            description="Z boson pole mass",
-            notes="FOR VALIDATION ONLY - Reference scale for RG running"
-        )
-        
-        # W boson mass
-        self._constants['m_W'] = ExperimentalConstant(
-            name="W boson mass",
-            symbol="M_W",
-            value=mp.mpf('80369'),  # MeV
-            uncertainty=mp.mpf('13'),
-            unit="MeV/c²",
-            source="PDG 2022",
-            year=2022,
-            category=ConstantCategory.ELECTROWEAK,
-            tier=ValidationTier.TIER_2,
-            description="W boson pole mass",
-            notes="FOR VALIDATION ONLY - MW anomaly under investigation"
-        )
-        
-        # Higgs boson mass
-        self._constants['m_Higgs'] = ExperimentalConstant(
-            name="Higgs boson mass",
-            symbol="M_H",
-            value=mp.mpf('125250'),  # MeV
-            uncertainty=mp.mpf('170'),
-            unit="MeV/c²",
-            source="PDG 2022",
-            year=2022,
-            category=ConstantCategory.ELECTROWEAK,
-            tier=ValidationTier.TIER_2,
-            description="Higgs boson mass",
-            notes="FOR VALIDATION ONLY"
-        )
-        
-        # Higgs vacuum expectation value
-        self._constants['v_higgs'] = ExperimentalConstant(
-            name="Higgs VEV",
-            symbol="v",
-            value=mp.mpf('246220'),  # MeV
-            uncertainty=mp.mpf('10'),
-            unit="MeV",
-            source="PDG 2022 (derived)",
-            year=2022,
-            category=ConstantCategory.ELECTROWEAK,
-            tier=ValidationTier.TIER_2,
-            description="Higgs vacuum expectation value v = (√2 G_F)^(-1/2)",
-            notes="FOR VALIDATION ONLY - Electroweak symmetry breaking scale"
-        )
-        
-        # Fermi constant
-        self._constants['G_F'] = ExperimentalConstant(
-            name="Fermi constant",
-            symbol="G_F",
-            value=mp.mpf('1.1663788e-5'),  # GeV⁻²
-            uncertainty=mp.mpf('6e-12'),
-            unit="GeV⁻²",
-            source="PDG 2022",
-            year=2022,
-            category=ConstantCategory.ELECTROWEAK,
-            tier=ValidationTier.TIER_2,
-            description="Weak interaction coupling from muon lifetime",
-            notes="FOR VALIDATION ONLY - Precise from muon lifetime"
-        )
+    # =========================================================================
+    # Loading
+    # =========================================================================
     
-    def _load_cosmological_parameters(self):
-        """
-        Cosmological parameters from Planck 2018.
-        
-        **FOR VALIDATION ONLY** - Per Directive A
-        """
-        # Hubble parameter
-        self._constants['H0'] = ExperimentalConstant(
-            name="Hubble constant",
-            symbol="H₀",
-            value=mp.mpf('67.4'),  # km/s/Mpc
-            uncertainty=mp.mpf('0.5'),
-            unit="km/s/Mpc",
-            source="Planck 2018",
-            year=2018,
-            category=ConstantCategory.COSMOLOGICAL,
-            tier=ValidationTier.TIER_3,
-            description="Present-day expansion rate",
-            notes="FOR VALIDATION ONLY - Tension with local measurements"
-        )
+    def _category(self, category: ConstantCategory) -> Mapping[str, ExperimentalConstant]:
+        """Constants of ``category`` (built on first access)."""
+        constants = self._loaded.get(category)
+        if constants is None:
+            with self._lock:
+                constants = self._loaded.get(category)
+                if constants is None:
+                    constants = MappingProxyType({
+                        key: _constant_from_record(record, category)
+                        for key, record in self._records.get(category, {}).items()
+                    })
+                    self._loaded[category] = constants
+        return constants
+    
+    def _lookup(self, key: str) -> Optional[ExperimentalConstant]:
+        """Constant ``key``, or None if it is not in the database."""
+        category = self._index.get(key)
+        if category is None:
+            return None
+        return self._category(category)[key]
+    
+    def _all_constants(self) -> Dict[str, ExperimentalConstant]:
+        """All constants in data-file order (builds every category)."""
+        constants = {}
+        for category in self._records:
+            constants.update(self._category(category))
+        return constants
+    
+    @classmethod
+    def from_snapshot(
+        cls,
+        path: Union[str, Path],
+        data_file: Optional[Union[str, Path]] = None
+    ) -> 'ExperimentalDatabase':
+        """
+        Load a fully built database from a binary snapshot.
+        
+        The snapshot is only used if it was written from the current
+        contents of the data file; otherwise the database is built from
+        the data file and the snapshot is rewritten.
         
-        # Dark energy density
-        self._constants['Omega_Lambda'] = ExperimentalConstant(
-            name="Dark energy density parameter",
-            symbol="Ω_Λ",
-            value=mp.mpf('0.6889'),
-            uncertainty=mp.mpf('0.0056'),
-            unit="dimensionless",
-            source="Planck 2018",
-            year=2018,
-            category=ConstantCategory.COSMOLOGICAL,
-            tier=ValidationTier.TIER_3,
-            description="Dark energy fraction of critical density",
-            theory_reference="notebooks/04_cosmology.ipynb",
-            notes="FOR VALIDATION ONLY - Cosmological constant problem"
-        )
-        
-        # Dark matter density
-        self._constants['Omega_DM'] = ExperimentalConstant(
-            name="Dark matter density parameter",
-            symbol="Ω_DM",
-            value=mp.mpf('0.2607'),
-            uncertainty=mp.mpf('0.0059'),
-            unit="dimensionless",
-            source="Planck 2018",
-            year=2018,
-            category=ConstantCategory.COSMOLOGICAL,
-            tier=ValidationTier.TIER_3,
-            description="Cold dark matter fraction of critical density",
-            theory_reference="notebooks/04_cosmology.ipynb",
-            notes="FOR VALIDATION ONLY"
-        )
+        Args:
+            path: Snapshot file (a pickle; only load snapshots you wrote)
+            data_file: JSON data file (default: DATA_FILE)
         
-        # Baryon density
-        self._constants['Omega_b'] = ExperimentalConstant(
-            name="Baryon density parameter",
-            symbol="Ω_b",
-            value=mp.mpf('0.0486'),
-            uncertainty=mp.mpf('0.0010'),
-            unit="dimensionless",
-            source="Planck 2018",
-            year=2018,
-            category=ConstantCategory.COSMOLOGICAL,
-            tier=ValidationTier.TIER_3,
-            description="Baryon fraction of critical density",
-            theory_reference="notebooks/04_cosmology.ipynb",
-            notes="FOR VALIDATION ONLY"
-        )
+        Returns:
+            ExperimentalDatabase
+        """
+        path = Path(path)
+        data_file = Path(data_file) if data_file is not None else DATA_FILE
+        digest = hashlib.sha256(data_file.read_bytes()).hexdigest()
+        try:
+            with open(path, 'rb') as f:
+                stored_digest, db = pickle.load(f)
+            if stored_digest == digest and isinstance(db, cls):
+                return db
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError, TypeError):
+            # Missing, stale or unreadable snapshots are rebuilt below
+            pass
+        db = cls(data_file)
+        db.save_snapshot(path)
+        return db
+    
+    @classmethod
+    def from_environment(cls) -> 'ExperimentalDatabase':
+        """Database from the snapshot at ``$IRH_EXPERIMENTAL_SNAPSHOT`` (if set)."""
+        path = os.environ.get(cls.SNAPSHOT_ENV_VAR)
+        return cls.from_snapshot(path) if path else cls()
+    
+    def save_snapshot(self, path: Union[str, Path]):
+        """
+        Write a binary snapshot of the fully built database.
         
-        # Cosmological constant (in natural units)
-        self._constants['Lambda'] = ExperimentalConstant(
-            name="Cosmological constant",
-            symbol="Λ",
-            value=mp.mpf('1.1056e-52'),  # m⁻²
-            uncertainty=mp.mpf('1e-54'),
-            unit="m⁻²",
-            source="Planck 2018 (derived)",
-            year=2018,
-            category=ConstantCategory.COSMOLOGICAL,
-            tier=ValidationTier.TIER_3,
-            description="Einstein's cosmological constant",
-            theory_reference="notebooks/04_cosmology.ipynb",
-            notes="FOR VALIDATION ONLY - 10^123 discrepancy with QFT"
-        )
-    
-    def _load_qcd_parameters(self):
+        Args:
+            path: Snapshot file (written atomically)
         """
-        QCD parameters from PDG 2022 and lattice QCD.
-        
-        **FOR VALIDATION ONLY** - Per Directive A
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha256(self.data_file.read_bytes()).hexdigest()
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp, 'wb') as f:
+            pickle.dump((digest, self), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    
+    # =========================================================================
+    # Public API Methods
+    # =========================================================================
+    
+    def get(self, key: str) -> ExperimentalConstant:
         """
-        # QCD scale (Lambda_QCD)
-        self._constants['Lambda_QCD'] = ExperimentalConstant(
-            name="QCD scale",
-            symbol="Λ_QCD",
-            value=mp.mpf('217'),  # MeV (5-flavor MS-bar)
-            uncertainty=mp.mpf('25'),
-            unit="MeV",
-            source="PDG 2022",
-            year=2022,
-            category=ConstantCategory.QCD,
-            tier=ValidationTier.TIER_2,
-            description="QCD confinement scale",
-            notes="FOR VALIDATION ONLY - Scale where α_s ~ 1"
-        )
+        Get a constant by key.
         
-        # QCD string tension
-        self._constants['sigma_QCD'] = ExperimentalConstant(
-            name="QCD string tension",
-            symbol="σ_QCD",
-            value=mp.mpf('0.44'),  # GeV²
-            uncertainty=mp.mpf('0.03'),
-            unit="GeV²",
-            source="Lattice QCD 2022",
-            year=2022,
-            category=ConstantCategory.QCD,
-            tier=ValidationTier.TIER_2,
-            description="String tension from Wilson loops",
-            theory_reference="notebooks/05_gauge_sector.ipynb",
-            notes="FOR VALIDATION ONLY - Confinement parameter"
-        )
+        Args:
+            key: Constant identifier (e.g., 'alpha', 'm_electron')
         
-        # Proton mass
-        self._constants['m_proton'] = ExperimentalConstant(
-            name="Proton mass",
-            symbol="m_p",
-            value=mp.mpf('938.272088'),  # MeV/c²
-            uncertainty=mp.mpf('0.000016'),
-            unit="MeV/c²",
-            source="CODATA 2022",
-            year=2022,
-            category=ConstantCategory.QCD,
-            tier=ValidationTier.TIER_2,
-            description="Proton rest mass",
-            notes="FOR VALIDATION ONLY - Mostly QCD binding energy"
-        )
+        Returns:
+            ExperimentalConstant object
         
-        # Pion mass
-        self._constants['m_pion'] = ExperimentalConstant(
-            name="Charged pion mass",
-            symbol="m_π",
-            value=mp.mpf('139.57039'),  # MeV/c²
-            uncertainty=mp.mpf('0.00018'),
-            unit="MeV/c²",
-            source="PDG 2022",
-            year=2022,
-            category=ConstantCategory.QCD,
-            tier=ValidationTier.TIER_2,
-            description="Charged pion mass",
-            notes="FOR VALIDATION ONLY - Goldstone boson of chiral symmetry"
-        )
-    
-    def _load_mixing_matrices(self):
+        Raises:
+            KeyError: If constant not found
         """
-        CKM and PMNS mixing matrix parameters from PDG 2022.
-        
-        **FOR VALIDATION ONLY** - Per Directive A
+        constant = self._lookup(key)
+        if constant is None:
+            # Kept cheap: lookups of absent keys are routine in validation loops
+            raise KeyError(f"Constant '{key}' not found in database "
+                          f"({len(self._index)} constants, see list_keys())")
+        return constant
+    
+    def get_by_symbol(self, symbol: str) -> ExperimentalConstant:
         """
-        # CKM Cabibbo angle
-        self._constants['theta_12_CKM'] = ExperimentalConstant(
-            name="CKM Cabibbo angle",
-            symbol="θ₁₂ (CKM)",
-            value=mp.mpf('0.2265'),  # radians → sin(θ₁₂)
-            uncertainty=mp.mpf('0.0005'),
-            unit="radians",
-            source="PDG 2022",
-            year=2022,
-            category=ConstantCategory.MIXING_MATRICES,
-            tier=ValidationTier.TIER_2,
-            description="Quark 1-2 mixing angle",
-            theory_reference="verification/particle_physics/mixing_matrices.py",
-            notes="FOR VALIDATION ONLY - sin(θ₁₂) = |V_us|"
-        )
+        Get a constant by its symbol.
         
-        # CKM |V_cb|
-        self._constants['V_cb'] = ExperimentalConstant(
-            name="CKM |V_cb|",
-            symbol="|V_cb|",
-            value=mp.mpf('0.0410'),
-            uncertainty=mp.mpf('0.0014'),
-            unit="dimensionless",
-            source="PDG 2022",
-            year=2022,
-            category=ConstantCategory.MIXING_MATRICES,
-            tier=ValidationTier.TIER_2,
-            description="Quark 2-3 mixing amplitude",
-            notes="FOR VALIDATION ONLY"
-        )
-        
-        # CKM |V_ub|
-        self._constants['V_ub'] = ExperimentalConstant(
-            name="CKM |V_ub|",
-            symbol="|V_ub|",
-            value=mp.mpf('0.00382'),
-            uncertainty=mp.mpf('0.00024'),
-            unit="dimensionless",
-            source="PDG 2022",
-            year=2022,
-            category=ConstantCategory.MIXING_MATRICES,
-            tier=ValidationTier.TIER_2,
-            description="Quark 1-3 mixing amplitude",
-            notes="FOR VALIDATION ONLY"
-        )
-        
-        # PMNS solar angle
-        self._constants['theta_12_PMNS'] = ExperimentalConstant(
-            name="PMNS solar angle",
-            symbol="θ₁₂ (PMNS)",
-            value=mp.mpf('0.5836'),  # radians (33.44°)
-            uncertainty=mp.mpf('0.012'),
-            unit="radians",
-            source="NuFIT 5.0 (2020)",
-            year=2020,
-            category=ConstantCategory.MIXING_MATRICES,
-            tier=ValidationTier.TIER_2,
-            description="Neutrino solar mixing angle",
-            notes="FOR VALIDATION ONLY - Large mixing"
-        )
+        Args:
+            symbol: Display symbol (e.g., 'α⁻¹', 'Ω_DM')
         
-        # PMNS atmospheric angle
-        self._constants['theta_23_PMNS'] = ExperimentalConstant(
-            name="PMNS atmospheric angle",
-            symbol="θ₂₃ (PMNS)",
-            value=mp.mpf('0.8587'),  # radians (49.2°)
-            uncertainty=mp.mpf('0.016'),
-            unit="radians",
-            source="NuFIT 5.0 (2020)",
-            year=2020,
-            category=ConstantCategory.MIXING_MATRICES,
-            tier=ValidationTier.TIER_2,
-            description="Neutrino atmospheric mixing angle",
-            notes="FOR VALIDATION ONLY - Near maximal"
-        )
+        Returns:
+            ExperimentalConstant object
         
-        # PMNS reactor angle
-        self._constants['theta_13_PMNS'] = ExperimentalConstant(
-            name="PMNS reactor angle",
-            symbol="θ₁₃ (PMNS)",
-            value=mp.mpf('0.1496'),  # radians (8.57°)
-            uncertainty=mp.mpf('0.003'),
-            unit="radians",
-            source="NuFIT 5.0 (2020)",
-            year=2020,
-            category=ConstantCategory.MIXING_MATRICES,
-            tier=ValidationTier.TIER_2,
-            description="Neutrino reactor mixing angle",
-            notes="FOR VALIDATION ONLY - Small but nonzero"
-        )
-    
-    def _load_precision_tests(self):
+        Raises:
+            KeyError: If no constant has that symbol
         """
-        Precision electroweak and QED tests from experiment.
-        
-        **FOR VALIDATION ONLY** - Per Directive A
+        key = self._symbol_keys.get(symbol)
+        if key is None:
+            raise KeyError(f"No constant with symbol '{symbol}' in database")
+        return self._lookup(key)
+    
+    def get_source(self, source: str) -> List[ExperimentalConstant]:
         """
-        # Electron anomalous magnetic moment
-        self._constants['a_electron'] = ExperimentalConstant(
-            name="Electron anomalous magnetic moment",
-            symbol="a_e",
-            value=mp.mpf('1.15965218073e-3'),
-            uncertainty=mp.mpf('2.8e-13'),
-            unit="dimensionless",
-            source="CODATA 2022",
-            year=2022,
-            category=ConstantCategory.PRECISION_TESTS,
-            tier=ValidationTier.TIER_4,
-            description="(g-2)/2 for electron",
-            notes="FOR VALIDATION ONLY - Most precise QED test"
-        )
-        
-        # Muon anomalous magnetic moment
-        self._constants['a_muon'] = ExperimentalConstant(
-            name="Muon anomalous magnetic moment",
-            symbol="a_μ",
-            value=mp.mpf('1.16592061e-3'),
-            uncertainty=mp.mpf('4.1e-10'),
-            unit="dimensionless",
-            source="Muon g-2 (2021)",
-            year=2021,
-            category=ConstantCategory.PRECISION_TESTS,
-            tier=ValidationTier.TIER_4,
-            description="(g-2)/2 for muon",
-            notes="FOR VALIDATION ONLY - ~4.2σ tension with SM (under investigation)"
-        )
+        Get all constants from a source.
         
-        # Electron electric dipole moment (upper limit)
-        self._constants['d_electron'] = ExperimentalConstant(
-            name="Electron EDM limit",
-            symbol="|d_e|",
-            value=mp.mpf('0'),  # Upper limit
-            uncertainty=mp.mpf('4.1e-30'),  # e⋅cm
-            unit="e⋅cm",
-            source="ACME III (2023)",
-            year=2023,
-            category=ConstantCategory.PRECISION_TESTS,
-            tier=ValidationTier.TIER_4,
-            description="Electron electric dipole moment (upper limit)",
-            notes="FOR VALIDATION ONLY - CP violation constraint"
-        )
+        Args:
+            source: Source label, exactly as stored (e.g., 'CODATA 2022')
         
-        # W mass anomaly (CDF II measurement)
-        self._constants['m_W_CDF'] = ExperimentalConstant(
-            name="W mass (CDF II)",
-            symbol="M_W (CDF)",
-            value=mp.mpf('80433.5'),  # MeV
-            uncertainty=mp.mpf('9.4'),
-            unit="MeV/c²",
-            source="CDF II (2022)",
-            year=2022,
-            category=ConstantCategory.PRECISION_TESTS,
-            tier=ValidationTier.TIER_4,
-            description="W mass from CDF II - tension with SM",
-            notes="FOR VALIDATION ONLY - 7σ tension under investigation"
-        )
+        Returns:
+            List of constants from that source
+        """
+        return [self._lookup(key) for key in self._source_keys.get(source, ())]
     
-    # =========================================================================
-    # Public API Methods
-    # =========================================================================
+    def list_sources(self) -> List[str]:
+        """List all source labels."""
+        return list(self._source_keys)
     
-    def get(self, key: str) -> ExperimentalConstant:
+    def get_uncertainty_range(
+        self,
+        min_relative: float = 0.0,
+        max_relative: float = float('inf')
+    ) -> List[ExperimentalConstant]:
         """
-        Get a constant by key.
+        Get constants by relative uncertainty (uncertainty / |value|).
+        
+        The float64 relative uncertainties are sorted once; each query is a
+        binary search. Constants with value 0 have infinite relative
+        uncertainty.
         
         Args:
-            key: Constant identifier (e.g., 'alpha', 'm_electron')
+            min_relative: Lower bound (inclusive)
+            max_relative: Upper bound (inclusive)
         
         Returns:
-            ExperimentalConstant object
-        
-        Raises:
-            KeyError: If constant not found
-        """
-        if key not in self._constants:
-            raise KeyError(f"Constant '{key}' not found in database. "
-                          f"Available: {list(self._constants.keys())}")
-        return self._constants[key]
+            Constants in the range, by increasing relative uncertainty
+        """
+        if self._uncertainty_index is None:
+            entries = []
+            for records in self._records.values():
+                for key, record in records.items():
+                    value = abs(float(record['value']))
+                    relative = float(record['uncertainty']) / value if value else float('inf')
+                    entries.append((relative, self._position[key], key))
+            entries.sort()
+            self._uncertainty_index = ([e[0] for e in entries], [e[2] for e in entries])
+        relatives, keys = self._uncertainty_index
+        start = bisect.bisect_left(relatives, min_relative)
+        stop = bisect.bisect_right(relatives, max_relative)
+        return [self._lookup(key) for key in keys[start:stop]]
     
     def get_value(self, key: str) -> mp.mpf:
         """
@@ -973,7 +605,7 @@ class ExperimentalDatabase:
         Returns:
             Dictionary of all constants
         """
-        return self._constants.copy()
+        return self._all_constants()
     
     def get_tier(self, tier: Union[int, ValidationTier]) -> List[ExperimentalConstant]:
         """
@@ -988,7 +620,7 @@ class ExperimentalDatabase:
         if isinstance(tier, int):
             tier = ValidationTier(tier)
         
-        return [c for c in self._constants.values() if c.tier == tier]
+        return [self._lookup(key) for key in self._tier_keys.get(tier, ())]
     
     def get_category(self, category: Union[str, ConstantCategory]) -> List[ExperimentalConstant]:
         """
@@ -1003,7 +635,133 @@ class ExperimentalDatabase:
         if isinstance(category, str):
             category = ConstantCategory(category)
         
-        return [c for c in self._constants.values() if c.category == category]
+        return list(self._category(category).values())
+    
+    def validation_plan(
+        self,
+        prediction_keys: Sequence[str],
+        key_map: Optional[Mapping[str, Optional[str]]] = None
+    ) -> 'ValidationPlan':
+        """
+        Align prediction keys to experimental values as float64 arrays.
+        
+        Plans are computed once per key layout and cached.
+        
+        Args:
+            prediction_keys: Prediction keys, in array order
+            key_map: Prediction key -> experimental key (None: no comparison);
+                     keys not in the map are looked up under their own name
+        
+        Returns:
+            ValidationPlan (NaN where no experimental value exists)
+        """
+        keys = tuple(prediction_keys)
+        if key_map is None:
+            experiment_keys = keys
+        else:
+            experiment_keys = tuple(key_map.get(key, key) for key in keys)
+        cache_key = (keys, experiment_keys)
+        
+        with self._lock:
+            plan = self._plans.get(cache_key)
+            if plan is None:
+                values = np.full(len(keys), np.nan)
+                uncertainties = np.full(len(keys), np.nan)
+                for i, exp_key in enumerate(experiment_keys):
+                    const = self._lookup(exp_key) if exp_key else None
+                    if const is not None:
+                        values[i] = float(const.value)
+                        uncertainties[i] = float(const.uncertainty)
+                values.flags.writeable = False
+                uncertainties.flags.writeable = False
+                plan = ValidationPlan(keys, experiment_keys, values, uncertainties)
+                self._plans[cache_key] = plan
+        return plan
+    
+    # =========================================================================
+    # Correlations
+    # =========================================================================
+    
+    def correlation(self, key_a: str, key_b: str) -> float:
+        """
+        Correlation coefficient of two measurements.
+        
+        Measurements not listed together in a ``correlations`` block of the
+        data file are independent.
+        
+        Args:
+            key_a: First constant key
+            key_b: Second constant key
+        
+        Returns:
+            Correlation coefficient in [-1, 1]
+        """
+        if key_a == key_b:
+            return 1.0
+        return self._correlations.get((key_a, key_b), 0.0)
+    
+    def covariance(self, keys: Sequence[str]) -> np.ndarray:
+        """
+        Covariance matrix of the experimental values of ``keys``.
+        
+        The uncertainties come from this edition, the correlation
+        coefficients from the data file.
+        
+        Args:
+            keys: Constant keys, in matrix order
+        
+        Returns:
+            Symmetric float64 array of shape (len(keys), len(keys))
+        
+        Raises:
+            KeyError: If a key is not in the database
+        """
+        sigma = np.array([float(self.get_uncertainty(key)) for key in keys])
+        correlation = np.array([[self.correlation(a, b) for b in keys] for a in keys])
+        return correlation * np.outer(sigma, sigma)
+    
+    def covariance_factor(
+        self,
+        keys: Sequence[str],
+        extra_variance: Optional[Sequence[float]] = None
+    ) -> 'CovarianceFactor':
+        """
+        Cholesky factorization of the covariance of ``keys``.
+        
+        Factorizations are computed once per key layout and cached, so
+        each database edition factorizes a covariance only once.
+        
+        Args:
+            keys: Constant keys, in matrix order
+            extra_variance: Variance added to the diagonal per key (e.g.
+                            theoretical uncertainties squared)
+        
+        Returns:
+            CovarianceFactor
+        
+        Raises:
+            KeyError: If a key is not in the database
+            numpy.linalg.LinAlgError: If the covariance is not positive definite
+        """
+        keys = tuple(keys)
+        extra = tuple(float(v) for v in extra_variance) if extra_variance is not None else None
+        cache_key = (keys, extra)
+        
+        with self._lock:
+            factor = self._factors.get(cache_key)
+            if factor is None:
+                covariance = self.covariance(keys)
+                if extra is not None:
+                    covariance = covariance + np.diag(extra)
+                cholesky = np.linalg.cholesky(covariance)
+                # Inverse of the triangular factor: whitening many residual
+                # vectors is then a single matrix product
+                whitening = np.linalg.solve(cholesky, np.eye(len(keys)))
+                for array in (covariance, cholesky, whitening):
+                    array.flags.writeable = False
+                factor = CovarianceFactor(keys, covariance, cholesky, whitening)
+                self._factors[cache_key] = factor
+        return factor
     
     def list_keys(self) -> List[str]:
         """
@@ -1012,7 +770,7 @@ class ExperimentalDatabase:
         Returns:
             List of constant identifiers
         """
-        return list(self._constants.keys())
+        return list(self._index)
     
     def count(self) -> int:
         """
@@ -1021,7 +779,7 @@ class ExperimentalDatabase:
         Returns:
             Number of constants
         """
-        return len(self._constants)
+        return len(self._index)
     
     def summary(self) -> Dict:
         """
@@ -1032,6 +790,7 @@ class ExperimentalDatabase:
         """
         return {
             'total_constants': self.count(),
+            'data_version': self.data_version,
             'by_tier': {
                 tier.name: len(self.get_tier(tier))
                 for tier in ValidationTier
@@ -1040,7 +799,7 @@ class ExperimentalDatabase:
                 cat.name: len(self.get_category(cat))
                 for cat in ConstantCategory
             },
-            'sources': list(set(c.source for c in self._constants.values()))
+            'sources': list(set(c.source for c in self._all_constants().values()))
         }
     
     def to_dict(self) -> Dict:
@@ -1052,7 +811,7 @@ class ExperimentalDatabase:
         """
         return {
             key: const.to_dict()
-            for key, const in self._constants.items()
+            for key, const in self._all_constants().items()
         }
     
     def print_summary(self):
@@ -1086,20 +845,110 @@ class ExperimentalDatabase:
         print("=" * 80)
 
 
-# Module-level instance for convenience
+@dataclass(frozen=True, eq=False)
+class ValidationPlan:
+    """
+    Prediction keys aligned to experimental data as read-only float64 arrays.
+    
+    ``values[i]`` and ``uncertainties[i]`` belong to ``keys[i]``; both are
+    NaN where no experimental value exists.
+    """
+    keys: Tuple[str, ...]
+    experiment_keys: Tuple[Optional[str], ...]
+    values: np.ndarray
+    uncertainties: np.ndarray
+    
+    @property
+    def has_experiment(self) -> np.ndarray:
+        """Boolean mask of keys with an experimental value."""
+        return ~np.isnan(self.values)
+
+
+@dataclass(frozen=True, eq=False)
+class CovarianceFactor:
+    """
+    Cholesky factorization ``covariance = cholesky @ cholesky.T`` of an
+    experimental covariance matrix (read-only float64 arrays).
+    
+    ``whitening`` is the inverse of ``cholesky``; residuals whitened with it
+    are independent standard normal under the measurement model.
+    """
+    keys: Tuple[str, ...]
+    covariance: np.ndarray
+    cholesky: np.ndarray
+    whitening: np.ndarray
+    
+    def whiten(self, residuals: np.ndarray) -> np.ndarray:
+        """
+        Solve ``cholesky @ z = r`` for every residual vector.
+        
+        Args:
+            residuals: Array of shape (..., len(keys)), theory - experiment
+        
+        Returns:
+            Decorrelated residuals, same shape
+        """
+        return np.asarray(residuals, dtype=float) @ self.whitening.T
+    
+    def chi_squared(self, residuals: np.ndarray) -> np.ndarray:
+        """
+        χ² = rᵀ C⁻¹ r for every residual vector.
+        
+        Args:
+            residuals: Array of shape (..., len(keys))
+        
+        Returns:
+            Array of shape (...)
+        """
+        z = self.whiten(residuals)
+        return np.einsum('...i,...i->...', z, z)
+
+
+@dataclass(frozen=True)
+class EditionDiff:
+    """Constants that changed between two dataset editions."""
+    old: str
+    new: str
+    value_changed: Tuple[str, ...] = ()
+    uncertainty_changed: Tuple[str, ...] = ()
+    
+    @property
+    def changed(self) -> Tuple[str, ...]:
+        """Keys whose value or uncertainty changed."""
+        return self.value_changed + tuple(
+            k for k in self.uncertainty_changed if k not in self.value_changed
+        )
+    
+    def to_dict(self) -> Dict:
+        return {
+            'old': self.old,
+            'new': self.new,
+            'value_changed': list(self.value_changed),
+            'uncertainty_changed': list(self.uncertainty_changed),
+        }
+
+
+# Module-level instance shared by all components
 _default_database: Optional[ExperimentalDatabase] = None
+_default_database_lock = threading.Lock()
 
 
 def get_database() -> ExperimentalDatabase:
     """
-    Get the default experimental database instance.
+    Get the shared, read-only experimental database instance.
+    
+    The database is loaded once per process (from the snapshot at
+    ``$IRH_EXPERIMENTAL_SNAPSHOT`` if set); concurrent first calls wait
+    for the same instance.
     
     Returns:
         ExperimentalDatabase singleton
     """
     global _default_database
     if _default_database is None:
-        _default_database = ExperimentalDatabase()
+        with _default_database_lock:
+            if _default_database is None:
+                _default_database = ExperimentalDatabase.from_environment()
     return _default_database
 
 
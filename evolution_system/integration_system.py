@@ -35,23 +35,25 @@ Date: 2026-01-08
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Any
 from enum import Enum
 import mpmath as mp
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+import itertools
 import json
-
-# Set precision for calculations
-mp.dps = 50
+import math
 
 # Import from sibling modules (relative import)
 # These imports may fail during standalone testing or when module is imported 
 # directly without the package structure, so we gracefully handle ImportError.
 try:
     from .calculation_engine import CalculationEngine, PredictionResult
+    from .prediction_set import PredictionSet
     from .validation_module import ValidationModule, ValidationResult
     from .ai_advisor import RefinementSuggestion, TopologicalModification, RefinementType
-    from .experimental_database import ExperimentalDatabase
+    from .experimental_database import ExperimentalDatabase, get_database
 except ImportError as e:
     # For standalone testing or direct script execution, these classes
     # must be imported separately. Log the missing imports for debugging.
@@ -142,10 +144,16 @@ class IntegrationResult:
     baseline_predictions: Dict[str, float] = field(default_factory=dict)
     refined_predictions: Dict[str, float] = field(default_factory=dict)
     
+    # Correlated χ² against experiment (IntegrationSystem(correlated=True) only)
+    baseline_chi_squared: Optional[float] = None
+    refined_chi_squared: Optional[float] = None
+    
     # Metadata
     test_timestamp: str = ""
     integration_timestamp: Optional[str] = None
     notes: List[str] = field(default_factory=list)
+    memoized: bool = False  # Taken from a RejectionMemo instead of tested
+    error: Optional[str] = None  # Exception raised while testing, if any
     
     @property
     def is_valid(self) -> bool:
@@ -171,10 +179,45 @@ class IntegrationResult:
             "symmetries_preserved": self.symmetries_preserved,
             "topological_origin_verified": self.topological_origin_verified,
             "topological_derivation": self.topological_derivation,
+            "baseline_chi_squared": self.baseline_chi_squared,
+            "refined_chi_squared": self.refined_chi_squared,
             "test_timestamp": self.test_timestamp,
             "integration_timestamp": self.integration_timestamp,
-            "notes": self.notes
+            "notes": self.notes,
+            "memoized": self.memoized,
+            "error": self.error
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'IntegrationResult':
+        """Rebuild a result from ``to_dict`` output (``is_valid`` is recomputed)."""
+        data = {key: value for key, value in data.items() if key != "is_valid"}
+        data["status"] = IntegrationStatus(data["status"])
+        if data.get("rejection_reason"):
+            data["rejection_reason"] = RejectionReason(data["rejection_reason"])
+        data["regression_tests"] = [RegressionTestResult(**r) for r in data.get("regression_tests", [])]
+        data["symmetry_checks"] = [SymmetryCheck(**c) for c in data.get("symmetry_checks", [])]
+        return cls(**data)
+    
+    @classmethod
+    def from_error(cls, modification: TopologicalModification, error: BaseException) -> 'IntegrationResult':
+        """Rejected result recording an exception raised while testing ``modification``."""
+        result = cls(
+            refinement_name=getattr(modification, 'name', repr(modification)),
+            status=IntegrationStatus.REJECTED,
+            rejection_reason=RejectionReason.NUMERICAL_INSTABILITY,
+            test_timestamp=datetime.now().isoformat(),
+            error=str(error),
+        )
+        result.notes.append(f"Error during testing: {error}")
+        return result
+
+
+def _float_value(predictions: Mapping[str, PredictionResult], key: str) -> float:
+    """float value of ``key``, read from the float64 column of a PredictionSet."""
+    if isinstance(predictions, PredictionSet):
+        return predictions.value(key)
+    return float(predictions[key].value)
 
 
 class IsolatedTestEnvironment:
@@ -188,55 +231,41 @@ class IsolatedTestEnvironment:
     def __init__(self):
         """Initialize isolated test environment."""
         self._baseline_engine = CalculationEngine()
-        self._baseline_predictions: Optional[Dict[str, PredictionResult]] = None
+        self._baseline_predictions: Optional[PredictionSet] = None
         
-    def setup_baseline(self) -> Dict[str, PredictionResult]:
+    def setup_baseline(self) -> PredictionSet:
         """Compute and cache baseline predictions."""
         if self._baseline_predictions is None:
-            self._baseline_predictions = self._baseline_engine.compute_all_predictions()
+            self._baseline_predictions = PredictionSet.from_predictions(
+                self._baseline_engine.compute_all_predictions()
+            )
         return self._baseline_predictions
     
     def compute_refined_predictions(
         self, 
         refinement: TopologicalModification
-    ) -> Dict[str, PredictionResult]:
+    ) -> PredictionSet:
         """
         Compute predictions with the proposed refinement applied.
         
-        This creates a modified calculation engine that incorporates
-        the refinement, while preserving the original baseline.
+        The result is a copy-on-write overlay of the baseline: only the
+        affected observables are stored, everything else is shared.
         """
         # Get baseline predictions
         baseline = self.setup_baseline()
         
-        # Create refined predictions by applying the modification
-        refined = {}
-        
-        for name, pred in baseline.items():
-            # Check if this observable is affected by the refinement
-            if name in refinement.affected_observables:
-                # Apply the refinement correction
-                correction = self._compute_correction(refinement, name, pred.value)
-                refined_value = float(pred.value) * correction
-                
-                refined[name] = PredictionResult(
-                    name=name,
-                    value=mp.mpf(refined_value),
-                    unit=pred.unit,
-                    derivation_method=f"{pred.derivation_method} + {refinement.name}",
-                    topological_origin=pred.topological_origin,
-                    precision_level=pred.precision_level,
-                    metadata={
-                        **pred.metadata,
-                        "refinement_applied": refinement.name,
-                        "correction_factor": correction
-                    }
-                )
-            else:
-                # Unchanged prediction
-                refined[name] = pred
+        values = {}
+        corrections = {}
+        for name in refinement.affected_observables:
+            # Observables without a prediction are not affected
+            if name not in baseline:
+                continue
+            base_value = baseline[name].value
+            correction = self._compute_correction(refinement, name, base_value)
+            values[name] = float(base_value) * correction
+            corrections[name] = correction
         
-        return refined
+        return baseline.with_values(values, label=refinement.name, corrections=corrections)
     
     def _compute_correction(
         self, 
@@ -252,12 +281,18 @@ class IsolatedTestEnvironment:
         
         Note: These are first-order approximations for testing purposes.
         Full implementations would require more detailed calculations.
+        Modifications carrying closed-form ``correction_factors`` (template
+        families) use those instead.
         """
+        if refinement.correction_factors:
+            return refinement.correction_factors.get(observable, 1.0)
+        
         # Default correction factor (no change)
         correction = 1.0
         
-        # Apply refinement based on type
-        rtype = refinement.refinement_type
+        # Apply refinement based on type (by value, so members of a reloaded
+        # ai_advisor module still match)
+        rtype = RefinementType(refinement.refinement_type.value)
         
         if rtype == RefinementType.CHERN_CLASS_CORRECTION:
             # α_refined = α_base × [1 + κ × C₂(G) / dim(G)]
@@ -329,17 +364,22 @@ class RegressionTester:
     (higher σ-deviation from experiment) compared to baseline.
     """
     
-    def __init__(self, sigma_tolerance: float = 0.5):
+    def __init__(
+        self,
+        sigma_tolerance: float = 0.5,
+        experimental_db: Optional[ExperimentalDatabase] = None
+    ):
         """
         Initialize regression tester.
         
         Args:
             sigma_tolerance: Maximum allowed increase in σ-deviation.
                            Default 0.5σ allows small fluctuations.
+            experimental_db: Experimental values (default: shared get_database())
         """
         self.sigma_tolerance = sigma_tolerance
-        self._db = ExperimentalDatabase()
-        self._validator = ValidationModule()
+        self._db = experimental_db or get_database()
+        self._validator = ValidationModule(self._db)
     
     def test_all(
         self,
@@ -362,26 +402,26 @@ class RegressionTester:
         results = []
         regressions = 0
         
-        # Get all observables to test (exclude targets)
-        all_observables = set(baseline.keys()) | set(refined.keys())
-        non_target = all_observables - set(target_observables)
+        # Get all observables to test (exclude targets), in baseline order
+        targets = set(target_observables)
+        non_target = [obs for obs in baseline if obs not in targets]
         
         for obs in non_target:
-            if obs not in baseline or obs not in refined:
+            if obs not in refined:
                 continue
                 
             # Get experimental value if available
             try:
                 exp_data = self._db.get(obs)
-                exp_value = exp_data.value
-                exp_uncertainty = exp_data.uncertainty
+                exp_value = float(exp_data.value)
+                exp_uncertainty = float(exp_data.uncertainty)
             except KeyError:
                 # No experimental data for comparison
                 continue
             
             # Compute σ-deviations
-            baseline_val = float(baseline[obs].value)
-            refined_val = float(refined[obs].value)
+            baseline_val = _float_value(baseline, obs)
+            refined_val = _float_value(refined, obs)
             
             baseline_sigma = abs(baseline_val - exp_value) / exp_uncertainty
             refined_sigma = abs(refined_val - exp_value) / exp_uncertainty
@@ -572,16 +612,32 @@ class IntegrationSystem:
     and topological verification.
     """
     
-    def __init__(self, sigma_tolerance: float = 0.5):
+    def __init__(
+        self,
+        sigma_tolerance: float = 0.5,
+        experimental_db: Optional[ExperimentalDatabase] = None,
+        correlated: bool = False,
+        rejection_memo: Optional['RejectionMemo'] = None
+    ):
         """
         Initialize the Integration System.
         
         Args:
             sigma_tolerance: Maximum allowed increase in σ-deviation
                            for non-target predictions.
+            experimental_db: Experimental values (default: shared get_database())
+            correlated: Record the correlated χ² of the baseline and refined
+                        predictions on every IntegrationResult
+            rejection_memo: Refinements rejected against the same baseline
+                            before are not tested again by
+                            test_refinements_parallel (see rejection_memo)
         """
+        self.db = experimental_db or get_database()
+        self.correlated = correlated
+        self.rejection_memo = rejection_memo
+        self._validator = ValidationModule(self.db)
         self.test_env = IsolatedTestEnvironment()
-        self.regression_tester = RegressionTester(sigma_tolerance)
+        self.regression_tester = RegressionTester(sigma_tolerance, self.db)
         self.symmetry_checker = SymmetryChecker()
         self.topological_verifier = TopologicalVerifier()
         
@@ -620,12 +676,15 @@ class IntegrationSystem:
             refined = self.test_env.compute_refined_predictions(modification)
             
             # Store predictions
-            result.baseline_predictions = {
-                k: float(v.value) for k, v in baseline.items()
-            }
-            result.refined_predictions = {
-                k: float(v.value) for k, v in refined.items()
-            }
+            result.baseline_predictions = baseline.to_floats()
+            result.refined_predictions = refined.to_floats()
+            if self.correlated:
+                chi_squared = self._validator.chi_squared({
+                    key: [value, result.refined_predictions[key]]
+                    for key, value in result.baseline_predictions.items()
+                }).chi_squared
+                result.baseline_chi_squared = float(chi_squared[0])
+                result.refined_chi_squared = float(chi_squared[1])
             
             # Step 2: Check if target predictions improved
             target_improved, improvement_pct = self._check_target_improvement(
@@ -653,45 +712,362 @@ class IntegrationSystem:
                 result.notes.append(f"Found {regressions} regression(s) in non-target predictions")
                 return result
             
-            # Step 4: Symmetry checks
-            symmetry_checks = self.symmetry_checker.check_all(modification, refined)
-            result.symmetry_checks = symmetry_checks
-            result.symmetries_preserved = all(s.preserved for s in symmetry_checks)
-            
-            if not result.symmetries_preserved:
-                result.status = IntegrationStatus.REJECTED
-                result.rejection_reason = RejectionReason.SYMMETRY_VIOLATION
-                violated = [s.symmetry_name for s in symmetry_checks if not s.preserved]
-                result.notes.append(f"Symmetry violations: {', '.join(violated)}")
-                return result
-            
-            # Step 5: Topological verification
-            is_topological, derivation = self.topological_verifier.verify(modification)
-            result.topological_origin_verified = is_topological
-            result.topological_derivation = derivation
-            
-            if not is_topological:
-                result.status = IntegrationStatus.REJECTED
-                result.rejection_reason = RejectionReason.NOT_TOPOLOGICAL
-                result.notes.append("Refinement lacks clear topological origin (Directive A)")
-                return result
-            
-            # All checks passed!
-            result.status = IntegrationStatus.VALIDATED
-            result.notes.append("Refinement passed all validation criteria")
-            result.notes.append(f"Target improvement: {improvement_pct:.2f}%")
-            result.notes.append(f"Regression tests passed: {len(regression_results)}")
+            # Steps 4-5: Symmetry checks and topological verification
+            self._check_symmetries_and_origin(result, modification, refined)
             
         except Exception as e:
             result.status = IntegrationStatus.REJECTED
             result.rejection_reason = RejectionReason.NUMERICAL_INSTABILITY
+            result.error = str(e)
             result.notes.append(f"Error during testing: {str(e)}")
         
-        # Store in history
-        self._integration_history.append(result)
+        finally:
+            # Store in history (rejections included)
+            self._integration_history.append(result)
         
         return result
     
+    def _check_symmetries_and_origin(
+        self,
+        result: IntegrationResult,
+        modification: TopologicalModification,
+        refined: Mapping[str, PredictionResult]
+    ):
+        """Run symmetry checks and topological verification, then set the final status."""
+        # Step 4: Symmetry checks
+        symmetry_checks = self.symmetry_checker.check_all(modification, refined)
+        result.symmetry_checks = symmetry_checks
+        result.symmetries_preserved = all(s.preserved for s in symmetry_checks)
+        
+        if not result.symmetries_preserved:
+            result.status = IntegrationStatus.REJECTED
+            result.rejection_reason = RejectionReason.SYMMETRY_VIOLATION
+            violated = [s.symmetry_name for s in symmetry_checks if not s.preserved]
+            result.notes.append(f"Symmetry violations: {', '.join(violated)}")
+            return
+        
+        # Step 5: Topological verification
+        is_topological, derivation = self.topological_verifier.verify(modification)
+        result.topological_origin_verified = is_topological
+        result.topological_derivation = derivation
+        
+        if not is_topological:
+            result.status = IntegrationStatus.REJECTED
+            result.rejection_reason = RejectionReason.NOT_TOPOLOGICAL
+            result.notes.append("Refinement lacks clear topological origin (Directive A)")
+            return
+        
+        # All checks passed!
+        result.status = IntegrationStatus.VALIDATED
+        result.notes.append("Refinement passed all validation criteria")
+        result.notes.append(f"Target improvement: {result.target_improvement_pct:.2f}%")
+        result.notes.append(f"Regression tests passed: {len(result.regression_tests)}")
+    
+    def test_refinements_batch(
+        self,
+        suggestions: Sequence[RefinementSuggestion]
+    ) -> List[IntegrationResult]:
+        """
+        Test many refinements in one vectorized pass.
+        
+        Builds the [refinement × observable] correction-factor matrix once,
+        applies it to the baseline value vector and computes target
+        improvements and regression σ for all candidates with NumPy. The
+        results (and history entries) are identical to calling
+        test_refinement on each suggestion in turn; an exception raised
+        for one suggestion only rejects that suggestion (``error`` set).
+        
+        Args:
+            suggestions: RefinementSuggestions to test
+        
+        Returns:
+            IntegrationResult per suggestion, in input order
+        """
+        baseline = self.test_env.setup_baseline()
+        keys = list(baseline)
+        column = {key: j for j, key in enumerate(keys)}
+        base_values = baseline.values
+        n_rows, n_cols = len(suggestions), len(keys)
+        
+        # Experimental data per observable (NaN where unavailable)
+        plan = self.db.validation_plan(keys)
+        exp_value = plan.values
+        exp_uncertainty = plan.uncertainties
+        has_exp = plan.has_experiment
+        
+        # Correction matrix and ordered target columns per refinement
+        corrections = np.ones((n_rows, n_cols))
+        is_target = np.zeros((n_rows, n_cols), dtype=bool)
+        target_columns: List[List[int]] = []
+        scalar_rows = set()
+        for i, suggestion in enumerate(suggestions):
+            modification = suggestion.modification
+            try:
+                for name in modification.affected_observables:
+                    if name in column:
+                        corrections[i, column[name]] = self.test_env._compute_correction(
+                            modification, name, baseline[name].value
+                        )
+                is_target[i, [column[t] for t in modification.affected_observables if t in column]] = True
+                target_columns.append([
+                    column[t] for t in modification.affected_observables
+                    if t in column and has_exp[column[t]]
+                ])
+            except Exception:
+                # Reproduce the scalar path's error handling exactly
+                scalar_rows.add(i)
+                corrections[i] = 1.0
+                is_target[i] = False
+                if len(target_columns) == i:
+                    target_columns.append([])
+        refined_values = base_values * corrections
+        
+        if self.correlated:
+            try:
+                # Row 0: baseline, row i + 1: refinement i (one cached factorization)
+                chi_squared = self._validator.chi_squared({
+                    key: np.concatenate(([base_values[j]], refined_values[:, j]))
+                    for j, key in enumerate(keys)
+                }).chi_squared
+            except Exception:
+                # The scalar path isolates the failing refinement(s)
+                scalar_rows.update(range(n_rows))
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Target improvement: mean relative-error reduction in %
+            baseline_error = np.abs(base_values - exp_value) / exp_value
+            refined_error = np.abs(refined_values - exp_value) / exp_value
+            improvement = (baseline_error - refined_error) / baseline_error * 100
+                
+            # Regression σ for every observable
+            baseline_sigma = np.abs(base_values - exp_value) / exp_uncertainty
+            refined_sigma = np.abs(refined_values - exp_value) / exp_uncertainty
+        sigma_change = baseline_sigma - refined_sigma
+        passed = sigma_change >= -self.regression_tester.sigma_tolerance
+        
+        # Sum target improvements in the scalar path's order
+        width = max((len(cols) for cols in target_columns), default=0)
+        total = np.zeros(n_rows)
+        for k in range(width):
+            for i, cols in enumerate(target_columns):
+                if k < len(cols):
+                    total[i] = total[i] + improvement[i, cols[k]]
+        
+        baseline_floats = baseline.to_floats()
+        results = []
+        for i, suggestion in enumerate(suggestions):
+            cols = target_columns[i]
+            checked = np.flatnonzero(~is_target[i] & has_exp)
+            if (i in scalar_rows or np.any(baseline_error[cols] == 0)
+                    or np.any(exp_uncertainty[checked] == 0)):
+                # Exceptions (e.g. division by zero) are handled by the scalar path
+                try:
+                    results.append(self.test_refinement(suggestion))
+                except Exception as e:
+                    result = IntegrationResult.from_error(getattr(suggestion, 'modification', suggestion), e)
+                    self._integration_history.append(result)
+                    results.append(result)
+                continue
+                
+            try:
+                modification = suggestion.modification
+                result = IntegrationResult(
+                    refinement_name=modification.name,
+                    status=IntegrationStatus.TESTING,
+                    test_timestamp=datetime.now().isoformat()
+                )
+                result.baseline_predictions = dict(baseline_floats)
+                result.refined_predictions = dict(zip(keys, refined_values[i].tolist()))
+                if self.correlated:
+                    result.baseline_chi_squared = float(chi_squared[0])
+                    result.refined_chi_squared = float(chi_squared[i + 1])
+                
+                if cols:
+                    avg_improvement = float(total[i]) / len(cols)
+                    result.target_improved = avg_improvement > 0
+                    result.target_improvement_pct = avg_improvement
+                else:
+                    result.target_improved, result.target_improvement_pct = False, 0.0
+                
+                if not result.target_improved:
+                    result.status = IntegrationStatus.REJECTED
+                    result.rejection_reason = RejectionReason.NO_IMPROVEMENT
+                    result.notes.append("Refinement did not improve target predictions")
+                else:
+                    result.regression_tests = [
+                        RegressionTestResult(
+                            observable=keys[j],
+                            baseline_sigma=float(baseline_sigma[j]),
+                            refined_sigma=float(refined_sigma[i, j]),
+                            passed=bool(passed[i, j]),
+                            improvement=float(sigma_change[i, j])
+                        )
+                        for j in checked
+                    ]
+                    result.regressions_found = int(np.count_nonzero(~passed[i, checked]))
+                
+                    if result.regressions_found > 0:
+                        result.status = IntegrationStatus.REJECTED
+                        result.rejection_reason = RejectionReason.REGRESSION
+                        result.notes.append(
+                            f"Found {result.regressions_found} regression(s) in non-target predictions"
+                        )
+                    else:
+                        refined = baseline.with_values(
+                            {keys[j]: refined_values[i, j] for j in np.flatnonzero(is_target[i])},
+                            label=modification.name,
+                        )
+                        self._check_symmetries_and_origin(result, modification, refined)
+            except Exception as e:
+                result = IntegrationResult.from_error(modification, e)
+            
+            self._integration_history.append(result)
+            results.append(result)
+        
+        return results
+    
+    def test_modifications(
+        self,
+        modifications: Iterable[TopologicalModification],
+        batch_size: int = 256
+    ) -> Iterator[IntegrationResult]:
+        """
+        Test a stream of modifications in batches, lazily.
+        
+        Pulls ``batch_size`` modifications at a time from the iterable
+        (e.g. template_families.iter_family_modifications) and tests them
+        with test_refinements_batch, so the stream is never materialized.
+        
+        Args:
+            modifications: Modifications to test (any iterable)
+            batch_size: Modifications per vectorized batch
+        
+        Yields:
+            IntegrationResult per modification, in input order
+        """
+        modifications = iter(modifications)
+        while True:
+            batch = list(itertools.islice(modifications, batch_size))
+            if not batch:
+                return
+            yield from self.test_refinements_batch(_as_suggestions(batch))
+    
+    def test_refinements_parallel(
+        self,
+        suggestions: Sequence[RefinementSuggestion],
+        workers: int,
+        chunk_size: Optional[int] = None
+    ) -> List[IntegrationResult]:
+        """
+        Test refinements on a pool of worker processes.
+        
+        Only the TopologicalModifications are sent to the workers. Each
+        worker builds its own IntegrationSystem once (with this system's
+        tolerance, correlated mode and database edition), computes the baseline
+        once and tests its chunks with test_refinements_batch. Results are
+        collected (and appended to the history) in suggestion order, so
+        they are identical to a serial run.
+        
+        With a ``rejection_memo``, refinements rejected against the same
+        baseline before are returned from the memo (``memoized`` set,
+        reported under the suggestion's name) and new rejections are
+        recorded. Memoized and tested results enter the history together,
+        in suggestion order.
+        
+        Args:
+            suggestions: RefinementSuggestions to test
+            workers: Number of worker processes (<= 1 tests in-process)
+            chunk_size: Modifications per task (default: ~4 tasks per worker)
+        
+        Returns:
+            IntegrationResult per suggestion, in input order
+        """
+        if self.rejection_memo is None:
+            results = self._test_in_pool(suggestions, workers, chunk_size)
+            self._integration_history.extend(results)
+            return results
+        
+        # Known rejections are answered from the memo, the rest is tested
+        memo = self.rejection_memo
+        baseline_key = self.baseline_key()
+        known = memo.lookup(baseline_key, [s.modification for s in suggestions])
+        pending = [s for i, s in enumerate(suggestions) if i not in known]
+        tested = self._test_in_pool(pending, workers, chunk_size)
+        memo.record(baseline_key, zip([s.modification for s in pending], tested))
+        
+        tested = iter(tested)
+        results = []
+        for i in range(len(suggestions)):
+            if i in known:
+                # The memo matches by structure: report the current name
+                result = known[i]
+                result.refinement_name = suggestions[i].modification.name
+                result.test_timestamp = datetime.now().isoformat()
+                result.memoized = True
+                result.notes.append("Skipped: rejected against the same baseline before")
+            else:
+                result = next(tested)
+            results.append(result)
+        self._integration_history.extend(results)
+        return results
+    
+    def baseline_key(self) -> str:
+        """
+        Fingerprint of the baseline and the settings that decide test outcomes.
+        
+        Returns:
+            SHA-256 hex digest (see rejection_memo.baseline_fingerprint)
+        """
+        from .rejection_memo import baseline_fingerprint
+        return baseline_fingerprint(
+            self.test_env.setup_baseline(),
+            sigma_tolerance=self.regression_tester.sigma_tolerance,
+            data_version=self.db.data_version,
+            correlated=self.correlated,
+        )
+    
+    def _test_in_pool(
+        self,
+        suggestions: Sequence[RefinementSuggestion],
+        workers: int,
+        chunk_size: Optional[int]
+    ) -> List[IntegrationResult]:
+        """
+        Test refinements on a process pool (see test_refinements_parallel).
+        
+        The history is left to the caller, which records the results in
+        suggestion order.
+        """
+        if workers <= 1 or len(suggestions) < 2:
+            start = len(self._integration_history)
+            results = self.test_refinements_batch(suggestions)
+            del self._integration_history[start:]
+            return results
+        
+        modifications = [s.modification for s in suggestions]
+        if chunk_size is None:
+            chunk_size = max(1, math.ceil(len(modifications) / (workers * 4)))
+        chunks = [
+            modifications[i:i + chunk_size]
+            for i in range(0, len(modifications), chunk_size)
+        ]
+        
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(chunks)),
+            initializer=_init_parallel_worker,
+            initargs=(self.regression_tester.sigma_tolerance, self.correlated, self.db)
+        ) as pool:
+            futures = [pool.submit(_test_parallel_chunk, chunk) for chunk in chunks]
+            results = []
+            for chunk, future in zip(chunks, futures):
+                try:
+                    results.extend(future.result())
+                except Exception as e:
+                    # A lost worker (or unpicklable chunk) only rejects its own chunk
+                    results.extend(IntegrationResult.from_error(m, e) for m in chunk)
+        
+        return results
+    
     def _check_target_improvement(
         self,
         baseline: Dict[str, PredictionResult],
@@ -699,7 +1075,7 @@ class IntegrationSystem:
         targets: List[str]
     ) -> Tuple[bool, float]:
         """Check if target predictions improved."""
-        db = ExperimentalDatabase()
+        db = self.db
         
         total_improvement = 0.0
         count = 0
@@ -710,13 +1086,12 @@ class IntegrationSystem:
             
             try:
                 exp_data = db.get(target)
-                exp_value = exp_data.value
-                exp_uncertainty = exp_data.uncertainty
+                exp_value = float(exp_data.value)
             except KeyError:
                 continue
             
-            baseline_val = float(baseline[target].value)
-            refined_val = float(refined[target].value)
+            baseline_val = _float_value(baseline, target)
+            refined_val = _float_value(refined, target)
             
             baseline_error = abs(baseline_val - exp_value) / exp_value
             refined_error = abs(refined_val - exp_value) / exp_value
@@ -857,3 +1232,50 @@ class IntegrationSystem:
             "valid_topological_sources": list(TopologicalVerifier.VALID_SOURCES.keys()),
             "history_count": len(self._integration_history)
         }
+
+
+# Per-process IntegrationSystem of a test_refinements_parallel worker
+_worker_system: Optional[IntegrationSystem] = None
+
+
+def _init_parallel_worker(
+    sigma_tolerance: float,
+    correlated: bool = False,
+    experimental_db: Optional[ExperimentalDatabase] = None
+):
+    """Build the worker's IntegrationSystem (parent's settings and data) and its baseline."""
+    global _worker_system
+    _worker_system = IntegrationSystem(
+        sigma_tolerance, experimental_db=experimental_db, correlated=correlated
+    )
+    _worker_system.test_env.setup_baseline()
+
+
+def _as_suggestions(
+    modifications: Sequence[TopologicalModification]
+) -> List[RefinementSuggestion]:
+    """Bare RefinementSuggestions wrapping modifications for batch testing."""
+    return [
+        RefinementSuggestion(
+            modification=m,
+            error_pattern="",
+            justification="",
+            implementation_notes="",
+            validation_criteria=[],
+            risk_assessment=""
+        )
+        for m in modifications
+    ]
+
+
+def _test_parallel_chunk(
+    modifications: List[TopologicalModification]
+) -> List[IntegrationResult]:
+    """Test a chunk of modifications in a worker process."""
+    try:
+        results = _worker_system.test_refinements_batch(_as_suggestions(modifications))
+    except Exception as e:
+        results = [IntegrationResult.from_error(m, e) for m in modifications]
+    # The parent keeps the history
+    _worker_system._integration_history.clear()
+    return results
@@ -0,0 +1,111 @@
+"""
+Interval Arithmetic for IRH Theory Evolution System
+===================================================
+
+Certified evaluation of predictions with mpmath interval arithmetic.
+
+**Components:**
+- IntervalContext: private ``mp.iv``-style context usable by CalculationEngine
+- sigma_enclosure: rigorous bounds on the σ-deviation of an enclosure
+
+With ``CalculationEngine(interval=True)`` every compute_* path runs in an
+IntervalContext. PredictionResult then stores the rigorous enclosure in
+``enclosure`` and its midpoint in ``value``; ValidationModule certifies an
+agreement status whenever the whole σ-interval falls into one bucket.
+
+Usage:
+------
+```python
+from evolution_system import CalculationEngine, ValidationModule
+
+engine = CalculationEngine(precision=20, interval=True)
+predictions = engine.compute_all_predictions()
+lo, hi = predictions['alpha_inv'].enclosure
+
+report = ValidationModule().validate_all(predictions)
+undecided = report.get_uncertified()   # recompute these at higher precision
+```
+"""
+
+from typing import Any, Tuple
+
+import mpmath as mp
+from mpmath import libmp
+from mpmath.ctx_iv import MPIntervalContext, ivmpf, ivmpf_constant
+
+
+class _MidpointFloat:
+    """float() of an interval returns its midpoint (used only for metadata)."""
+
+    def __float__(self):
+        return libmp.to_float(libmp.mpi_mid(self._mpi_, 53))
+
+
+class IntervalContext(MPIntervalContext):
+    """
+    mpmath interval context with its own precision.
+
+    Differs from ``mp.iv`` in two ways needed by CalculationEngine:
+    ``float()`` of an interval gives its midpoint (components are
+    informational floats), and ``acos`` is provided through ``atan2``.
+    """
+
+    def __init__(ctx, dps: int = 50):
+        MPIntervalContext.__init__(ctx)
+        ctx.mpf = type('ivmpf', (_MidpointFloat, ivmpf), {})
+        ctx._constant = type('ivmpf_constant', (_MidpointFloat, ivmpf_constant), {})
+        ctx._types = (ctx.mpf, ctx.mpc)
+        ctx._constant._ctxdata = ctx.mpf._ctxdata = [ctx.mpf, object.__new__, ctx._prec]
+        ctx._constant.ctx = ctx.mpf.ctx = ctx
+        ctx._init_builtins()
+        ctx.dps = dps
+
+    def acos(ctx, x: Any):
+        """Enclosure of arccos(x) for x in [-1, 1]."""
+        x = ctx.convert(x)
+        return ctx.atan2(ctx.sqrt(1 - x * x), x)
+
+
+def is_interval(value: Any) -> bool:
+    """True for real mpmath intervals."""
+    return hasattr(value, '_mpi_')
+
+
+def split_interval(value: Any) -> Tuple[mp.mpf, mp.mpf, mp.mpf]:
+    """
+    Return (lower, midpoint, upper) of an interval as exact mpf values.
+
+    The endpoints are copied bit-for-bit, not rounded to the global
+    mpmath precision.
+    """
+    lower, upper = value._mpi_
+    prec = max(value.ctx.prec, 53)
+    mid = libmp.mpi_mid(value._mpi_, prec)
+    return mp.mp.make_mpf(lower), mp.mp.make_mpf(mid), mp.mp.make_mpf(upper)
+
+
+def sigma_enclosure(
+    enclosure: Tuple[mp.mpf, mp.mpf],
+    exp_value: mp.mpf,
+    exp_uncertainty: mp.mpf,
+) -> Tuple[float, float]:
+    """
+    Rigorous bounds on |theory - exp| / uncertainty for theory in ``enclosure``.
+
+    Args:
+        enclosure: (lower, upper) bounds of the theoretical value
+        exp_value: Experimental central value
+        exp_uncertainty: Experimental standard uncertainty (> 0)
+
+    Returns:
+        (σ_min, σ_max), rounded outward to float
+    """
+    lower, upper = enclosure
+    iv = mp.iv
+    theory = iv.mpf([lower, upper])
+    distance = abs(theory - iv.mpf(exp_value)) / iv.mpf(exp_uncertainty)
+    sigma_min, sigma_max = distance._mpi_
+    return (
+        libmp.to_float(sigma_min, rnd=libmp.round_floor),
+        libmp.to_float(sigma_max, rnd=libmp.round_ceiling),
+    )
@@ -0,0 +1,138 @@
+"""
+Prediction Cache for IRH Theory Evolution System
+================================================
+
+Persistent, content-addressed on-disk cache of CalculationEngine results.
+
+**Features:**
+- SQLite store shared safely between processes
+- Entries keyed by a SHA-256 fingerprint of the derivation source code,
+  the engine's constants and inputs, the precision and the arithmetic mode
+- Values stored with their exact mpf bits (no decimal round-trip)
+- Automatic invalidation: editing the derivation code changes the key
+
+The cache is opt-in. Set ``IRH_PREDICTION_CACHE`` to a file path (or pass
+``cache=PredictionCache(path)`` to CalculationEngine) and every engine
+reuses baseline predictions computed by earlier processes.
+
+Usage:
+------
+```python
+from evolution_system import CalculationEngine
+from evolution_system.prediction_cache import PredictionCache
+
+cache = PredictionCache('.cache/irh-predictions.sqlite')
+engine = CalculationEngine(cache=cache)
+predictions = engine.compute_all_predictions()   # computed once, then reused
+```
+
+```bash
+export IRH_PREDICTION_CACHE=.cache/irh-predictions.sqlite
+python demo_evolution_cycle.py                   # warm runs skip the baseline
+python -m evolution_system.evolution_cycle --prediction-cache .cache/p.sqlite
+```
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+import mpmath as mp
+
+# Modules whose source defines the cached derivations
+_SOURCE_FILES = ('calculation_engine.py', 'interval_arithmetic.py')
+
+
+def source_fingerprint() -> str:
+    """SHA-256 of the derivation source files and the mpmath version."""
+    digest = hashlib.sha256(mp.__version__.encode())
+    package_dir = Path(__file__).resolve().parent
+    for name in _SOURCE_FILES:
+        digest.update(name.encode())
+        digest.update((package_dir / name).read_bytes())
+    return digest.hexdigest()
+
+
+def fingerprint_value(value: Any) -> str:
+    """Exact, context-independent representation of a number for hashing."""
+    for raw in ('_mpf_', '_mpc_', '_mpi_'):
+        if hasattr(value, raw):
+            return f"{raw}{getattr(value, raw)!r}"
+    return repr(value)
+
+
+class PredictionCache:
+    """
+    SQLite-backed store of serialized PredictionResults.
+
+    Records are JSON documents produced by ``PredictionResult.to_record``,
+    grouped under the engine fingerprint (``cache_key``).
+    """
+
+    ENV_VAR = 'IRH_PREDICTION_CACHE'
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Open (and create if necessary) the cache database.
+
+        Args:
+            path: SQLite file path
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS predictions ("
+                " cache_key TEXT NOT NULL,"
+                " key TEXT NOT NULL,"
+                " record TEXT NOT NULL,"
+                " PRIMARY KEY (cache_key, key))"
+            )
+
+    @classmethod
+    def from_environment(cls) -> Optional['PredictionCache']:
+        """Cache at ``$IRH_PREDICTION_CACHE``, or None if the variable is unset."""
+        path = os.environ.get(cls.ENV_VAR)
+        return cls(path) if path else None
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Connection committing on success and always closed afterwards."""
+        conn = sqlite3.connect(str(self.path), timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def load(self, cache_key: str) -> Dict[str, Dict]:
+        """All records stored under ``cache_key``, by prediction key."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT key, record FROM predictions WHERE cache_key = ?", (cache_key,)
+            ).fetchall()
+        return {key: json.loads(record) for key, record in rows}
+
+    def store(self, cache_key: str, records: Iterable[Tuple[str, Dict]]):
+        """Store (key, record) pairs under ``cache_key``."""
+        rows = [(cache_key, key, json.dumps(record)) for key, record in records]
+        if not rows:
+            return
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO predictions (cache_key, key, record) VALUES (?, ?, ?)",
+                rows,
+            )
+
+    def clear(self):
+        """Remove all entries."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM predictions")
+
+    def __len__(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM predictions").fetchone()[0]
@@ -0,0 +1,200 @@
+"""
+Prediction Sets for IRH Theory Evolution System
+===============================================
+
+Compact, array-backed container for a full set of predictions.
+
+**Features:**
+- Fixed key index shared by a baseline and all of its variants
+- Contiguous float64 value column (read-only) next to the exact
+  PredictionResults (mpf column) of the baseline
+- Copy-on-write overlays: a refined variant stores only the values it
+  changes, not a copy of the baseline
+- Refined PredictionResults (including their components) are only
+  materialized when accessed
+
+A PredictionSet is a read-only ``Mapping[str, PredictionResult]``, so it
+can be passed wherever a ``Dict[str, PredictionResult]`` is read.
+
+Usage:
+------
+```python
+from evolution_system import CalculationEngine
+from evolution_system.prediction_set import PredictionSet
+
+baseline = PredictionSet.from_predictions(CalculationEngine().compute_all_predictions())
+refined = baseline.with_values({'alpha_s': 0.1181}, label='Chern class correction')
+
+refined.value('alpha_s')        # 0.1181 (float64 column)
+refined['alpha_s']              # PredictionResult, built on first access
+refined['alpha_inv'] is baseline['alpha_inv']   # True: unchanged entries are shared
+refined.values                  # float64 array in key order
+```
+"""
+
+from dataclasses import replace
+from typing import Dict, Iterator, Mapping, Optional, Tuple
+
+import mpmath as mp
+import numpy as np
+
+from .calculation_engine import PredictionResult
+
+
+class _PredictionTable:
+    """Immutable baseline data shared by a PredictionSet and its overlays."""
+
+    __slots__ = ('keys', 'index', 'values', 'results')
+
+    def __init__(self, results: Mapping[str, PredictionResult]):
+        self.keys: Tuple[str, ...] = tuple(results)
+        self.index: Dict[str, int] = {key: i for i, key in enumerate(self.keys)}
+        self.values = np.array([float(results[key].value) for key in self.keys], dtype=np.float64)
+        self.values.flags.writeable = False
+        self.results: Tuple[PredictionResult, ...] = tuple(results[key] for key in self.keys)
+
+
+class PredictionSet(Mapping):
+    """
+    Read-only mapping of prediction key to PredictionResult.
+
+    A set is a shared baseline table plus an overlay of changed values
+    ``{index: (value, correction)}``; the baseline itself has an empty
+    overlay. Use ``with_values`` to derive variants.
+    """
+
+    __slots__ = ('_table', '_overlay', '_label', '_materialized')
+
+    def __init__(
+        self,
+        table: _PredictionTable,
+        overlay: Optional[Dict[int, Tuple[float, Optional[float]]]] = None,
+        label: Optional[str] = None,
+    ):
+        self._table = table
+        self._overlay = overlay or {}
+        self._label = label
+        self._materialized: Optional[Dict[int, PredictionResult]] = None
+
+    @classmethod
+    def from_predictions(cls, predictions: Mapping[str, PredictionResult]) -> 'PredictionSet':
+        """Build a baseline set; the PredictionResults are shared, not copied."""
+        if isinstance(predictions, PredictionSet):
+            return predictions
+        return cls(_PredictionTable(predictions))
+
+    # ------------------------------------------------------------------
+    # Mapping interface
+    # ------------------------------------------------------------------
+
+    def __getitem__(self, key: str) -> PredictionResult:
+        i = self._table.index[key]
+        if i not in self._overlay:
+            return self._table.results[i]
+        if self._materialized is None:
+            self._materialized = {}
+        if i not in self._materialized:
+            self._materialized[i] = self._materialize(i)
+        return self._materialized[i]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._table.keys)
+
+    def __len__(self) -> int:
+        return len(self._table.keys)
+
+    def __contains__(self, key) -> bool:
+        return key in self._table.index
+
+    def __repr__(self) -> str:
+        changed = f", {len(self._overlay)} overridden" if self._overlay else ""
+        return f"PredictionSet({len(self)} predictions{changed})"
+
+    # ------------------------------------------------------------------
+    # Array access
+    # ------------------------------------------------------------------
+
+    @property
+    def label(self) -> Optional[str]:
+        """Name of the refinement this variant represents (None for a baseline)."""
+        return self._label
+
+    @property
+    def overridden(self) -> Tuple[str, ...]:
+        """Keys whose value differs from the baseline, in key order."""
+        return tuple(self._table.keys[i] for i in sorted(self._overlay))
+
+    @property
+    def baseline(self) -> 'PredictionSet':
+        """The baseline set this variant is an overlay of."""
+        return PredictionSet(self._table) if self._overlay else self
+
+    @property
+    def values(self) -> np.ndarray:
+        """float64 values in key order (a read-only view for baselines)."""
+        if not self._overlay:
+            return self._table.values
+        values = self._table.values.copy()
+        for i, (value, _) in self._overlay.items():
+            values[i] = value
+        return values
+
+    def value(self, key: str) -> float:
+        """float64 value of ``key`` without materializing a PredictionResult."""
+        i = self._table.index[key]
+        if i in self._overlay:
+            return self._overlay[i][0]
+        return float(self._table.values[i])
+
+    def to_floats(self) -> Dict[str, float]:
+        """Plain ``{key: float}`` dictionary."""
+        return dict(zip(self._table.keys, self.values.tolist()))
+
+    # ------------------------------------------------------------------
+    # Variants
+    # ------------------------------------------------------------------
+
+    def with_values(
+        self,
+        values: Mapping[str, float],
+        label: Optional[str] = None,
+        corrections: Optional[Mapping[str, float]] = None,
+    ) -> 'PredictionSet':
+        """
+        Copy-on-write variant with some values replaced.
+
+        Args:
+            values: New float values keyed by prediction key
+            label: Refinement name recorded on the materialized results
+            corrections: Multiplicative correction factor per key (metadata)
+
+        Returns:
+            PredictionSet sharing the baseline table
+
+        Raises:
+            KeyError: If a key is not part of this set
+        """
+        corrections = corrections or {}
+        overlay = dict(self._overlay)
+        for key, value in values.items():
+            overlay[self._table.index[key]] = (float(value), corrections.get(key))
+        return PredictionSet(self._table, overlay, label if label is not None else self._label)
+
+    def _materialize(self, i: int) -> PredictionResult:
+        """Build the PredictionResult of an overridden entry."""
+        base = self._table.results[i]
+        value, correction = self._overlay[i]
+        components = dict(base.components)
+        if self._label is not None:
+            components['refinement_applied'] = self._label
+        if correction is not None:
+            components['correction_factor'] = correction
+        derivation = f"{base.derivation} + {self._label}" if self._label else base.derivation
+        return replace(
+            base,
+            value=mp.mpf(value),
+            derivation=derivation,
+            components=components,
+            enclosure=None,
+            is_exact=False,
+        )
@@ -0,0 +1,202 @@
+"""
+Rejection Memo for IRH Theory Evolution System
+==============================================
+
+Persistent record of refinements that were rejected, so later evolution
+cycles skip them instead of testing them again.
+
+**Features:**
+- Entries keyed by a fingerprint of the baseline predictions (exact mpf
+  bits) and of the testing context (σ tolerance, dataset edition,
+  correlated mode, integration source code)
+- Modifications identified by a structural hash: type, formula (which
+  carries the order, e.g. ``C_2``), affected observables, declared
+  symmetries and topological basis; names and prose are ignored
+- SQLite store shared between processes, or an in-process dict
+
+A memo entry only applies to an identical baseline: once predictions
+change (e.g. after an integration or an edit of the derivation code),
+every candidate is tested again.
+
+Usage:
+------
+```python
+from evolution_system import EvolutionCycle
+from evolution_system.rejection_memo import RejectionMemo
+
+cycle = EvolutionCycle(rejection_memo=RejectionMemo('.cache/irh-rejections.sqlite'))
+cycle.run_multiple(num_cycles=5)        # known rejections are skipped
+```
+
+```bash
+export IRH_REJECTION_MEMO=.cache/irh-rejections.sqlite
+python -m evolution_system.evolution_cycle --cycles 5
+```
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Mapping, Optional, Tuple, Union
+
+from .ai_advisor import TopologicalModification
+from .integration_system import IntegrationResult, IntegrationStatus
+from .prediction_cache import fingerprint_value
+
+# Modules whose source decides whether a refinement is rejected
+_SOURCE_FILES = ('integration_system.py',)
+
+
+def baseline_fingerprint(baseline: Mapping, **context) -> str:
+    """
+    SHA-256 of baseline predictions and the testing context.
+
+    Args:
+        baseline: Prediction key -> PredictionResult
+        **context: Further settings the test outcome depends on
+    """
+    digest = hashlib.sha256()
+    package_dir = Path(__file__).resolve().parent
+    for name in _SOURCE_FILES:
+        digest.update(name.encode())
+        digest.update((package_dir / name).read_bytes())
+    for name, value in sorted(context.items()):
+        digest.update(f"{name}={value!r}\n".encode())
+    for key in sorted(baseline):
+        digest.update(f"{key}={fingerprint_value(baseline[key].value)}\n".encode())
+    return digest.hexdigest()
+
+
+def modification_fingerprint(modification: TopologicalModification) -> str:
+    """Structural SHA-256 of a modification (``TopologicalModification.identity``)."""
+    return modification.identity
+
+
+class RejectionMemo:
+    """
+    Store of rejected IntegrationResults by (baseline, modification) fingerprint.
+
+    Records are the JSON documents of ``IntegrationResult.to_dict`` plus the
+    baseline and refined predictions. Without a path the memo lives in
+    memory and lasts as long as the object.
+    """
+
+    ENV_VAR = 'IRH_REJECTION_MEMO'
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """
+        Open (and create if necessary) the memo.
+
+        Args:
+            path: SQLite file path (None: in-process only)
+        """
+        self.path = Path(path) if path is not None else None
+        self._entries: Dict[Tuple[str, str], str] = {}
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self._connect() as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS rejections ("
+                    " baseline TEXT NOT NULL,"
+                    " modification TEXT NOT NULL,"
+                    " record TEXT NOT NULL,"
+                    " PRIMARY KEY (baseline, modification))"
+                )
+
+    @classmethod
+    def from_environment(cls) -> 'RejectionMemo':
+        """Memo at ``$IRH_REJECTION_MEMO``, or an in-process memo if unset."""
+        return cls(os.environ.get(cls.ENV_VAR) or None)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Connection committing on success and always closed afterwards."""
+        conn = sqlite3.connect(str(self.path), timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def lookup(
+        self,
+        baseline_key: str,
+        modifications: Iterable[TopologicalModification]
+    ) -> Dict[int, IntegrationResult]:
+        """
+        Earlier rejections of ``modifications`` against the same baseline.
+
+        Args:
+            baseline_key: ``baseline_fingerprint`` of the current baseline
+            modifications: Candidates, in order
+
+        Returns:
+            Rejected IntegrationResult by candidate position (hits only)
+        """
+        keys = [modification_fingerprint(m) for m in modifications]
+        if self.path is None:
+            records = {
+                key: self._entries[baseline_key, key]
+                for key in keys if (baseline_key, key) in self._entries
+            }
+        else:
+            with self._connect() as conn:
+                rows = conn.execute(
+                    "SELECT modification, record FROM rejections WHERE baseline = ?",
+                    (baseline_key,),
+                ).fetchall()
+            records = dict(rows)
+        return {
+            i: IntegrationResult.from_dict(json.loads(records[key]))
+            for i, key in enumerate(keys) if key in records
+        }
+
+    def record(
+        self,
+        baseline_key: str,
+        results: Iterable[Tuple[TopologicalModification, IntegrationResult]]
+    ) -> int:
+        """
+        Remember the rejected results among ``(modification, result)`` pairs.
+        
+        Results rejected because testing raised (``error`` set) are skipped.
+
+        Returns:
+            Number of rejections stored
+        """
+        rows = [
+            (baseline_key, modification_fingerprint(modification), json.dumps({
+                **result.to_dict(),
+                'baseline_predictions': result.baseline_predictions,
+                'refined_predictions': result.refined_predictions,
+            }))
+            for modification, result in results
+            # Errors may be transient (e.g. a lost worker): test again next time
+            if result.status == IntegrationStatus.REJECTED and result.error is None
+        ]
+        if self.path is None:
+            self._entries.update({(b, m): record for b, m, record in rows})
+        elif rows:
+            with self._connect() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO rejections (baseline, modification, record) "
+                    "VALUES (?, ?, ?)",
+                    rows,
+                )
+        return len(rows)
+
+    def clear(self):
+        """Remove all entries."""
+        self._entries.clear()
+        if self.path is not None:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM rejections")
+
+    def __len__(self) -> int:
+        if self.path is None:
+            return len(self._entries)
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM rejections").fetchone()[0]
@@ -0,0 +1,307 @@
+"""
+Sensitivity Analysis for IRH Theory Evolution System
+====================================================
+
+Analytic Jacobian d(prediction)/d(input) of every CalculationEngine
+prediction with respect to the engine's topological constants and
+derivation inputs, computed by forward-mode automatic differentiation
+in a single pass of the pipeline.
+
+**Components:**
+- Dual: mpmath value carrying its gradient with respect to all inputs
+- DualContext: arithmetic context for CalculationEngine on Dual numbers
+- Jacobian: derivatives of all predictions, with first-order estimates
+- compute_jacobian: seed the inputs and run the engine once
+
+The Jacobian predicts the effect of small input changes to first order
+without re-running the pipeline, which makes screening large batches of
+candidate changes cheap.
+
+Usage:
+------
+```python
+from evolution_system.sensitivity import compute_jacobian
+
+jac = compute_jacobian()
+print(jac.derivative('alpha_s', 'log_ratio_topological'))
+print(jac.predict_change({'correction_factor': 1e-3}))   # Δ per prediction
+matrix = jac.as_array()                                  # keys × inputs
+```
+"""
+
+import mpmath as mp
+import numpy as np
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .calculation_engine import CalculationEngine
+
+
+# Differentiable engine attributes that feed a derivation (n_strands is an
+# integer; hopf_ratio and a_weyl enter no prediction, their Jacobian
+# columns would be identically zero)
+SENSITIVITY_INPUTS: Tuple[str, ...] = (
+    'omega_tetrahedron',
+    'omega_S3_ref',
+    'eta',
+    'koide_Q',
+) + tuple(name for name in CalculationEngine.DERIVATION_INPUTS if name != 'n_strands')
+
+
+class Dual:
+    """
+    Forward-mode dual number: value plus gradient over all seeded inputs.
+
+    ``value`` and the entries of ``grad`` are numbers of the owning
+    DualContext's mpmath context. The ``_mpf_`` attribute lets
+    PredictionResult accept real Duals as mpmath values.
+    """
+
+    __slots__ = ('value', 'grad', 'ctx')
+
+    def __init__(self, ctx: 'DualContext', value: Any, grad: List[Any]):
+        self.ctx = ctx
+        self.value = value
+        self.grad = grad
+
+    def __repr__(self) -> str:
+        return f"Dual({self.value}, grad={[float(g) for g in self.grad]})"
+
+    @property
+    def _mpf_(self):
+        return self.value._mpf_
+
+    def __float__(self) -> float:
+        return float(self.value)
+
+    def _lift(self, other: Any) -> 'Dual':
+        if isinstance(other, Dual):
+            return other
+        return self.ctx.mpf(other)
+
+    def __add__(self, other):
+        other = self._lift(other)
+        return Dual(self.ctx, self.value + other.value,
+                    [a + b for a, b in zip(self.grad, other.grad)])
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        other = self._lift(other)
+        return Dual(self.ctx, self.value - other.value,
+                    [a - b for a, b in zip(self.grad, other.grad)])
+
+    def __rsub__(self, other):
+        return self._lift(other) - self
+
+    def __mul__(self, other):
+        other = self._lift(other)
+        u, v = self.value, other.value
+        return Dual(self.ctx, u * v,
+                    [a * v + u * b for a, b in zip(self.grad, other.grad)])
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        other = self._lift(other)
+        u, v = self.value, other.value
+        return Dual(self.ctx, u / v,
+                    [(a * v - u * b) / (v * v) for a, b in zip(self.grad, other.grad)])
+
+    def __rtruediv__(self, other):
+        return self._lift(other) / self
+
+    def __pow__(self, exponent):
+        if isinstance(exponent, Dual):
+            # d(u^w) = u^w · (w'·ln u + w·u'/u)
+            u, w = self.value, exponent.value
+            result = u ** w
+            log_u = self.ctx.base.log(u)
+            return Dual(self.ctx, result,
+                        [result * (b * log_u + w * a / u)
+                         for a, b in zip(self.grad, exponent.grad)])
+        slope = exponent * self.value ** (exponent - 1)
+        return Dual(self.ctx, self.value ** exponent, [slope * a for a in self.grad])
+
+    def __neg__(self):
+        return Dual(self.ctx, -self.value, [-a for a in self.grad])
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return self if self.value >= 0 else -self
+
+    def __eq__(self, other):
+        return self.value == self._lift(other).value
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __lt__(self, other):
+        return self.value < self._lift(other).value
+
+    def __le__(self, other):
+        return self.value <= self._lift(other).value
+
+    def __gt__(self, other):
+        return self.value > self._lift(other).value
+
+    def __ge__(self, other):
+        return self.value >= self._lift(other).value
+
+    __hash__ = None
+
+
+class DualContext:
+    """
+    Arithmetic context on Dual numbers over ``n_inputs`` seeded inputs.
+
+    Implements the subset of the mpmath context interface used by
+    CalculationEngine.compute_*; values are evaluated in a private
+    mpmath context of ``dps`` digits.
+    """
+
+    def __init__(self, n_inputs: int, dps: int = 50):
+        self.base = mp.MPContext()
+        self.base.dps = dps
+        self.n_inputs = n_inputs
+
+    @property
+    def dps(self) -> int:
+        return self.base.dps
+
+    def _zero_grad(self) -> List[Any]:
+        return [self.base.zero] * self.n_inputs
+
+    def mpf(self, value: Any) -> Dual:
+        """Constant (zero-gradient) Dual."""
+        if isinstance(value, Dual):
+            return value
+        return Dual(self, self.base.convert(value), self._zero_grad())
+
+    def seed(self, value: Any, index: int) -> Dual:
+        """Dual for independent input number ``index``."""
+        grad = self._zero_grad()
+        grad[index] = self.base.one
+        return Dual(self, self.base.convert(value), grad)
+
+    @property
+    def pi(self) -> Dual:
+        return self.mpf(+self.base.pi)
+
+    def acos(self, x: Any) -> Dual:
+        x = self.mpf(x)
+        slope = -1 / self.base.sqrt(1 - x.value ** 2)
+        return Dual(self, self.base.acos(x.value), [slope * a for a in x.grad])
+
+    def exp(self, x: Any) -> Dual:
+        x = self.mpf(x)
+        value = self.base.exp(x.value)
+        return Dual(self, value, [value * a for a in x.grad])
+
+    def log10(self, x: Any) -> Dual:
+        x = self.mpf(x)
+        scale = 1 / (x.value * self.base.ln10)
+        return Dual(self, self.base.log10(x.value), [scale * a for a in x.grad])
+
+    def factorial(self, n: Any) -> Dual:
+        n = n.value if isinstance(n, Dual) else n
+        return self.mpf(self.base.factorial(n))
+
+
+@dataclass
+class Jacobian:
+    """
+    Derivatives of predictions with respect to engine inputs.
+
+    ``derivatives[key][name]`` is d(key)/d(name) at the base point
+    ``input_values``; ``values[key]`` is the prediction there.
+    """
+    keys: Tuple[str, ...]
+    inputs: Tuple[str, ...]
+    values: Dict[str, mp.mpf]
+    input_values: Dict[str, mp.mpf]
+    derivatives: Dict[str, Dict[str, mp.mpf]]
+
+    def derivative(self, key: str, name: str) -> mp.mpf:
+        """d(key)/d(name)."""
+        return self.derivatives[key][name]
+
+    def as_array(self) -> np.ndarray:
+        """float64 matrix with one row per prediction key and one column per input."""
+        return np.array(
+            [[float(self.derivatives[key][name]) for name in self.inputs] for key in self.keys],
+            dtype=np.float64,
+        )
+
+    def predict_change(self, deltas: Dict[str, float]) -> Dict[str, float]:
+        """
+        First-order change of every prediction for the given input changes.
+
+        Args:
+            deltas: Absolute input changes keyed by input name
+
+        Returns:
+            Estimated absolute change per prediction key
+        """
+        unknown = set(deltas) - set(self.inputs)
+        if unknown:
+            raise KeyError(f"Inputs not in Jacobian: {', '.join(sorted(unknown))}")
+        return {
+            key: sum(float(self.derivatives[key][name]) * delta for name, delta in deltas.items())
+            for key in self.keys
+        }
+
+    def predict_values(self, deltas: Dict[str, float]) -> Dict[str, float]:
+        """First-order estimate of every prediction after the input changes."""
+        change = self.predict_change(deltas)
+        return {key: float(self.values[key]) + change[key] for key in self.keys}
+
+
+def compute_jacobian(
+    inputs: Optional[Sequence[str]] = None,
+    keys: Optional[Sequence[str]] = None,
+    precision: int = 50,
+    overrides: Optional[Dict[str, Any]] = None,
+) -> Jacobian:
+    """
+    Compute the Jacobian of predictions in one forward-mode pass.
+
+    Args:
+        inputs: Inputs to differentiate with respect to (default SENSITIVITY_INPUTS)
+        keys: Prediction keys (default: all of PREDICTION_GRAPH)
+        precision: Decimal places of the underlying mpmath context
+        overrides: Derivation input overrides defining the base point
+
+    Returns:
+        Jacobian at the base point
+    """
+    inputs = tuple(inputs or SENSITIVITY_INPUTS)
+    keys = tuple(keys or CalculationEngine.PREDICTION_GRAPH)
+    for name in inputs:
+        if name not in SENSITIVITY_INPUTS:
+            raise ValueError(
+                f"Cannot differentiate with respect to '{name}'. "
+                f"Available: {', '.join(SENSITIVITY_INPUTS)}"
+            )
+
+    ctx = DualContext(len(inputs), dps=precision)
+    engine = CalculationEngine(inputs=overrides, ctx=ctx)
+    for index, name in enumerate(inputs):
+        setattr(engine, name, ctx.seed(getattr(engine, name).value, index))
+
+    values: Dict[str, mp.mpf] = {}
+    derivatives: Dict[str, Dict[str, mp.mpf]] = {}
+    for key in keys:
+        dual = engine.get_prediction(key).value
+        values[key] = dual.value
+        derivatives[key] = dict(zip(inputs, dual.grad))
+
+    return Jacobian(
+        keys=keys,
+        inputs=inputs,
+        values=values,
+        input_values={name: getattr(engine, name).value for name in inputs},
+        derivatives=derivatives,
+    )
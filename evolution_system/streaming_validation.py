@@ -0,0 +1,412 @@
+"""
+Streaming Validation Statistics for IRH Theory Evolution System
+===============================================================
+
+Aggregates validation results in constant memory, so sweeps far larger
+than RAM can be validated chunk by chunk.
+
+**Components:**
+- SigmaSketch: mergeable quantile sketch of σ-deviations with bounded
+  relative error (logarithmic buckets, as in DDSketch)
+- RunningStatistics: count, mean and variance (Welford/Chan updates),
+  minimum and maximum with the labels where they occurred
+- StreamingValidationSummary: the above for all σ and per prediction
+  key, plus status counts overall and per tier
+
+ValidationResults, ValidationReports and ArrayValidationReports can be
+fed one at a time (``add``, ``add_report``, ``add_arrays``) or from any
+iterable (``consume``). Summaries of separate streams ``merge`` exactly,
+apart from the quantile sketch's relative error.
+
+Usage:
+------
+```python
+import numpy as np
+from evolution_system import ValidationModule
+from evolution_system.parameter_sweep import ParameterSweep
+
+chunks = ParameterSweep().iter_grid(
+    chunk_size=1_000_000,
+    log_ratio_topological=np.linspace(18.0, 20.0, 10_000),
+    delta_qed=np.linspace(29.0, 31.0, 10_000),
+)
+summary = ValidationModule().validate_stream(chunks)    # 10⁸ points
+summary.sigma.mean, summary.sigma.argmax                # (point, key)
+summary.quantile(0.99)
+```
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+import numpy as np
+
+from .experimental_database import ValidationTier
+from .validation_module import (
+    AgreementStatus, ArrayValidationReport, ValidationReport, ValidationResult,
+    NO_COMPARISON_CODE, STATUS_CODES,
+)
+
+
+class SigmaSketch:
+    """
+    Quantile sketch of non-negative values with relative accuracy.
+
+    Value ``x`` is counted in bucket ``ceil(log_γ(x))`` with
+    ``γ = (1 + α) / (1 - α)``; every quantile estimate is then within a
+    relative error ``α`` of a value of the stream at that rank. Values
+    below ``min_value`` are counted as zero and values above
+    ``max_value`` in the last bucket, so memory is fixed at construction
+    (about 2,800 counters for the defaults).
+    """
+
+    def __init__(
+        self,
+        relative_accuracy: float = 0.01,
+        min_value: float = 1e-12,
+        max_value: float = 1e12,
+    ):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            relative_accuracy: Relative error α of quantile estimates
+            min_value: Smallest positive value resolved
+            max_value: Largest value resolved
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be in (0, 1)")
+        self.relative_accuracy = relative_accuracy
+        self.min_value = min_value
+        self.max_value = max_value
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._offset = math.ceil(math.log(min_value) / self._log_gamma)
+        n_buckets = math.ceil(math.log(max_value) / self._log_gamma) - self._offset + 1
+        self.counts = np.zeros(n_buckets, dtype=np.int64)
+        self.zero_count = 0
+
+    @property
+    def count(self) -> int:
+        """Number of values added."""
+        return self.zero_count + int(self.counts.sum())
+
+    def add(self, values: Any):
+        """Add a value or an array of values (NaN is ignored)."""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        small = values < self.min_value
+        self.zero_count += int(np.count_nonzero(small))
+        buckets = np.ceil(np.log(values[~small]) / self._log_gamma) - self._offset
+        buckets = np.minimum(buckets, len(self.counts) - 1).astype(np.intp)
+        self.counts += np.bincount(buckets, minlength=len(self.counts))
+
+    def merge(self, other: 'SigmaSketch'):
+        """Add the counts of a sketch with the same parameters."""
+        if (other.relative_accuracy, other.min_value, other.max_value) != (
+                self.relative_accuracy, self.min_value, self.max_value):
+            raise ValueError("Cannot merge sketches with different parameters")
+        self.counts += other.counts
+        self.zero_count += other.zero_count
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate the ``q``-quantile (None for an empty sketch).
+
+        Args:
+            q: Quantile level in [0, 1]
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q must be in [0, 1]")
+        total = self.count
+        if total == 0:
+            return None
+        rank = q * (total - 1)
+        if rank < self.zero_count:
+            return 0.0
+        bucket = int(np.searchsorted(np.cumsum(self.counts), rank - self.zero_count, side='right'))
+        # Midpoint (in relative terms) of (γ^(i-1), γ^i]
+        return 2 * self._gamma ** (bucket + self._offset) / (self._gamma + 1)
+
+
+@dataclass
+class RunningStatistics:
+    """
+    Count, mean, variance, minimum and maximum of a stream of values.
+
+    Single values use Welford's update, arrays the pairwise combination of
+    Chan et al., so chunked and one-at-a-time streams agree to rounding.
+    ``argmin``/``argmax`` are the labels of the first minimum and the last
+    maximum.
+    """
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    minimum: float = math.inf
+    maximum: float = -math.inf
+    argmin: Optional[Hashable] = None
+    argmax: Optional[Hashable] = None
+
+    @property
+    def variance(self) -> Optional[float]:
+        """Sample variance (None for fewer than two values)."""
+        return self.m2 / (self.count - 1) if self.count > 1 else None
+
+    @property
+    def std(self) -> Optional[float]:
+        """Sample standard deviation (None for fewer than two values)."""
+        variance = self.variance
+        return math.sqrt(variance) if variance is not None else None
+
+    def add(self, value: float, label: Hashable = None):
+        """Add one value (Welford's update)."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value < self.minimum:
+            self.minimum, self.argmin = value, label
+        if value >= self.maximum:
+            self.maximum, self.argmax = value, label
+
+    def add_array(self, values: np.ndarray, label: Callable[[int], Hashable] = lambda i: None):
+        """
+        Add an array of values.
+
+        Args:
+            values: 1-D float array (without NaN)
+            label: Label of ``values[i]`` (only called for the extremes)
+        """
+        n = len(values)
+        if n == 0:
+            return
+        mean = float(values.mean())
+        m2 = float(np.square(values - mean).sum())
+        low = int(np.argmin(values))
+        high = n - 1 - int(np.argmax(values[::-1]))
+        self._combine(
+            n, mean, m2,
+            float(values[low]), label(low),
+            float(values[high]), label(high),
+        )
+
+    def merge(self, other: 'RunningStatistics'):
+        """Add the values summarized by ``other`` (which come later)."""
+        if other.count:
+            self._combine(other.count, other.mean, other.m2,
+                          other.minimum, other.argmin, other.maximum, other.argmax)
+
+    def _combine(self, n, mean, m2, minimum, argmin, maximum, argmax):
+        total = self.count + n
+        delta = mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += m2 + delta * delta * self.count * n / total
+        self.count = total
+        if minimum < self.minimum:
+            self.minimum, self.argmin = minimum, argmin
+        if maximum >= self.maximum:
+            self.maximum, self.argmax = maximum, argmax
+
+    def to_dict(self) -> Dict:
+        return {
+            'count': self.count,
+            'mean': self.mean if self.count else None,
+            'std': self.std,
+            'min': self.minimum if self.count else None,
+            'max': self.maximum if self.count else None,
+            'argmin': self.argmin,
+            'argmax': self.argmax,
+        }
+
+
+@dataclass
+class StreamingValidationSummary:
+    """
+    Constant-memory summary of validation results.
+
+    σ-deviations are labelled ``(set_index, key)``: the position of the
+    prediction set in the stream and the prediction key. ``status_counts``
+    counts every validated observable; ``tier_counts`` those with an
+    experimental comparison, by tier.
+    """
+    relative_accuracy: float = 0.01
+    n_sets: int = 0
+    status_counts: Dict[AgreementStatus, int] = field(
+        default_factory=lambda: {status: 0 for status in AgreementStatus}
+    )
+    tier_counts: Dict[ValidationTier, Dict[AgreementStatus, int]] = field(default_factory=dict)
+    sigma: RunningStatistics = field(default_factory=RunningStatistics)
+    by_key: Dict[str, RunningStatistics] = field(default_factory=dict)
+    sketch: SigmaSketch = field(init=False)
+
+    def __post_init__(self):
+        self.sketch = SigmaSketch(self.relative_accuracy)
+
+    # =========================================================================
+    # Feeding
+    # =========================================================================
+
+    def add(self, result: ValidationResult, key: Optional[str] = None, index: Optional[int] = None):
+        """
+        Add one ValidationResult.
+
+        Args:
+            result: Validation of one prediction
+            key: Prediction key (default: ``result.prediction_name``)
+            index: Prediction set the result belongs to (default: a new set)
+        """
+        if index is None:
+            index = self.n_sets
+            self.n_sets += 1
+        key = key if key is not None else result.prediction_name
+        status = result.agreement_status
+        self.status_counts[status] += 1
+        if status != AgreementStatus.NO_COMPARISON and result.tier is not None:
+            self._tier(result.tier)[status] += 1
+        if result.sigma_deviation is not None:
+            sigma = float(result.sigma_deviation)
+            self.sigma.add(sigma, (index, key))
+            self._key(key).add(sigma, (index, key))
+            self.sketch.add(sigma)
+
+    def add_report(self, report: ValidationReport):
+        """Add every result of a ValidationReport as one prediction set."""
+        index = self.n_sets
+        self.n_sets += 1
+        for key, result in report.results.items():
+            self.add(result, key, index)
+
+    def add_arrays(self, report: ArrayValidationReport):
+        """Add all prediction sets of an ArrayValidationReport (one chunk)."""
+        offset = self.n_sets
+        self.n_sets += len(report)
+        keys = report.keys
+
+        codes = np.bincount(report.status.ravel(), minlength=len(STATUS_CODES))
+        for code, status in enumerate(STATUS_CODES):
+            self.status_counts[status] += int(codes[code])
+        has_exp = ~np.isnan(report.exp_value)
+        for tier in ValidationTier:
+            columns = has_exp & (report.tier == tier.value)
+            if columns.any() and len(report):
+                codes = np.bincount(report.status[:, columns].ravel(), minlength=len(STATUS_CODES))
+                counts = self._tier(tier)
+                for code, status in enumerate(STATUS_CODES[:NO_COMPARISON_CODE]):
+                    counts[status] += int(codes[code])
+
+        sigma = report.sigma
+        valid = ~np.isnan(sigma)
+        rows, cols = np.nonzero(valid)
+        self.sigma.add_array(sigma[valid], lambda i: (offset + int(rows[i]), keys[cols[i]]))
+        for j, key in enumerate(keys):
+            column_rows = np.flatnonzero(valid[:, j])
+            if column_rows.size == 0:
+                continue
+            self._key(key).add_array(
+                sigma[column_rows, j], lambda i: (offset + int(column_rows[i]), key)
+            )
+        self.sketch.add(sigma[valid])
+
+    def consume(self, items: Iterable[Any]) -> 'StreamingValidationSummary':
+        """
+        Add ValidationResults, ValidationReports or ArrayValidationReports
+        from an iterable (e.g. a generator), one at a time.
+
+        Returns:
+            self
+        """
+        for item in items:
+            if isinstance(item, ArrayValidationReport):
+                self.add_arrays(item)
+            elif isinstance(item, ValidationReport):
+                self.add_report(item)
+            elif isinstance(item, ValidationResult):
+                self.add(item)
+            else:
+                raise TypeError(f"Cannot aggregate {type(item).__name__}")
+        return self
+
+    def merge(self, other: 'StreamingValidationSummary'):
+        """Append the summary of a later part of the stream."""
+        offset = self.n_sets
+        self.n_sets += other.n_sets
+        for status, count in other.status_counts.items():
+            self.status_counts[status] += count
+        for tier, counts in other.tier_counts.items():
+            for status, count in counts.items():
+                self._tier(tier)[status] += count
+        for stats, other_stats in [(self.sigma, other.sigma)] + [
+                (self._key(key), other_stats) for key, other_stats in other.by_key.items()]:
+            shifted = RunningStatistics(**vars(other_stats))
+            shifted.argmin = _shift(other_stats.argmin, offset)
+            shifted.argmax = _shift(other_stats.argmax, offset)
+            stats.merge(shifted)
+        self.sketch.merge(other.sketch)
+
+    def _tier(self, tier: ValidationTier) -> Dict[AgreementStatus, int]:
+        counts = self.tier_counts.get(tier)
+        if counts is None:
+            counts = {status: 0 for status in STATUS_CODES[:NO_COMPARISON_CODE]}
+            self.tier_counts[tier] = counts
+        return counts
+
+    def _key(self, key: str) -> RunningStatistics:
+        stats = self.by_key.get(key)
+        if stats is None:
+            stats = RunningStatistics()
+            self.by_key[key] = stats
+        return stats
+
+    # =========================================================================
+    # Statistics
+    # =========================================================================
+
+    @property
+    def compared(self) -> int:
+        """Number of validations with an experimental comparison."""
+        return sum(self.status_counts.values()) - self.status_counts[AgreementStatus.NO_COMPARISON]
+
+    @property
+    def overall_pass_rate(self) -> Optional[float]:
+        """Fraction of comparisons within 3σ."""
+        if not self.compared:
+            return None
+        passing = self.status_counts[AgreementStatus.EXCELLENT] + self.status_counts[AgreementStatus.GOOD]
+        return passing / self.compared
+
+    def tier_pass_rate(self, tier: ValidationTier) -> Optional[float]:
+        """Fraction of comparisons in ``tier`` within 3σ."""
+        counts = self.tier_counts.get(tier)
+        if not counts or not sum(counts.values()):
+            return None
+        return (counts[AgreementStatus.EXCELLENT] + counts[AgreementStatus.GOOD]) / sum(counts.values())
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Approximate σ quantile (relative error ``relative_accuracy``)."""
+        return self.sketch.quantile(q)
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            'n_sets': self.n_sets,
+            'compared': self.compared,
+            'status_counts': {s.value: n for s, n in self.status_counts.items()},
+            'overall_pass_rate': self.overall_pass_rate,
+            'tier_summaries': {
+                tier.name: {
+                    'compared': sum(counts.values()),
+                    'counts': {s.value: n for s, n in counts.items()},
+                    'pass_rate': self.tier_pass_rate(tier),
+                }
+                for tier, counts in self.tier_counts.items()
+            },
+            'sigma': self.sigma.to_dict(),
+            'sigma_quantiles': {q: self.quantile(q) for q in (0.5, 0.9, 0.99)},
+            'by_key': {key: stats.to_dict() for key, stats in self.by_key.items()},
+        }
+
+
+def _shift(label: Optional[Tuple[int, str]], offset: int) -> Optional[Tuple[int, str]]:
+    """Move a ``(set_index, key)`` label by ``offset`` sets."""
+    return (label[0] + offset, label[1]) if label is not None else None
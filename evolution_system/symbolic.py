@@ -0,0 +1,340 @@
+"""
+Symbolic Derivations for IRH Theory Evolution System
+====================================================
+
+Traces the CalculationEngine derivations into SymPy expression trees and
+compiles them into batch evaluators, so the compute_* methods remain the
+single source of truth for every formula.
+
+**Components:**
+- Traced: SymPy expression paired with its mpmath value at the base point
+- TracingContext: arithmetic context that records the compute_* arithmetic
+- SymbolicPipeline: expressions of all predictions in the derivation inputs,
+  compiled (with common subexpressions shared across predictions) into
+  float64 NumPy and mpmath / interval evaluators
+- default_pipeline: process-wide pipeline of a default CalculationEngine
+
+Branches in compute_* code (comparisons) are decided at the base point's
+numerical value; they only affect informational components today.
+
+Usage:
+------
+```python
+import numpy as np
+from evolution_system.symbolic import default_pipeline
+
+pipeline = default_pipeline()
+print(pipeline.expressions['alpha_s'])      # 1/(alpha_GUT_inv + b3*log_ratio_topological/(2*pi))
+
+kernel = pipeline.numpy_kernel()
+values = kernel({'log_ratio_topological': np.linspace(18, 20, 5)})   # other inputs at defaults
+
+exact = pipeline.mpmath_kernel()({})       # 50-digit values, no engine construction
+```
+"""
+
+import math
+from functools import lru_cache
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple
+
+import mpmath as mp
+import numpy as np
+import sympy
+
+from .calculation_engine import CalculationEngine
+
+
+# Non-input engine constants that a custom base engine may override
+TOPOLOGICAL_CONSTANTS: Tuple[str, ...] = (
+    'omega_tetrahedron',
+    'omega_S3_ref',
+    'hopf_ratio',
+    'eta',
+    'a_weyl',
+    'koide_Q',
+)
+
+
+class Traced:
+    """
+    SymPy expression with its numerical value at the tracing base point.
+
+    Arithmetic extends the expression and evaluates the value alongside;
+    comparisons and ``float()`` use the value. The ``_mpf_`` attribute lets
+    PredictionResult accept real Traced values as mpmath values.
+    """
+
+    __slots__ = ('ctx', 'expr', 'value')
+
+    def __init__(self, ctx: 'TracingContext', expr: sympy.Expr, value: Any):
+        self.ctx = ctx
+        self.expr = expr
+        self.value = value
+
+    def __repr__(self) -> str:
+        return f"Traced({self.expr}, value={self.value})"
+
+    @property
+    def _mpf_(self):
+        return self.value._mpf_
+
+    def __float__(self) -> float:
+        return float(self.value)
+
+    def _lift(self, other: Any) -> 'Traced':
+        return self.ctx.mpf(other)
+
+    def __add__(self, other):
+        other = self._lift(other)
+        return Traced(self.ctx, self.expr + other.expr, self.value + other.value)
+
+    def __radd__(self, other):
+        return self._lift(other) + self
+
+    def __sub__(self, other):
+        other = self._lift(other)
+        return Traced(self.ctx, self.expr - other.expr, self.value - other.value)
+
+    def __rsub__(self, other):
+        return self._lift(other) - self
+
+    def __mul__(self, other):
+        other = self._lift(other)
+        return Traced(self.ctx, self.expr * other.expr, self.value * other.value)
+
+    def __rmul__(self, other):
+        return self._lift(other) * self
+
+    def __truediv__(self, other):
+        other = self._lift(other)
+        return Traced(self.ctx, self.expr / other.expr, self.value / other.value)
+
+    def __rtruediv__(self, other):
+        return self._lift(other) / self
+
+    def __pow__(self, exponent):
+        exponent = self._lift(exponent)
+        return Traced(self.ctx, self.expr ** exponent.expr, self.value ** exponent.value)
+
+    def __rpow__(self, base):
+        return self._lift(base) ** self
+
+    def __neg__(self):
+        return Traced(self.ctx, -self.expr, -self.value)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return self if self.value >= 0 else -self
+
+    def __eq__(self, other):
+        return self.value == self._lift(other).value
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __lt__(self, other):
+        return self.value < self._lift(other).value
+
+    def __le__(self, other):
+        return self.value <= self._lift(other).value
+
+    def __gt__(self, other):
+        return self.value > self._lift(other).value
+
+    def __ge__(self, other):
+        return self.value >= self._lift(other).value
+
+    __hash__ = None
+
+
+class TracingContext:
+    """
+    Arithmetic context recording CalculationEngine.compute_* as SymPy.
+
+    Implements the subset of the mpmath context interface used by the
+    engine. Numbers enter as exact SymPy constants (decimal strings become
+    rationals); values are evaluated in a private mpmath context.
+    """
+
+    def __init__(self, dps: int = 50):
+        self.base = mp.MPContext()
+        self.base.dps = dps
+
+    @property
+    def dps(self) -> int:
+        return self.base.dps
+
+    def _exact(self, value: Any) -> sympy.Expr:
+        """Exact SymPy constant for a Python / mpmath number."""
+        if isinstance(value, complex):
+            return self._exact(value.real) + sympy.I * self._exact(value.imag)
+        if isinstance(value, (int, float, str)):
+            return sympy.Rational(value)
+        return sympy.Float(value, self.dps)
+
+    def mpf(self, value: Any) -> Traced:
+        """Constant Traced value."""
+        if isinstance(value, Traced):
+            return value
+        return Traced(self, self._exact(value), self.base.convert(value))
+
+    def symbol(self, name: str, value: Any) -> Traced:
+        """Traced input ``name`` evaluated at ``value``."""
+        if isinstance(value, Traced):
+            value = value.value
+        return Traced(self, sympy.Symbol(name, real=True), self.base.convert(value))
+
+    @property
+    def pi(self) -> Traced:
+        return Traced(self, sympy.pi, +self.base.pi)
+
+    def acos(self, x: Any) -> Traced:
+        x = self.mpf(x)
+        return Traced(self, sympy.acos(x.expr), self.base.acos(x.value))
+
+    def exp(self, x: Any) -> Traced:
+        x = self.mpf(x)
+        return Traced(self, sympy.exp(x.expr), self.base.exp(x.value))
+
+    def log10(self, x: Any) -> Traced:
+        x = self.mpf(x)
+        return Traced(self, sympy.log(x.expr, 10), self.base.log10(x.value))
+
+    def factorial(self, n: Any) -> Traced:
+        n = self.mpf(n)
+        return Traced(self, sympy.factorial(n.expr), self.base.factorial(n.value))
+
+
+def _factorial_array(n: np.ndarray) -> np.ndarray:
+    """Γ(n+1) evaluated once per distinct value (n_strands takes few values)."""
+    n = np.asarray(n, dtype=np.float64)
+    unique, inverse = np.unique(n, return_inverse=True)
+    table = np.array([math.gamma(v + 1) for v in unique])
+    return table[inverse].reshape(n.shape)
+
+
+# mpmath function names emitted by SymPy's MpmathPrinter
+_MPMATH_NAMES = ('mpf', 'pi', 'e', 'exp', 'log', 'acos', 'sqrt', 'factorial')
+
+
+class SymbolicPipeline:
+    """
+    All predictions as SymPy expressions in the derivation inputs.
+
+    The expressions are traced from a CalculationEngine whose derivation
+    inputs are replaced by symbols. Topological constants stay exact
+    (π, arccos(1/3), rationals) unless ``engine`` overrides them.
+    """
+
+    def __init__(
+        self,
+        engine: Optional[CalculationEngine] = None,
+        keys: Optional[Sequence[str]] = None,
+        precision: int = 50,
+    ):
+        """
+        Trace the derivations.
+
+        Args:
+            engine: Engine supplying the base point (inputs and constants);
+                default: a fresh CalculationEngine
+            keys: Prediction keys to trace (default: all of PREDICTION_GRAPH)
+            precision: Decimal places of the tracing values
+        """
+        self.keys: Tuple[str, ...] = tuple(keys or CalculationEngine.PREDICTION_GRAPH)
+        self.inputs: Tuple[str, ...] = CalculationEngine.DERIVATION_INPUTS
+        self.symbols: Tuple[sympy.Symbol, ...] = tuple(
+            sympy.Symbol(name, real=True) for name in self.inputs
+        )
+
+        ctx = TracingContext(dps=precision)
+        traced = CalculationEngine(ctx=ctx)
+        if engine is not None:
+            for name in TOPOLOGICAL_CONSTANTS:
+                value = getattr(engine, name)
+                if float(value) != float(getattr(traced, name)):
+                    setattr(traced, name, ctx.mpf(value))
+        base = engine if engine is not None else traced
+        for name in self.inputs:
+            setattr(traced, name, ctx.symbol(name, getattr(base, name)))
+
+        self.defaults: Dict[str, Any] = {
+            name: getattr(traced, name).value for name in self.inputs
+        }
+        self.expressions: Dict[str, sympy.Expr] = {
+            key: traced.get_prediction(key).value.expr for key in self.keys
+        }
+        self._numpy_kernel: Optional[Callable] = None
+
+    def _lambdify(self, modules: Sequence[Any]) -> Callable:
+        """Compile all expressions into one function with shared subexpressions."""
+        return sympy.lambdify(
+            self.symbols,
+            [self.expressions[key] for key in self.keys],
+            modules=list(modules),
+            cse=True,
+        )
+
+    def _arguments(self, inputs: Mapping[str, Any], convert: Callable) -> list:
+        unknown = set(inputs) - set(self.inputs)
+        if unknown:
+            raise ValueError(
+                f"Unknown derivation input(s) {', '.join(sorted(unknown))}. "
+                f"Available: {', '.join(self.inputs)}"
+            )
+        return [convert(inputs.get(name, self.defaults[name])) for name in self.inputs]
+
+    def numpy_kernel(self) -> Callable[[Mapping[str, Any]], Dict[str, np.ndarray]]:
+        """
+        float64 evaluator ``kernel(inputs) -> {key: array}``.
+
+        ``inputs`` maps derivation input names to broadcastable arrays
+        (missing inputs take their base-point value); every output array
+        has the broadcast shape, constants included.
+        """
+        if self._numpy_kernel is None:
+            self._numpy_kernel = self._lambdify([{'factorial': _factorial_array}, 'numpy'])
+        function = self._numpy_kernel
+
+        def kernel(inputs: Mapping[str, Any]) -> Dict[str, np.ndarray]:
+            args = self._arguments(inputs, lambda v: np.asarray(v, dtype=np.float64))
+            shape = np.broadcast_shapes(*(np.shape(a) for a in args))
+            values = function(*args)
+            return {
+                key: np.broadcast_to(np.asarray(value, dtype=np.float64), shape)
+                for key, value in zip(self.keys, values)
+            }
+
+        return kernel
+
+    def mpmath_kernel(self, ctx: Optional[Any] = None) -> Callable[[Mapping[str, Any]], Dict[str, Any]]:
+        """
+        Scalar evaluator ``kernel(inputs) -> {key: value}`` in ``ctx``.
+
+        Args:
+            ctx: mpmath context (e.g. mp.MPContext() or
+                interval_arithmetic.IntervalContext); default 50 digits
+
+        Returns:
+            Evaluator; missing inputs take their base-point value
+        """
+        if ctx is None:
+            ctx = mp.MPContext()
+            ctx.dps = 50
+        namespace = {name: getattr(ctx, name) for name in _MPMATH_NAMES}
+        function = self._lambdify([namespace, 'mpmath'])
+
+        def kernel(inputs: Mapping[str, Any]) -> Dict[str, Any]:
+            args = self._arguments(inputs, ctx.convert)
+            # Constant expressions may come back as Python numbers
+            return {key: ctx.convert(value) for key, value in zip(self.keys, function(*args))}
+
+        return kernel
+
+
+@lru_cache(maxsize=1)
+def default_pipeline() -> SymbolicPipeline:
+    """SymbolicPipeline of a default CalculationEngine (traced once per process)."""
+    return SymbolicPipeline()
@@ -0,0 +1,181 @@
+"""
+Template Families for IRH Theory Evolution System
+=================================================
+
+Lazy enumeration of the integer-parameterized modification templates
+(Chern class order, instanton order, braid strands) over parameter
+ranges, for testing whole families instead of a few fixed members.
+
+**Features:**
+- TemplateFamily: template factory, parameter and a closed-form,
+  vectorized correction kernel (NumPy over an array of parameter values)
+- Modifications built one at a time from a generator; kernels evaluated
+  per chunk of parameter values, so no family list is built up front
+- Each modification carries its ``correction_factors``, which the
+  integration system applies instead of the type-level approximation
+
+The kernels reproduce the integration system's first-order corrections
+at each template's default parameter (C_2, k = 2, B_4) and scale with
+the parameter as the template's derivation prescribes:
+
+- Chern class C_n: one further factor κ per curvature order,
+  δ_n = 0.1 κ^(n-1) on gauge couplings
+- Instanton order k: moduli space measure ε_k = 1/k!,
+  δ_k = -0.2 / k! on vacuum energy observables
+- Braid group B_n: standard representation dimension n!,
+  δ_n = 0.24 / n! on all affected observables
+
+Usage:
+------
+```python
+from evolution_system import IntegrationSystem
+from evolution_system.template_families import iter_family_modifications
+
+modifications = iter_family_modifications({
+    'chern_class_correction': range(1, 21),
+    'instanton_vacuum_correction': range(1, 21),
+    'braid_group_correction': range(3, 13),
+})
+for result in IntegrationSystem().test_modifications(modifications):
+    print(result.refinement_name, result.status.value)
+```
+"""
+
+import itertools
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Callable, Iterable, Iterator, Mapping, Optional
+
+import mpmath as mp
+import numpy as np
+
+from .ai_advisor import TopologicalModification, TopologicalModificationTemplates
+
+# κ = η × (Vol(S⁷)/Vol(S³))² of chern_class_correction
+_KAPPA = float(mp.mpf(4) / mp.pi) / 36
+
+
+def _factorials(n: np.ndarray) -> np.ndarray:
+    """n! for an array of non-negative integers (float64)."""
+    table = np.cumprod(np.concatenate(([1.0], np.arange(1.0, n.max(initial=0) + 1))))
+    return table[n]
+
+
+def _chern_shift(order: np.ndarray) -> np.ndarray:
+    return 0.1 * _KAPPA ** (order - 1.0)
+
+
+def _instanton_shift(order: np.ndarray) -> np.ndarray:
+    return -0.2 / _factorials(order)
+
+
+def _braid_shift(strands: np.ndarray) -> np.ndarray:
+    return 0.24 / _factorials(strands)
+
+
+@dataclass(frozen=True)
+class TemplateFamily:
+    """
+    Integer-parameterized template with a closed-form correction kernel.
+
+    Attributes:
+        template: TopologicalModificationTemplates method building a member
+        parameter: Keyword argument of the template
+        shift: Vectorized kernel, parameter values -> relative correction δ
+        applies: Whether the factor 1 + δ applies to an affected observable
+        default_values: Parameter values explored by default
+    """
+    template: str
+    parameter: str
+    shift: Callable[[np.ndarray], np.ndarray]
+    applies: Callable[[str], bool]
+    default_values: range
+
+    def factors(self, values: Iterable[int]) -> np.ndarray:
+        """Correction factors 1 + δ for parameter values, in one vectorized pass."""
+        values = np.asarray(list(values), dtype=np.int64)
+        if values.size and values.min() < 0:
+            raise ValueError(f"{self.parameter} must be non-negative")
+        return 1.0 + self.shift(values)
+
+    def iter_modifications(
+        self,
+        values: Optional[Iterable[int]] = None,
+        chunk_size: int = 64
+    ) -> Iterator[TopologicalModification]:
+        """
+        Family members for parameter values, built lazily.
+
+        Args:
+            values: Parameter values (default: ``default_values``); may be
+                any iterable, including an unbounded one
+            chunk_size: Parameter values per kernel evaluation
+
+        Yields:
+            TopologicalModification with ``correction_factors`` set
+        """
+        factory = getattr(TopologicalModificationTemplates, self.template)
+        values = iter(self.default_values if values is None else values)
+        while True:
+            chunk = list(itertools.islice(values, chunk_size))
+            if not chunk:
+                return
+            for value, factor in zip(chunk, self.factors(chunk).tolist()):
+                modification = factory(**{self.parameter: value})
+                modification.correction_factors = {
+                    name: factor for name in modification.affected_observables
+                    if self.applies(name)
+                }
+                yield modification
+
+
+# Families by template name
+FAMILIES: Mapping[str, TemplateFamily] = MappingProxyType({
+    family.template: family for family in (
+        TemplateFamily(
+            template='chern_class_correction',
+            parameter='order',
+            shift=_chern_shift,
+            applies=lambda name: 'alpha' in name.lower(),
+            default_values=range(1, 21),
+        ),
+        TemplateFamily(
+            template='instanton_vacuum_correction',
+            parameter='order',
+            shift=_instanton_shift,
+            applies=lambda name: 'lambda' in name.lower() or 'vacuum' in name.lower(),
+            default_values=range(1, 21),
+        ),
+        TemplateFamily(
+            template='braid_group_correction',
+            parameter='strands',
+            shift=_braid_shift,
+            applies=lambda name: True,
+            default_values=range(3, 13),
+        ),
+    )
+})
+
+
+def iter_family_modifications(
+    values: Optional[Mapping[str, Iterable[int]]] = None,
+    chunk_size: int = 64
+) -> Iterator[TopologicalModification]:
+    """
+    Members of several template families, one family after another.
+
+    Args:
+        values: Template name -> parameter values (default: every family
+            over its ``default_values``)
+        chunk_size: Parameter values per kernel evaluation
+
+    Yields:
+        TopologicalModification per (family, parameter value)
+
+    Raises:
+        KeyError: For a template without a family
+    """
+    if values is None:
+        values = {name: None for name in FAMILIES}
+    for name, family_values in values.items():
+        yield from FAMILIES[name].iter_modifications(family_values, chunk_size)
@@ -10,6 +10,11 @@ Compares theoretical predictions to experimental measurements.
 - Calculates σ-deviations: σ = |theory - exp| / uncertainty
 - Categorizes predictions: excellent (<1σ), good (1-3σ), discrepant (>3σ)
 - Generates comprehensive validation reports
+- Vectorized validation of many prediction sets (validate_arrays), e.g.
+  parameter sweeps or Monte Carlo samples
+- Constant-memory streaming statistics over chunked sweeps (validate_stream)
+- Correlated χ² against the experimental covariance (chi_squared, or
+  ``ValidationModule(correlated=True)`` to add it to every report)
 
 **Validation Tiers:**
 - Tier 1: Core parameters (α, gauge couplings, lepton masses)
@@ -44,15 +49,17 @@ References:
 """
 
 import mpmath as mp
+import numpy as np
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
 from enum import Enum
 
-from .experimental_database import ExperimentalDatabase, ExperimentalConstant, ValidationTier
+from .experimental_database import (
+    ExperimentalDatabase, ExperimentalConstant, ValidationPlan, ValidationTier, get_database
+)
 from .calculation_engine import PredictionResult
-
-# Set high precision
-mp.dps = 50
+from .prediction_set import PredictionSet
+from .interval_arithmetic import sigma_enclosure
 
 
 class AgreementStatus(Enum):
@@ -93,9 +100,17 @@ class ValidationResult:
     requires_attention: bool = False
     notes: Optional[str] = None
     
+    # Interval mode: rigorous σ bounds and whether they fix the status
+    sigma_enclosure: Optional[Tuple[float, float]] = None
+    certified: Optional[bool] = None
+    
+    # combine_uncertainties mode: σ uses √(σ_exp² + σ_theory²)
+    theory_uncertainty: Optional[float] = None
+    combined_uncertainty: Optional[float] = None
+    
     def __post_init__(self):
-        """Ensure mpf types."""
-        if not isinstance(self.theory_value, mp.mpf):
+        """Ensure mpf types (mpf values of any mpmath context are kept)."""
+        if not hasattr(self.theory_value, '_mpf_'):
             self.theory_value = mp.mpf(str(self.theory_value))
     
     def to_dict(self) -> Dict:
@@ -116,6 +131,10 @@ class ValidationResult:
             'theory_reference': self.theory_reference,
             'requires_attention': self.requires_attention,
             'notes': self.notes,
+            'sigma_enclosure': list(self.sigma_enclosure) if self.sigma_enclosure else None,
+            'certified': self.certified,
+            'theory_uncertainty': self.theory_uncertainty,
+            'combined_uncertainty': self.combined_uncertainty,
         }
 
 
@@ -147,6 +166,10 @@ class ValidationReport:
     tier1_pass_rate: Optional[float] = None
     overall_pass_rate: Optional[float] = None
     
+    # Correlated χ² (ValidationModule(correlated=True) only)
+    chi_squared: Optional[float] = None
+    chi_squared_dof: Optional[int] = None
+    
     def get_excellent(self) -> List[ValidationResult]:
         """Get all excellent (<1σ) results."""
         return [r for r in self.results.values() 
@@ -183,6 +206,10 @@ class ValidationReport:
         """Get all results flagged as requiring attention."""
         return [r for r in self.results.values() if r.requires_attention]
     
+    def get_uncertified(self) -> List[ValidationResult]:
+        """Get interval-mode results whose σ-enclosure crosses a status boundary."""
+        return [r for r in self.results.values() if r.certified is False]
+    
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization."""
         return {
@@ -199,6 +226,8 @@ class ValidationReport:
                 'best_prediction': self.best_prediction,
                 'tier1_pass_rate': self.tier1_pass_rate,
                 'overall_pass_rate': self.overall_pass_rate,
+                'chi_squared': self.chi_squared,
+                'chi_squared_dof': self.chi_squared_dof,
             },
             'tier_summaries': self.tier_summaries,
             'results': {
@@ -208,6 +237,253 @@ class ValidationReport:
         }
 
 
+# Agreement status of each status code used by ArrayValidationReport
+STATUS_CODES: Tuple[AgreementStatus, ...] = (
+    AgreementStatus.EXCELLENT,
+    AgreementStatus.GOOD,
+    AgreementStatus.FAIR,
+    AgreementStatus.POOR,
+    AgreementStatus.NO_COMPARISON,
+)
+NO_COMPARISON_CODE = 4
+
+
+@dataclass(frozen=True, eq=False)
+class _ArrayPlan:
+    """Experimental data aligned to prediction keys for validate_arrays."""
+    keys: Tuple[str, ...]
+    experiment_keys: Tuple[Optional[str], ...]
+    exp_value: np.ndarray
+    exp_uncertainty: np.ndarray
+    tier: np.ndarray                    # ValidationTier value, 0 without comparison
+    sources: Tuple[Optional[str], ...]
+    koide_column: Optional[int]
+    
+    @property
+    def has_experiment(self) -> np.ndarray:
+        return ~np.isnan(self.exp_value)
+
+
+class ArrayValidationReport:
+    """
+    Validation of many prediction sets at once.
+    
+    Row ``i`` of every ``(n_sets, n_keys)`` array belongs to prediction
+    set ``i``, column ``j`` to ``keys[j]``; per-set statistics are arrays
+    of length ``n_sets``. ``sigma`` and ``relative_error`` are NaN where
+    ValidationResult would hold None. ``status`` holds indexes into
+    STATUS_CODES. ValidationResults are only built by ``result`` and
+    ``report``; they carry float64 values and no interval certification.
+    """
+    
+    def __init__(
+        self,
+        plan: _ArrayPlan,
+        theory: np.ndarray,
+        theory_uncertainty: Optional[np.ndarray],
+        metadata: Mapping[str, PredictionResult],
+        validator: 'ValidationModule',
+    ):
+        self.keys = plan.keys
+        self.theory = theory
+        self.exp_value = plan.exp_value
+        self.exp_uncertainty = plan.exp_uncertainty
+        # σ denominator: experimental, or combined in quadrature with theory
+        if theory_uncertainty is None:
+            self.theory_uncertainty = None
+            self.uncertainty = np.broadcast_to(plan.exp_uncertainty, theory.shape)
+        else:
+            combine = (theory_uncertainty != 0) & ~np.isnan(theory_uncertainty)
+            self.theory_uncertainty = np.where(combine, theory_uncertainty, np.nan)
+            self.uncertainty = np.where(
+                combine,
+                np.sqrt(plan.exp_uncertainty ** 2 + theory_uncertainty ** 2),
+                plan.exp_uncertainty,
+            )
+        uncertainty = self.uncertainty
+        # Correlated χ² per set (set by validate_arrays in correlated mode)
+        self.chi_squared: Optional[np.ndarray] = None
+        self.chi_squared_dof: Optional[int] = None
+        self.tier = plan.tier
+        self._plan = plan
+        self._column = {key: j for j, key in enumerate(self.keys)}
+        self._metadata = metadata
+        self._validator = validator
+        
+        has_exp = plan.has_experiment
+        positive = has_exp & (plan.exp_uncertainty > 0)
+        exact = has_exp & (plan.exp_uncertainty == 0)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            difference = np.abs(theory - plan.exp_value)
+            exact_match = exact & (difference == 0)
+            self.sigma = np.where(positive, difference / uncertainty, np.nan)
+            self.sigma[exact_match] = 0.0
+            self.relative_error = np.where(
+                has_exp & (plan.exp_value != 0) & ~exact_match,
+                difference / np.abs(plan.exp_value),
+                np.nan,
+            )
+            # NaN σ compares False everywhere, i.e. POOR (as in validate_single)
+            codes = 3 - (self.sigma < 5.0) - (self.sigma < 3.0) - (self.sigma < 1.0)
+        codes = np.where(exact & ~exact_match, 3, codes)
+        self.status = np.where(has_exp, codes, NO_COMPARISON_CODE).astype(np.int8)
+        self._has_sigma = positive | exact_match
+        
+        # Per-set statistics
+        self.compared = np.count_nonzero(self.status != NO_COMPARISON_CODE, axis=1)
+        self.counts = {
+            status: np.count_nonzero(self.status == code, axis=1)
+            for code, status in enumerate(STATUS_CODES[:NO_COMPARISON_CODE])
+        }
+        n_sigma = np.count_nonzero(self._has_sigma, axis=1)
+        with np.errstate(invalid='ignore'):
+            self.mean_sigma = np.where(self._has_sigma, self.sigma, 0.0).sum(axis=1) / n_sigma
+        self.mean_sigma[n_sigma == 0] = np.nan
+        low = np.where(self._has_sigma, self.sigma, np.inf)
+        high = np.where(self._has_sigma, self.sigma, -np.inf)
+        # Ties: first minimum and last maximum, as a stable sort would give
+        self.best = np.argmin(low, axis=1)
+        self.worst = high.shape[1] - 1 - np.argmax(high[:, ::-1], axis=1)
+        self.max_sigma = np.where(n_sigma > 0, high.max(axis=1, initial=-np.inf), np.nan)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            passing = self._has_sigma & (self.sigma < 3.0)
+            tier1 = has_exp & (plan.tier == ValidationTier.TIER_1.value)
+            self.tier1_pass_rate = (
+                np.count_nonzero(passing & tier1, axis=1) / np.count_nonzero(tier1)
+                if tier1.any() else np.full(len(theory), np.nan)
+            )
+            self.overall_pass_rate = (
+                (self.counts[AgreementStatus.EXCELLENT] + self.counts[AgreementStatus.GOOD])
+                / self.compared
+            )
+        self.overall_pass_rate[self.compared == 0] = np.nan
+        
+        # Tier summaries count σ == 0 as not passing, like validate_all
+        self.tier_summaries: Dict[str, Dict[str, np.ndarray]] = {}
+        truthy_passing = passing & (self.sigma > 0)
+        for tier in ValidationTier:
+            columns = has_exp & (plan.tier == tier.value)
+            if columns.any():
+                tier_pass = np.count_nonzero(truthy_passing & columns, axis=1)
+                total = int(np.count_nonzero(columns))
+                self.tier_summaries[tier.name] = {
+                    'total': total,
+                    'compared': total,
+                    'passing': tier_pass,
+                    'pass_rate': tier_pass / total,
+                }
+    
+    def __len__(self) -> int:
+        return len(self.theory)
+    
+    def agreement(self, index: int, key: str) -> AgreementStatus:
+        """Agreement status of ``key`` in prediction set ``index``."""
+        return STATUS_CODES[self.status[index, self._column[key]]]
+    
+    def result(self, index: int, key: str) -> ValidationResult:
+        """Build the ValidationResult of ``key`` in prediction set ``index``."""
+        j = self._column[key]
+        meta = self._metadata.get(key)
+        theory = float(self.theory[index, j])
+        result = ValidationResult(
+            prediction_name=meta.name if meta is not None else key,
+            prediction_symbol=meta.symbol if meta is not None else key,
+            theory_value=mp.mpf(theory),
+            exp_value=None,
+            exp_uncertainty=None,
+            theory_reference=meta.theory_reference if meta is not None else None,
+        )
+        status = STATUS_CODES[self.status[index, j]]
+        result.agreement_status = status
+        if status == AgreementStatus.NO_COMPARISON:
+            result.notes = "No experimental value available for comparison"
+            return result
+        
+        exp_value = float(self.exp_value[j])
+        result.exp_value = mp.mpf(exp_value)
+        result.exp_uncertainty = mp.mpf(float(self.exp_uncertainty[j]))
+        result.experimental_source = self._plan.sources[j]
+        result.tier = ValidationTier(int(self.tier[j]))
+        result.requires_attention = status in (AgreementStatus.FAIR, AgreementStatus.POOR)
+        if not np.isnan(self.sigma[index, j]):
+            result.sigma_deviation = float(self.sigma[index, j])
+        
+        if self.exp_uncertainty[j] == 0 and result.sigma_deviation == 0.0:
+            return result
+        result.absolute_error = mp.mpf(abs(theory - exp_value))
+        if not np.isnan(self.relative_error[index, j]):
+            result.relative_error = mp.mpf(float(self.relative_error[index, j]))
+            result.relative_error_percent = float(self.relative_error[index, j] * 100)
+        if self.exp_uncertainty[j] == 0:
+            result.notes = "Does not match exact value"
+        else:
+            if self.theory_uncertainty is not None and not np.isnan(self.theory_uncertainty[index, j]):
+                result.theory_uncertainty = float(self.theory_uncertainty[index, j])
+                result.combined_uncertainty = float(self.uncertainty[index, j])
+            if status == AgreementStatus.POOR and j != self._plan.koide_column:
+                result.notes = f"Significant discrepancy: {result.sigma_deviation:.1f}σ from experiment"
+        return result
+    
+    def report(self, index: int) -> ValidationReport:
+        """Full ValidationReport of prediction set ``index``."""
+        report = self._validator._summarize({key: self.result(index, key) for key in self.keys})
+        if self.chi_squared is not None:
+            report.chi_squared = float(self.chi_squared[index])
+            report.chi_squared_dof = self.chi_squared_dof
+        return report
+    
+    def summary(self, index: int) -> Dict:
+        """Summary statistics of prediction set ``index`` (as in ValidationReport)."""
+        has_sigma = bool(self._has_sigma[index].any())
+        def optional(value):
+            return None if np.isnan(value) else float(value)
+        return {
+            'total_predictions': len(self.keys),
+            'compared_predictions': int(self.compared[index]),
+            'excellent_count': int(self.counts[AgreementStatus.EXCELLENT][index]),
+            'good_count': int(self.counts[AgreementStatus.GOOD][index]),
+            'fair_count': int(self.counts[AgreementStatus.FAIR][index]),
+            'poor_count': int(self.counts[AgreementStatus.POOR][index]),
+            'mean_sigma_deviation': optional(self.mean_sigma[index]),
+            'max_sigma_deviation': optional(self.max_sigma[index]),
+            'worst_prediction': self.keys[self.worst[index]] if has_sigma else None,
+            'best_prediction': self.keys[self.best[index]] if has_sigma else None,
+            'tier1_pass_rate': optional(self.tier1_pass_rate[index]),
+            'overall_pass_rate': optional(self.overall_pass_rate[index]),
+            'chi_squared': float(self.chi_squared[index]) if self.chi_squared is not None else None,
+            'chi_squared_dof': self.chi_squared_dof,
+        }
+
+
+@dataclass(frozen=True, eq=False)
+class CorrelatedChiSquared:
+    """
+    χ² = rᵀ C⁻¹ r of many prediction sets against correlated measurements.
+    
+    ``chi_squared[i]`` belongs to prediction set ``i``. ``pulls[i]`` are
+    its residuals decorrelated by the Cholesky factor of C (so that
+    ``chi_squared == (pulls ** 2).sum(axis=1)``); column ``k`` belongs to
+    ``keys[k]``, correlated observables first.
+    """
+    keys: Tuple[str, ...]
+    chi_squared: np.ndarray
+    pulls: np.ndarray
+    
+    @property
+    def dof(self) -> int:
+        """Degrees of freedom (number of compared observables)."""
+        return len(self.keys)
+    
+    def p_value(self, index: int = 0) -> float:
+        """Probability of a χ² at least this large for prediction set ``index``."""
+        return float(mp.gammainc(
+            mp.mpf(self.dof) / 2, mp.mpf(float(self.chi_squared[index])) / 2, mp.inf,
+            regularized=True,
+        ))
+
+
 class ValidationModule:
     """
     Validation module for comparing IRH predictions to experiments.
@@ -238,14 +514,275 @@ class ValidationModule:
         'Omega_b': 'Omega_b',
     }
     
-    def __init__(self, experimental_db: Optional[ExperimentalDatabase] = None):
+    def __init__(
+        self,
+        experimental_db: Optional[ExperimentalDatabase] = None,
+        combine_uncertainties: bool = False,
+        correlated: bool = False,
+    ):
         """
         Initialize validation module.
         
         Args:
-            experimental_db: Database of experimental values (optional)
+            experimental_db: Database of experimental values
+                (default: the shared get_database() instance)
+            combine_uncertainties: Add each prediction's theoretical_uncertainty
+                in quadrature to the experimental uncertainty when computing σ
+                (see monte_carlo.MonteCarloResult.apply)
+            correlated: Also compute the correlated χ² of every validated
+                prediction set (see chi_squared)
+        """
+        self.exp_db = experimental_db or get_database()
+        self.combine_uncertainties = combine_uncertainties
+        self.correlated = correlated
+        self._array_plans: Dict[Tuple[str, ...], _ArrayPlan] = {}
+    
+    def _array_plan(self, keys: Tuple[str, ...]) -> _ArrayPlan:
+        """Experimental float64 data aligned to ``keys`` (cached per key tuple)."""
+        plan = self._array_plans.get(keys)
+        if plan is not None:
+            return plan
+        
+        aligned = self.validation_plan(keys)
+        exp_value = np.array(aligned.values)
+        exp_uncertainty = np.array(aligned.uncertainties)
+        tier = np.zeros(len(keys), dtype=np.int8)
+        sources: List[Optional[str]] = [None] * len(keys)
+        koide_column = None
+        for j, (key, exp_key) in enumerate(zip(keys, aligned.experiment_keys)):
+            if key == 'koide_Q':
+                # Same derived reference value as validate_koide_formula
+                Q_exp, Q_uncertainty = self._koide_reference()
+                exp_value[j] = float(Q_exp)
+                exp_uncertainty[j] = float(Q_uncertainty)
+                tier[j] = ValidationTier.TIER_1.value
+                sources[j] = self.KOIDE_SOURCE
+                koide_column = j
+            elif not np.isnan(exp_value[j]):
+                constant = self.exp_db.get(exp_key)
+                tier[j] = constant.tier.value
+                sources[j] = constant.source
+        
+        plan = _ArrayPlan(
+            keys, aligned.experiment_keys, exp_value, exp_uncertainty, tier,
+            tuple(sources), koide_column,
+        )
+        self._array_plans[keys] = plan
+        return plan
+    
+    def validate_arrays(
+        self,
+        predictions: Mapping[str, Any],
+        theory_uncertainties: Optional[Mapping[str, Any]] = None,
+        metadata: Optional[Mapping[str, PredictionResult]] = None,
+    ) -> ArrayValidationReport:
+        """
+        Validate many prediction sets as float64 array operations.
+        
+        Equivalent to validate_all on each set (without interval
+        certification), but σ, relative errors, statuses, pass rates and
+        tier summaries are computed for all sets at once.
+        
+        Args:
+            predictions: Prediction key -> values (scalar or array of
+                length n_sets), e.g. ``SweepResult.predictions``
+            theory_uncertainties: Prediction key -> theoretical uncertainty;
+                combined in quadrature if ``combine_uncertainties`` is set
+            metadata: PredictionResults supplying names, symbols and
+                references of lazily built ValidationResults
+        
+        Returns:
+            ArrayValidationReport
+        """
+        plan, theory, theory_uncertainty = self._array_inputs(predictions, theory_uncertainties)
+        report = ArrayValidationReport(plan, theory, theory_uncertainty, metadata or {}, self)
+        if self.correlated:
+            chi_squared = self._chi_squared(plan, theory, theory_uncertainty)
+            report.chi_squared = chi_squared.chi_squared
+            report.chi_squared_dof = chi_squared.dof
+        return report
+    
+    def _array_inputs(
+        self,
+        predictions: Mapping[str, Any],
+        theory_uncertainties: Optional[Mapping[str, Any]],
+    ) -> Tuple[_ArrayPlan, np.ndarray, Optional[np.ndarray]]:
+        """Plan, theory matrix and theory uncertainty matrix of columnar predictions."""
+        keys = tuple(predictions)
+        plan = self._array_plan(keys)
+        columns = [np.asarray(predictions[key], dtype=np.float64) for key in keys]
+        n_sets = max((c.size for c in columns if c.ndim), default=1)
+        theory = np.empty((n_sets, len(keys)))
+        for j, column in enumerate(columns):
+            theory[:, j] = column
+        
+        theory_uncertainty = None
+        if self.combine_uncertainties and theory_uncertainties:
+            theory_uncertainty = np.zeros_like(theory)
+            for j, key in enumerate(keys):
+                if key in theory_uncertainties and j != plan.koide_column:
+                    theory_uncertainty[:, j] = np.asarray(
+                        theory_uncertainties[key], dtype=np.float64
+                    )
+        return plan, theory, theory_uncertainty
+    
+    def chi_squared(
+        self,
+        predictions: Mapping[str, Any],
+        theory_uncertainties: Optional[Mapping[str, Any]] = None,
+    ) -> CorrelatedChiSquared:
+        """
+        Correlated χ² of many prediction sets against experiment.
+        
+        Unlike the per-observable σ of validate_single, correlated
+        measurements (``ExperimentalDatabase.correlation``) are combined
+        through their covariance matrix. The Cholesky factor comes from
+        the database's cache, so it is computed once per edition and key
+        layout; each call is then one matrix product over all sets.
+        Theory uncertainties (``combine_uncertainties``) that differ between
+        sets are factorized per set in one batched call.
+        
+        Args:
+            predictions: Prediction key -> values (scalar or array of
+                length n_sets), as for validate_arrays
+            theory_uncertainties: See validate_arrays
+        
+        Returns:
+            CorrelatedChiSquared
+        """
+        plan, theory, theory_uncertainty = self._array_inputs(predictions, theory_uncertainties)
+        return self._chi_squared(plan, theory, theory_uncertainty)
+    
+    def _chi_squared(
+        self,
+        plan: _ArrayPlan,
+        theory: np.ndarray,
+        theory_uncertainty: Optional[np.ndarray],
+    ) -> CorrelatedChiSquared:
+        """Correlated χ² of a theory matrix (see chi_squared)."""
+        compared = plan.has_experiment & (plan.exp_uncertainty > 0)
+        # Observables measured in the database share its covariance;
+        # derived references (Koide) are independent of everything else
+        measured = [j for j in np.flatnonzero(compared) if j != plan.koide_column]
+        derived = [j for j in np.flatnonzero(compared) if j == plan.koide_column]
+        
+        extra = None
+        if theory_uncertainty is not None:
+            extra = np.nan_to_num(theory_uncertainty) ** 2
+        
+        residual = theory[:, measured] - plan.exp_value[measured]
+        experiment_keys = [plan.experiment_keys[j] for j in measured]
+        if extra is None or not extra[:, measured].any():
+            pulls = self.exp_db.covariance_factor(experiment_keys).whiten(residual)
+        elif np.all(extra[:, measured] == extra[0, measured]):
+            factor = self.exp_db.covariance_factor(experiment_keys, extra[0, measured])
+            pulls = factor.whiten(residual)
+        else:
+            covariance = self.exp_db.covariance_factor(experiment_keys).covariance
+            cholesky = np.linalg.cholesky(
+                covariance + extra[:, measured, None] * np.eye(len(measured))
+            )
+            pulls = np.linalg.solve(cholesky, residual[:, :, None])[:, :, 0]
+        
+        if derived:
+            variance = plan.exp_uncertainty[derived] ** 2
+            if extra is not None:
+                variance = variance + extra[:, derived]
+            pulls = np.concatenate(
+                [pulls, (theory[:, derived] - plan.exp_value[derived]) / np.sqrt(variance)],
+                axis=1,
+            )
+        
+        return CorrelatedChiSquared(
+            keys=tuple(plan.keys[j] for j in measured + derived),
+            chi_squared=np.einsum('ij,ij->i', pulls, pulls),
+            pulls=pulls,
+        )
+    
+    def validate_many(
+        self,
+        prediction_sets: Union[np.ndarray, Sequence[Mapping[str, Any]]],
+        keys: Optional[Sequence[str]] = None,
+        theory_uncertainties: Optional[Mapping[str, Any]] = None,
+        metadata: Optional[Mapping[str, PredictionResult]] = None,
+    ) -> ArrayValidationReport:
+        """
+        Validate an [N_sets × N_observables] matrix of predictions.
+        
+        No ValidationReport is created per set; the columnar report holds
+        the σ matrix and per-set mean/max σ and pass rates.
+        
+        Args:
+            prediction_sets: 2-D float array (columns in ``keys`` order), or
+                a sequence of prediction mappings (PredictionSets, dicts of
+                PredictionResults or of floats) sharing the same keys
+            keys: Column keys (required for arrays; default for mappings:
+                the keys of the first set)
+            theory_uncertainties: See validate_arrays
+            metadata: See validate_arrays (default for PredictionResult
+                mappings: the first set)
+        
+        Returns:
+            ArrayValidationReport
+        """
+        if isinstance(prediction_sets, np.ndarray):
+            if keys is None:
+                raise ValueError("keys are required to validate a prediction matrix")
+            matrix = np.atleast_2d(np.asarray(prediction_sets, dtype=np.float64))
+            if matrix.shape[1] != len(keys):
+                raise ValueError(
+                    f"Prediction matrix has {matrix.shape[1]} columns for {len(keys)} keys"
+                )
+            keys = tuple(keys)
+        else:
+            if not prediction_sets:
+                raise ValueError("No prediction sets to validate")
+            first = prediction_sets[0]
+            keys = tuple(keys) if keys is not None else tuple(first)
+            matrix = np.empty((len(prediction_sets), len(keys)))
+            for i, predictions in enumerate(prediction_sets):
+                if isinstance(predictions, PredictionSet) and tuple(predictions) == keys:
+                    matrix[i] = predictions.values
+                else:
+                    matrix[i] = [float(getattr(predictions[k], 'value', predictions[k])) for k in keys]
+            if metadata is None and all(isinstance(first[k], PredictionResult) for k in keys):
+                metadata = first
+        
+        columns = {key: matrix[:, j] for j, key in enumerate(keys)}
+        return self.validate_arrays(columns, theory_uncertainties, metadata)
+    
+    def validate_stream(
+        self,
+        chunks: Iterable[Any],
+        theory_uncertainties: Optional[Mapping[str, Any]] = None,
+        relative_accuracy: float = 0.01,
+    ) -> 'StreamingValidationSummary':
+        """
+        Validate a stream of prediction chunks in constant memory.
+        
+        Each chunk is validated with validate_arrays and folded into a
+        StreamingValidationSummary before the next one is read, so only
+        one chunk is held at a time.
+        
+        Args:
+            chunks: Iterable of SweepResults or columnar prediction
+                mappings (e.g. ``ParameterSweep.iter_grid``)
+            theory_uncertainties: See validate_arrays (applied to every chunk)
+            relative_accuracy: Relative error of the σ quantile estimates
+        
+        Returns:
+            StreamingValidationSummary (set indexes count across chunks)
         """
-        self.exp_db = experimental_db or ExperimentalDatabase()
+        from .streaming_validation import StreamingValidationSummary
+        summary = StreamingValidationSummary(relative_accuracy)
+        for chunk in chunks:
+            predictions = getattr(chunk, 'predictions', chunk)
+            summary.add_arrays(self.validate_arrays(predictions, theory_uncertainties))
+        return summary
+    
+    def validation_plan(self, prediction_keys: List[str]) -> ValidationPlan:
+        """float64 experimental values aligned to ``prediction_keys`` (cached)."""
+        return self.exp_db.validation_plan(prediction_keys, self.PREDICTION_TO_EXPERIMENT_MAP)
     
     def validate_single(
         self,
@@ -307,6 +844,12 @@ class ValidationModule:
                 result.relative_error = abs(theory_value - exp_value) / abs(exp_value)
                 result.relative_error_percent = float(result.relative_error * 100)
             
+            if self.combine_uncertainties and prediction.theoretical_uncertainty:
+                theory_uncertainty = mp.mpf(prediction.theoretical_uncertainty)
+                exp_uncertainty = mp.sqrt(exp_uncertainty**2 + theory_uncertainty**2)
+                result.theory_uncertainty = float(theory_uncertainty)
+                result.combined_uncertainty = float(exp_uncertainty)
+            
             result.sigma_deviation = float(abs(theory_value - exp_value) / exp_uncertainty)
             
             # Determine agreement status
@@ -322,6 +865,8 @@ class ValidationModule:
                 result.agreement_status = AgreementStatus.POOR
                 result.requires_attention = True
                 result.notes = f"Significant discrepancy: {sigma:.1f}σ from experiment"
+            
+            self._certify(result, prediction, exp_value, exp_uncertainty)
         else:
             # Exact value (like c or ℏ), just check if they match
             if theory_value == exp_value:
@@ -338,19 +883,10 @@ class ValidationModule:
         
         return result
     
-    def validate_koide_formula(self, prediction: PredictionResult) -> ValidationResult:
-        """
-        Special validation for Koide formula using lepton masses.
-        
-        Computes Q from experimental lepton masses and compares
-        to theoretical Q = 2/3.
-        
-        Args:
-            prediction: Koide Q prediction (should be 2/3)
-        
-        Returns:
-            ValidationResult for Koide formula
-        """
+    KOIDE_SOURCE = "Derived from CODATA 2022 lepton masses"
+    
+    def _koide_reference(self) -> Tuple[mp.mpf, mp.mpf]:
+        """Experimental Koide ratio and its uncertainty."""
         # Get experimental lepton masses
         m_e = self.exp_db.get('m_electron').value
         m_mu = self.exp_db.get('m_muon').value
@@ -365,6 +901,22 @@ class ValidationModule:
         # Uncertainty estimation (from mass uncertainties, simplified)
         # δQ/Q ~ Σ(δm_i/m_i) ~ 0.01%
         Q_uncertainty = mp.mpf('0.0001')  # Conservative estimate
+        return Q_exp, Q_uncertainty
+    
+    def validate_koide_formula(self, prediction: PredictionResult) -> ValidationResult:
+        """
+        Special validation for Koide formula using lepton masses.
+        
+        Computes Q from experimental lepton masses and compares
+        to theoretical Q = 2/3.
+        
+        Args:
+            prediction: Koide Q prediction (should be 2/3)
+        
+        Returns:
+            ValidationResult for Koide formula
+        """
+        Q_exp, Q_uncertainty = self._koide_reference()
         
         theory_value = prediction.value
         
@@ -374,7 +926,7 @@ class ValidationModule:
             theory_value=theory_value,
             exp_value=Q_exp,
             exp_uncertainty=Q_uncertainty,
-            experimental_source="Derived from CODATA 2022 lepton masses",
+            experimental_source=self.KOIDE_SOURCE,
             tier=ValidationTier.TIER_1,
             theory_reference=prediction.theory_reference,
         )
@@ -398,8 +950,59 @@ class ValidationModule:
             result.agreement_status = AgreementStatus.POOR
             result.requires_attention = True
         
+        self._certify(result, prediction, Q_exp, Q_uncertainty)
+        
         return result
     
+    @staticmethod
+    def classify_sigma(sigma: float) -> AgreementStatus:
+        """Agreement status for a σ-deviation (1σ / 3σ / 5σ boundaries)."""
+        if sigma < 1.0:
+            return AgreementStatus.EXCELLENT
+        elif sigma < 3.0:
+            return AgreementStatus.GOOD
+        elif sigma < 5.0:
+            return AgreementStatus.FAIR
+        return AgreementStatus.POOR
+    
+    def _certify(
+        self,
+        result: ValidationResult,
+        prediction: PredictionResult,
+        exp_value: mp.mpf,
+        exp_uncertainty: mp.mpf,
+    ):
+        """
+        Certify the agreement status from the prediction's enclosure.
+        
+        The status is certified when the whole σ-interval lies in one
+        bucket; otherwise the prediction needs a higher-precision rerun.
+        """
+        if prediction.enclosure is None:
+            return
+        sigma_min, sigma_max = sigma_enclosure(prediction.enclosure, exp_value, exp_uncertainty)
+        result.sigma_enclosure = (sigma_min, sigma_max)
+        result.certified = self.classify_sigma(sigma_min) == self.classify_sigma(sigma_max)
+    
+    # Experimental constants entering the Koide validation
+    KOIDE_EXPERIMENT_KEYS = ('m_electron', 'm_muon', 'm_tau')
+    
+    def _validate_key(self, key: str, prediction: PredictionResult) -> ValidationResult:
+        """Validate one prediction by its prediction key."""
+        # Special handling for Koide formula
+        if key == 'koide_Q':
+            return self.validate_koide_formula(prediction)
+        # Look up experimental key
+        exp_key = self.PREDICTION_TO_EXPERIMENT_MAP.get(key)
+        return self.validate_single(prediction, exp_key)
+    
+    def experiment_keys(self, key: str) -> Tuple[str, ...]:
+        """Experimental constants the validation of prediction ``key`` reads."""
+        if key == 'koide_Q':
+            return self.KOIDE_EXPERIMENT_KEYS
+        exp_key = self.PREDICTION_TO_EXPERIMENT_MAP.get(key)
+        return (exp_key,) if exp_key else ()
+    
     def validate_all(
         self,
         predictions: Dict[str, PredictionResult]
@@ -413,20 +1016,94 @@ class ValidationModule:
         Returns:
             ValidationReport with all comparison results
         """
-        report = ValidationReport()
-        report.total_predictions = len(predictions)
+        return self._summarize({
+            key: self._validate_key(key, prediction)
+            for key, prediction in predictions.items()
+        }, predictions)
+    
+    def revalidate(
+        self,
+        previous: ValidationReport,
+        predictions: Dict[str, PredictionResult],
+        changed_constants: Iterable[str]
+    ) -> ValidationReport:
+        """
+        Update a report after experimental constants changed.
         
-        sigma_deviations = []
+        Only predictions reading a changed constant (see experiment_keys)
+        are validated again against this module's database; the other
+        ValidationResults of ``previous`` are reused. ``predictions`` must
+        be the predictions ``previous`` was computed from.
+        
+        Args:
+            previous: Report computed with the old constants
+            predictions: Predictions behind ``previous``
+            changed_constants: Experimental keys whose value or uncertainty
+                changed (e.g. ``EditionDiff.changed``)
         
+        Returns:
+            New ValidationReport
+        """
+        changed = set(changed_constants)
+        results = {}
         for key, prediction in predictions.items():
-            # Special handling for Koide formula
-            if key == 'koide_Q':
-                result = self.validate_koide_formula(prediction)
+            reusable = key in previous.results and changed.isdisjoint(self.experiment_keys(key))
+            results[key] = previous.results[key] if reusable else self._validate_key(key, prediction)
+        return self._summarize(results, predictions)
+    
+    def validate_editions(
+        self,
+        predictions: Dict[str, PredictionResult],
+        editions: Optional[Iterable[str]] = None
+    ) -> Dict[str, ValidationReport]:
+        """
+        Validate predictions against several editions of the database.
+        
+        The first edition is validated in full; every further edition is
+        revalidated from the previous one along their EditionDiff.
+        
+        Args:
+            predictions: Dictionary of predictions from CalculationEngine
+            editions: Edition names (default: all editions of the database)
+        
+        Returns:
+            ValidationReport per edition, in the given order
+        """
+        editions = list(editions) if editions is not None else list(self.exp_db.editions)
+        reports: Dict[str, ValidationReport] = {}
+        previous_edition = None
+        for edition in editions:
+            validator = ValidationModule(
+                self.exp_db.edition(edition),
+                combine_uncertainties=self.combine_uncertainties,
+                correlated=self.correlated,
+            )
+            if previous_edition is None:
+                reports[edition] = validator.validate_all(predictions)
             else:
-                # Look up experimental key
-                exp_key = self.PREDICTION_TO_EXPERIMENT_MAP.get(key)
-                result = self.validate_single(prediction, exp_key)
-            
+                diff = self.exp_db.edition_diff(previous_edition, edition)
+                reports[edition] = validator.revalidate(
+                    reports[previous_edition], predictions, diff.changed
+                )
+            previous_edition = edition
+        return reports
+    
+    def _summarize(
+        self,
+        results: Dict[str, ValidationResult],
+        predictions: Optional[Mapping[str, PredictionResult]] = None
+    ) -> ValidationReport:
+        """
+        Build a ValidationReport (counts and statistics) from results.
+        
+        In correlated mode the χ² of ``predictions`` is added as well.
+        """
+        report = ValidationReport()
+        report.total_predictions = len(results)
+        
+        sigma_deviations = []
+        
+        for key, result in results.items():
             report.results[key] = result
             
             # Update counts
@@ -486,6 +1163,18 @@ class ValidationModule:
                         'pass_rate': tier_pass / len(tier_compared) if tier_compared else 0,
                     }
         
+        if self.correlated and predictions:
+            theory_uncertainties = {
+                key: float(prediction.theoretical_uncertainty or 0)
+                for key, prediction in predictions.items()
+            }
+            chi_squared = self.chi_squared(
+                {key: float(prediction.value) for key, prediction in predictions.items()},
+                theory_uncertainties,
+            )
+            report.chi_squared = float(chi_squared.chi_squared[0])
+            report.chi_squared_dof = chi_squared.dof
+        
         return report
     
     def print_validation_report(self, report: ValidationReport):
@@ -524,6 +1213,8 @@ class ValidationModule:
             print(f"Tier 1 pass rate:     {report.tier1_pass_rate*100:.1f}%")
         if report.overall_pass_rate is not None:
             print(f"Overall pass rate:    {report.overall_pass_rate*100:.1f}%")
+        if report.chi_squared is not None:
+            print(f"Correlated χ²:        {report.chi_squared:.3f} ({report.chi_squared_dof} dof)")
         print()
         
         # Detailed results by tier
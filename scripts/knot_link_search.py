@@ -21,10 +21,12 @@ WARNING: This script derives constants from topological invariants.
 """
 
 import sys
-from mpmath import mp, mpf, pi as mp_pi, acos as mp_acos, nstr
+from mpmath import MPContext
 
-# Set high precision
+# Script-local 50-digit context; the global mpmath precision is left alone
+mp = MPContext()
 mp.dps = 50
+mpf, mp_pi, mp_acos, nstr = mp.mpf, mp.pi, mp.acos, mp.nstr
 
 # Try to import SnapPy
 try:
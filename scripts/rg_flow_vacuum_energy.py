@@ -21,11 +21,13 @@ WARNING: This script derives the scaling from geometric principles.
 """
 
 import sys
-from mpmath import mp, mpf, pi as mp_pi, exp as mp_exp, log as mp_log, sqrt as mp_sqrt, nstr
+from mpmath import MPContext
 from scipy import constants as scipy_const
 
-# Set high precision
+# Script-local 50-digit context; the global mpmath precision is left alone
+mp = MPContext()
 mp.dps = 50
+mpf, mp_pi, mp_exp, mp_log, mp_sqrt, nstr = mp.mpf, mp.pi, mp.exp, mp.log, mp.sqrt, mp.nstr
 
 
 def calculate_scale_hierarchy():
@@ -10,11 +10,19 @@ These tests verify the basic functionality of the evolution system components:
 
 import pytest
 import mpmath as mp
+import numpy as np
 
 # Set precision for tests
 mp.dps = 50
 
 
+def _comparable(result):
+    """IntegrationResult as a dictionary without its timestamp, for comparing runs."""
+    data = result.to_dict()
+    data.pop('test_timestamp')
+    return data
+
+
 class TestExperimentalDatabase:
     """Tests for ExperimentalDatabase."""
     
@@ -76,6 +84,30 @@ class TestExperimentalDatabase:
         for const in tier1:
             assert const.tier == ValidationTier.TIER_1
     
+    def test_secondary_indexes(self):
+        """Test lookups by symbol, source and relative-uncertainty range."""
+        from evolution_system import ExperimentalDatabase
+
+        db = ExperimentalDatabase()
+        assert db.get_by_symbol('α⁻¹') is db.get('alpha_inv')
+        with pytest.raises(KeyError):
+            db.get_by_symbol('not a symbol')
+
+        planck = db.get_source('Planck 2018')
+        assert 'Ω_DM' in {c.symbol for c in planck}
+        assert all(c.source == 'Planck 2018' for c in planck)
+        assert 'CODATA 2022' in db.list_sources()
+
+        everything = db.get_uncertainty_range()
+        assert len(everything) == db.count()
+        relatives = [float(c.relative_uncertainty()) for c in everything]
+        assert relatives == sorted(relatives)
+
+        precise = db.get_uncertainty_range(max_relative=1e-9)
+        assert db.get('alpha_inv') in precise
+        assert all(float(c.relative_uncertainty()) <= 1e-9 for c in precise)
+        assert db.get('Omega_DM') in db.get_uncertainty_range(0.01, 0.05)
+
     def test_missing_key_raises_error(self):
         """Test that missing key raises KeyError."""
         from evolution_system import ExperimentalDatabase
@@ -94,6 +126,125 @@ class TestExperimentalDatabase:
         assert 'alpha' in data
         assert 'alpha_inv' in data
 
+    def test_shared_database_is_read_only(self):
+        """Test that get_database returns one immutable instance across threads."""
+        import dataclasses
+        from concurrent.futures import ThreadPoolExecutor
+        from evolution_system import get_database, IntegrationSystem, ValidationModule
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            instances = set(map(id, pool.map(lambda _: get_database(), range(16))))
+        db = get_database()
+        assert instances == {id(db)}
+        assert ValidationModule().exp_db is db
+        assert IntegrationSystem().regression_tester._db is db
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            db.get('alpha').value = 0
+        with pytest.raises(TypeError):
+            db._category(db.get('alpha').category)['alpha'] = None
+
+    def test_categories_load_lazily(self):
+        """Test that only the categories of accessed constants are built."""
+        from evolution_system import ExperimentalDatabase
+        from evolution_system.experimental_database import ConstantCategory
+
+        db = ExperimentalDatabase()
+        assert db.count() > 0
+        assert 'alpha' in db.list_keys()
+        assert not db._loaded
+
+        db.get('m_muon')
+        assert set(db._loaded) == {ConstantCategory.LEPTON_MASSES}
+        db.get_tier(3)
+        assert ConstantCategory.FUNDAMENTAL not in db._loaded
+        assert ConstantCategory.COSMOLOGICAL in db._loaded
+
+    def test_snapshot_round_trip(self, tmp_path):
+        """Test that snapshots reproduce the database and track the data file."""
+        import json
+        from evolution_system import ExperimentalDatabase
+        from evolution_system.experimental_database import DATA_FILE
+
+        snapshot = tmp_path / 'db.pickle'
+        db = ExperimentalDatabase.from_snapshot(snapshot)
+        assert snapshot.exists()
+        restored = ExperimentalDatabase.from_snapshot(snapshot)
+        assert restored.to_dict() == ExperimentalDatabase().to_dict()
+        assert restored.get('alpha').value == db.get('alpha').value
+
+        # Editing the data file invalidates the snapshot
+        data = json.loads(DATA_FILE.read_text(encoding='utf-8'))
+        data['categories']['fundamental']['constants']['alpha']['value'] = '7.3e-3'
+        data_file = tmp_path / 'constants.json'
+        data_file.write_text(json.dumps(data), encoding='utf-8')
+        edited = ExperimentalDatabase.from_snapshot(snapshot, data_file)
+        assert float(edited.get('alpha').value) == pytest.approx(7.3e-3)
+
+    def test_editions_and_diff(self):
+        """Test overlay editions and the edition diff."""
+        from evolution_system import ExperimentalDatabase
+
+        db = ExperimentalDatabase()
+        assert db.editions[0] == db.data_version
+        assert 'codata-2018' in db.editions
+
+        old = db.edition('codata-2018')
+        assert old is db.edition('codata-2018')
+        assert old.get('alpha_inv').source == "CODATA 2018"
+        assert old.get('alpha_inv').value != db.get('alpha_inv').value
+        assert old.get('m_muon').value == db.get('m_muon').value
+
+        diff = db.edition_diff(db.data_version, 'codata-2018')
+        assert diff.value_changed == ('alpha_inv',)
+        assert diff.uncertainty_changed == ()
+        assert db.edition_diff('codata-2018', 'codata-2018').changed == ()
+        with pytest.raises(KeyError):
+            db.edition('codata-1900')
+
+    def test_covariance_factor_is_cached_per_edition(self):
+        """Test correlated covariances and their cached Cholesky factors."""
+        from evolution_system.experimental_database import get_database
+        
+        db = get_database()
+        keys = ['Omega_Lambda', 'Omega_DM', 'Omega_b']
+        assert db.correlation('Omega_DM', 'Omega_Lambda') == db.correlation('Omega_Lambda', 'Omega_DM') < 0
+        assert db.correlation('Omega_b', 'Omega_DM') == 0.0
+        
+        covariance = db.covariance(keys)
+        assert covariance[0, 0] == pytest.approx(0.0056 ** 2)
+        assert covariance[2, 0] == 0.0
+        
+        factor = db.covariance_factor(keys)
+        assert db.covariance_factor(keys) is factor
+        assert db.edition('codata-2018').covariance_factor(keys) is not factor
+        np.testing.assert_allclose(factor.cholesky @ factor.cholesky.T, covariance)
+        
+        residuals = np.array([[0.01, -0.01, 0.0], [0.01, 0.01, 0.001]])
+        expected = [r @ np.linalg.solve(covariance, r) for r in residuals]
+        np.testing.assert_allclose(factor.chi_squared(residuals), expected)
+        # Anti-correlated measurements: a residual against the correlation costs more
+        assert expected[1] > expected[0]
+    
+    def test_validation_plan(self):
+        """Test float64 alignment of prediction keys to experimental values."""
+        from evolution_system import get_database, ValidationModule
+
+        db = get_database()
+        plan = db.validation_plan(['alpha_inv', 'eta', 'Omega_DM'])
+
+        assert plan.values[0] == float(db.get_value('alpha_inv'))
+        assert plan.uncertainties[2] == float(db.get_uncertainty('Omega_DM'))
+        assert np.isnan(plan.values[1])
+        assert plan.has_experiment.tolist() == [True, False, True]
+        assert db.validation_plan(['alpha_inv', 'eta', 'Omega_DM']) is plan
+        with pytest.raises(ValueError):
+            plan.values[0] = 0
+
+        mapped = ValidationModule().validation_plan(['alpha_2', 'M_GUT'])
+        assert mapped.experiment_keys == ('g2', None)
+        assert mapped.values[0] == float(db.get_value('g2'))
+
 
 class TestCalculationEngine:
     """Tests for CalculationEngine."""
@@ -156,6 +307,53 @@ class TestCalculationEngine:
         assert 'eta' in predictions
         assert 'koide_Q' in predictions
     
+    def test_get_prediction_computes_only_dependencies(self):
+        """Test that get_prediction lazily computes only transitive inputs."""
+        from evolution_system import CalculationEngine
+        engine = CalculationEngine()
+
+        result = engine.get_prediction('sin2_theta_W')
+
+        assert result.symbol == "sin²θ_W(M_Z)"
+        assert engine.get_dependencies('sin2_theta_W') == ['alpha_1', 'alpha_2']
+        computed = set(engine.list_predictions())
+        assert {'alpha_1', 'alpha_2', 'sin2_theta_W'} <= computed
+        assert 'alpha_inv' not in computed
+        assert 'Omega_b' not in computed
+
+    def test_get_prediction_runs_each_producer_once(self):
+        """Test that a cold lookup runs the producing method exactly once."""
+        from evolution_system import CalculationEngine
+        engine = CalculationEngine()
+        calls = []
+        original = engine.compute_cosmological_ratios
+
+        def counting():
+            calls.append(1)
+            return original()
+
+        engine.compute_cosmological_ratios = counting
+        engine.get_prediction('Omega_b')
+        engine.get_prediction('Omega_Lambda')
+        engine.get_prediction('Omega_DM')
+
+        assert len(calls) == 1
+        assert engine.get_dependencies('Omega_b') == []
+
+    def test_get_prediction_is_memoized(self):
+        """Test that repeated lookups reuse the memoized prediction."""
+        from evolution_system import CalculationEngine
+        engine = CalculationEngine()
+
+        first = engine.get_prediction('alpha_inv')
+        predictions = engine.compute_all_predictions()
+
+        assert predictions['alpha_inv'] is first
+        assert list(predictions) == list(CalculationEngine.PREDICTION_GRAPH)
+
+        with pytest.raises(KeyError):
+            engine.get_prediction('not_a_prediction')
+
     def test_prediction_has_metadata(self):
         """Test that predictions include metadata."""
         from evolution_system import CalculationEngine
@@ -179,6 +377,318 @@ class TestCalculationEngine:
         assert isinstance(data, dict)
         assert 'alpha_inv' in data
 
+    def test_derivation_input_override(self):
+        """Test overriding a hard-coded derivation input."""
+        from evolution_system import CalculationEngine
+        default = CalculationEngine().get_prediction('alpha_inv').value
+        engine = CalculationEngine(inputs={'delta_qed': 31})
+
+        assert engine.get_prediction('alpha_inv').value - default == pytest.approx(1.0)
+
+        with pytest.raises(ValueError):
+            CalculationEngine(inputs={'not_an_input': 1})
+
+    def test_engines_use_private_precision(self):
+        """Test that engines of different precision coexist across threads."""
+        from concurrent.futures import ThreadPoolExecutor
+        from evolution_system import CalculationEngine
+        global_dps = mp.mp.dps
+
+        def alpha_inv(precision):
+            engine = CalculationEngine(precision=precision)
+            return engine.get_prediction('alpha_inv').value
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            low, high = pool.map(alpha_inv, [15, 60])
+
+        assert mp.mp.dps == global_dps
+        assert len(mp.nstr(high, 60)) > len(mp.nstr(low, 60))
+        assert float(low) == pytest.approx(float(high), rel=1e-14)
+
+
+class TestParameterSweep:
+    """Tests for the vectorized ParameterSweep."""
+
+    def test_default_point_matches_engine(self):
+        """Test that the float64 kernels reproduce the mpmath engine."""
+        from evolution_system import CalculationEngine, ParameterSweep
+        result = ParameterSweep().evaluate()
+        predictions = CalculationEngine().compute_all_predictions()
+
+        assert result.keys == tuple(CalculationEngine.PREDICTION_GRAPH)
+        for key, values in result.predictions.items():
+            assert values[0] == pytest.approx(float(predictions[key].value), rel=1e-12)
+
+    def test_grid_is_columnar_and_verifiable(self):
+        """Test grid layout and mpmath re-verification of selected points."""
+        import numpy as np
+        from evolution_system import ParameterSweep
+        sweep = ParameterSweep()
+        result = sweep.grid(
+            log_ratio_topological=np.linspace(18.0, 20.0, 30),
+            n_strands=[3, 4, 5],
+        )
+
+        assert len(result) == 90
+        assert result.to_array().shape == (90,)
+        assert result.point(1) == pytest.approx({**sweep.defaults, 'log_ratio_topological': 18.0, 'n_strands': 4})
+
+        deviations = sweep.verify(result, [0, 47, 89])
+        for point_dev in deviations.values():
+            assert max(point_dev.values()) < 1e-12
+
+        report = result.validate()
+        assert report.sigma.shape == (90, len(result.keys))
+        assert report.mean_sigma.shape == (90,)
+
+
+
+class TestSymbolicPipeline:
+    """Tests for traced symbolic derivations and compiled kernels."""
+
+    def test_mpmath_kernel_reproduces_engine(self):
+        """Test that compiled mpmath and interval kernels match compute_*."""
+        from evolution_system import CalculationEngine
+        from evolution_system.symbolic import default_pipeline
+        from evolution_system.interval_arithmetic import IntervalContext
+        pipeline = default_pipeline()
+        reference = CalculationEngine(inputs={'b3': -6}).compute_all_predictions()
+
+        values = pipeline.mpmath_kernel()({'b3': -6})
+        enclosures = pipeline.mpmath_kernel(IntervalContext(dps=30))({'b3': -6})
+        for key, result in reference.items():
+            assert abs(values[key] - result.value) <= abs(result.value) * mp.mpf('1e-45')
+            lower, upper = enclosures[key]._mpi_
+            assert mp.mp.make_mpf(lower) <= result.value <= mp.mp.make_mpf(upper)
+
+        with pytest.raises(ValueError):
+            pipeline.mpmath_kernel()({'not_an_input': 1})
+
+    def test_expressions_are_symbolic_in_inputs(self):
+        """Test expression structure and the float64 batch kernel."""
+        import sympy
+        from evolution_system.symbolic import default_pipeline
+        pipeline = default_pipeline()
+
+        alpha_s = pipeline.expressions['alpha_s']
+        assert {str(s) for s in alpha_s.free_symbols} == {'alpha_GUT_inv', 'b3', 'log_ratio_topological'}
+        assert pipeline.expressions['koide_Q'] == sympy.Rational(2, 3)
+
+        batch = pipeline.numpy_kernel()({'n_strands': np.array([3.0, 4.0])})
+        assert batch['Lambda_suppression'][0] == pytest.approx(4 * batch['Lambda_suppression'][1])
+        assert batch['Omega_b'].shape == (2,)
+
+
+class TestAdaptivePrecision:
+    """Tests for the float64 fast path with mpmath escalation."""
+
+    def test_error_bounds_contain_mpmath_values(self):
+        """Test that float64 error bounds enclose the 50-digit results."""
+        from evolution_system import AdaptivePrecisionEngine, CalculationEngine
+        engine = AdaptivePrecisionEngine(rtol=1e-10)
+        fast = engine.compute_all_predictions()
+        exact = CalculationEngine(precision=50).compute_all_predictions()
+
+        assert engine.escalated == []
+        for key, prediction in fast.items():
+            assert abs(exact[key].value - prediction.value) <= engine.error_bounds[key]
+
+    def test_escalates_only_keys_beyond_tolerance(self):
+        """Test that only keys with too wide a bound are recomputed in mpmath."""
+        from evolution_system import AdaptivePrecisionEngine
+        engine = AdaptivePrecisionEngine(
+            rtol=1e-10,
+            tolerances={'Lambda_suppression': (0.0, 1e-25)},
+        )
+        predictions = engine.compute_all_predictions()
+
+        assert engine.escalated == ['Lambda_suppression']
+        assert not hasattr(predictions['Lambda_suppression'].value, 'err')
+        assert hasattr(predictions['alpha_inv'].value, 'err')
+
+        engine.reset()
+        assert engine.escalated == []
+
+
+
+class TestIntervalArithmetic:
+    """Tests for certified interval-arithmetic mode."""
+
+    def test_enclosures_contain_high_precision_values(self):
+        """Test that low-precision enclosures contain the 50-digit values."""
+        from evolution_system import CalculationEngine
+        intervals = CalculationEngine(precision=10, interval=True).compute_all_predictions()
+        exact = CalculationEngine(precision=50).compute_all_predictions()
+
+        for key, prediction in intervals.items():
+            lower, upper = prediction.enclosure
+            assert lower <= exact[key].value <= upper
+            assert lower <= prediction.value <= upper
+
+    def test_validation_certifies_status_from_intervals(self):
+        """Test that statuses are certified unless the σ-interval crosses a boundary."""
+        from evolution_system import CalculationEngine, ValidationModule
+        validator = ValidationModule()
+
+        coarse = validator.validate_all(
+            CalculationEngine(precision=3, interval=True).compute_all_predictions()
+        )
+        uncertified = {r.prediction_symbol for r in coarse.get_uncertified()}
+        assert coarse.results['alpha_s'].certified is True
+        assert coarse.results['alpha_inv'].certified is False
+        assert uncertified == {coarse.results['alpha_inv'].prediction_symbol}
+
+        fine = validator.validate_all(
+            CalculationEngine(precision=20, interval=True).compute_all_predictions()
+        )
+        assert fine.get_uncertified() == []
+        sigma_min, sigma_max = fine.results['alpha_inv'].sigma_enclosure
+        assert sigma_min <= fine.results['alpha_inv'].sigma_deviation <= sigma_max
+
+
+
+class TestSensitivity:
+    """Tests for the forward-mode sensitivity Jacobian."""
+
+    def test_jacobian_matches_finite_differences(self):
+        """Test analytic derivatives against central finite differences."""
+        from evolution_system import CalculationEngine, compute_jacobian
+        jac = compute_jacobian()
+        h = mp.mpf('1e-20')
+
+        for name, key in [('correction_factor', 'alpha_inv'),
+                          ('log_ratio_topological', 'sin2_theta_W'),
+                          ('alpha_GUT_inv', 'alpha_s')]:
+            base = getattr(CalculationEngine(), name)
+            upper = CalculationEngine(inputs={name: base + h}).get_prediction(key).value
+            lower = CalculationEngine(inputs={name: base - h}).get_prediction(key).value
+            finite_difference = (upper - lower) / (2 * h)
+            assert float(jac.derivative(key, name)) == pytest.approx(float(finite_difference), rel=1e-12)
+
+        assert jac.derivative('alpha_s', 'correction_factor') == 0
+        # Every input moves some prediction
+        assert (np.abs(jac.as_array()).max(axis=0) > 0).all()
+
+    def test_predict_change_is_first_order(self):
+        """Test first-order estimates and the dense matrix layout."""
+        from evolution_system import CalculationEngine, compute_jacobian
+        jac = compute_jacobian(inputs=['delta_qed', 'b3'])
+
+        assert jac.as_array().shape == (len(CalculationEngine.PREDICTION_GRAPH), 2)
+        estimate = jac.predict_values({'b3': 1e-6})
+        actual = CalculationEngine(inputs={'b3': -7 + 1e-6}).get_prediction('alpha_s').value
+        assert estimate['alpha_s'] == pytest.approx(float(actual), rel=1e-10)
+        assert jac.predict_change({'delta_qed': 0.5})['alpha_inv'] == pytest.approx(0.5)
+
+        for name in ('n_strands', 'hopf_ratio', 'a_weyl'):
+            with pytest.raises(ValueError):
+                compute_jacobian(inputs=[name])
+
+
+class TestPredictionCache:
+    """Tests for the persistent prediction cache."""
+
+    def test_warm_engine_restores_exact_results(self, tmp_path, monkeypatch):
+        """Test that a second engine loads bit-identical results from disk."""
+        from evolution_system import CalculationEngine, PredictionCache
+        cache = PredictionCache(tmp_path / 'predictions.sqlite')
+        cold = CalculationEngine(precision=30, cache=cache).compute_all_predictions()
+        assert len(cache) == len(cold)
+
+        # Warm engines must not recompute anything
+        monkeypatch.setattr(CalculationEngine, 'compute_metric_mismatch', None)
+        warm = CalculationEngine(precision=30, cache=cache).compute_all_predictions()
+        for key, result in cold.items():
+            assert warm[key].value._mpf_ == result.value._mpf_
+            assert warm[key].to_dict() == result.to_dict()
+        assert len(cache) == len(cold)
+
+    def test_cache_key_tracks_inputs_and_precision(self, tmp_path):
+        """Test that inputs, precision and mode each select separate entries."""
+        from evolution_system import CalculationEngine, PredictionCache
+        cache = PredictionCache(tmp_path / 'predictions.sqlite')
+        base = CalculationEngine(cache=cache)
+
+        assert base.cache_key == CalculationEngine(cache=cache).cache_key
+        assert base.cache_key != CalculationEngine(precision=30, cache=cache).cache_key
+        assert base.cache_key != CalculationEngine(interval=True, cache=cache).cache_key
+        assert base.cache_key != CalculationEngine(inputs={'b3': -6}, cache=cache).cache_key
+
+        CalculationEngine(inputs={'b3': -6}, cache=cache).get_prediction('alpha_s')
+        assert base.get_prediction('alpha_s').value == CalculationEngine().get_prediction('alpha_s').value
+
+
+class TestPredictionSet:
+    """Tests for the array-backed PredictionSet."""
+
+    def test_baseline_mapping_and_array(self):
+        """Test that a baseline set mirrors the engine's predictions."""
+        from evolution_system import CalculationEngine, PredictionSet
+        predictions = CalculationEngine().compute_all_predictions()
+        baseline = PredictionSet.from_predictions(predictions)
+
+        assert list(baseline) == list(predictions)
+        assert baseline['alpha_inv'] is predictions['alpha_inv']
+        assert baseline.values.dtype == np.float64
+        assert not baseline.values.flags.writeable
+        assert baseline.to_floats() == {k: float(v.value) for k, v in predictions.items()}
+
+    def test_overlay_is_copy_on_write(self):
+        """Test that variants store only changed values and share the rest."""
+        from evolution_system import CalculationEngine, PredictionSet
+        baseline = PredictionSet.from_predictions(CalculationEngine().compute_all_predictions())
+        refined = baseline.with_values({'alpha_s': 0.1181}, label='Test', corrections={'alpha_s': 1.01})
+
+        assert refined.overridden == ('alpha_s',)
+        assert refined.value('alpha_s') == 0.1181
+        assert refined['alpha_inv'] is baseline['alpha_inv']
+        assert refined['alpha_s'].components['correction_factor'] == 1.01
+        assert float(refined['alpha_s'].value) == 0.1181
+        assert baseline.value('alpha_s') != 0.1181
+        assert refined.values[list(refined).index('alpha_s')] == 0.1181
+
+        with pytest.raises(KeyError):
+            baseline.with_values({'not_a_prediction': 1.0})
+
+
+class TestMonteCarlo:
+    """Tests for Monte Carlo uncertainty propagation."""
+
+    def test_distributions_match_linear_propagation(self):
+        """Test that sampled spreads follow the input uncertainties."""
+        from evolution_system import MonteCarloPropagator
+        from evolution_system.monte_carlo import UncertainInput
+        mc = MonteCarloPropagator(
+            inputs=[UncertainInput('delta_qed', 0.1), UncertainInput('delta_weyl', 0.1, 'uniform')],
+            seed=7,
+        ).run(n_samples=200_000)
+
+        alpha_inv = mc.distribution('alpha_inv')
+        assert alpha_inv.std == pytest.approx(0.1 * np.sqrt(2), rel=0.02)
+        lower, upper = alpha_inv.interval(0.68)
+        assert lower < alpha_inv.quantiles[0.5] < upper
+        assert mc.distribution('alpha_s').std == 0.0
+
+        with pytest.raises(ValueError):
+            UncertainInput('n_strands', 1.0)
+
+    def test_combined_sigma_in_validation(self):
+        """Test that validation can fold theory uncertainty into σ."""
+        from evolution_system import CalculationEngine, MonteCarloPropagator, ValidationModule
+        predictions = CalculationEngine().compute_all_predictions()
+        mc = MonteCarloPropagator(seed=3).run(n_samples=10_000)
+        updated = mc.apply(predictions)
+
+        assert float(updated['alpha_inv'].theoretical_uncertainty) == pytest.approx(
+            mc.distribution('alpha_inv').std)
+        assert updated['eta'] is predictions['eta']
+
+        plain = ValidationModule().validate_all(updated).results['alpha_inv']
+        combined = ValidationModule(combine_uncertainties=True).validate_all(updated).results['alpha_inv']
+        assert combined.combined_uncertainty == pytest.approx(
+            np.hypot(float(plain.exp_uncertainty), combined.theory_uncertainty))
+        assert combined.sigma_deviation < plain.sigma_deviation
+
 
 class TestValidationModule:
     """Tests for ValidationModule."""
@@ -247,6 +757,156 @@ class TestValidationModule:
         assert isinstance(data, dict)
         assert 'summary' in data
         assert 'results' in data
+    
+    def test_validate_arrays_matches_validate_all(self):
+        """Test the vectorized validation against the per-prediction path."""
+        from evolution_system import ValidationModule, CalculationEngine
+        from evolution_system.validation_module import AgreementStatus
+        
+        predictions = CalculationEngine().compute_all_predictions()
+        validator = ValidationModule()
+        expected = validator.validate_all(predictions)
+        
+        values = {key: float(p.value) for key, p in predictions.items()}
+        # Second set: alpha_s moved onto its experimental value
+        values['alpha_s'] = np.array([values['alpha_s'], 0.1179])
+        arrays = validator.validate_arrays(values, metadata=predictions)
+        
+        assert len(arrays) == 2
+        summary = arrays.summary(0)
+        for field, value in expected.to_dict()['summary'].items():
+            assert summary[field] == pytest.approx(value, rel=1e-9)
+        report = arrays.report(0)
+        for key, result in expected.results.items():
+            assert report.results[key].agreement_status == result.agreement_status
+            assert report.results[key].prediction_name == result.prediction_name
+        assert report.tier_summaries == expected.tier_summaries
+        
+        assert arrays.agreement(1, 'alpha_s') == AgreementStatus.EXCELLENT
+        assert arrays.counts[AgreementStatus.EXCELLENT][1] == expected.excellent_count + 1
+        assert arrays.overall_pass_rate[1] > arrays.overall_pass_rate[0]
+    
+    def test_validate_many_matrix(self):
+        """Test matrix validation of many prediction sets."""
+        from evolution_system import ValidationModule, CalculationEngine, PredictionSet
+        
+        predictions = CalculationEngine().compute_all_predictions()
+        baseline = PredictionSet.from_predictions(predictions)
+        variant = baseline.with_values({'alpha_s': 0.1179})
+        validator = ValidationModule()
+        
+        from_sets = validator.validate_many([baseline, variant])
+        matrix = np.vstack([baseline.values, variant.values])
+        from_matrix = validator.validate_many(matrix, keys=list(baseline))
+        
+        assert from_sets.sigma.shape == (2, len(baseline))
+        np.testing.assert_array_equal(from_sets.sigma, from_matrix.sigma)
+        np.testing.assert_array_equal(from_sets.mean_sigma, from_matrix.mean_sigma)
+        assert from_sets.overall_pass_rate[1] > from_sets.overall_pass_rate[0]
+        assert from_sets.result(0, 'alpha_inv').prediction_name == predictions['alpha_inv'].name
+        expected = validator.validate_all(predictions)
+        assert from_sets.max_sigma[0] == pytest.approx(expected.max_sigma_deviation, rel=1e-9)
+        
+        with pytest.raises(ValueError):
+            validator.validate_many(matrix)
+    
+    def test_correlated_chi_squared(self):
+        """Test the correlated χ² mode of scalar and array validation."""
+        from evolution_system import ValidationModule, CalculationEngine, PredictionSet
+        
+        predictions = CalculationEngine().compute_all_predictions()
+        validator = ValidationModule(correlated=True)
+        report = validator.validate_all(predictions)
+        independent = {
+            key: result.sigma_deviation for key, result in report.results.items()
+            if result.sigma_deviation is not None and result.exp_uncertainty
+        }
+        assert report.chi_squared_dof == len(independent)
+        assert report.to_dict()['summary']['chi_squared'] == report.chi_squared
+        
+        # Without correlated observables χ² is the sum of squared σ
+        uncorrelated = validator.chi_squared({'alpha_inv': float(predictions['alpha_inv'].value),
+                                              'koide_Q': float(predictions['koide_Q'].value)})
+        assert uncorrelated.chi_squared[0] == pytest.approx(
+            independent['alpha_inv'] ** 2 + independent['koide_Q'] ** 2, rel=1e-9
+        )
+        assert 0.0 <= uncorrelated.p_value() <= 1.0
+        
+        baseline = PredictionSet.from_predictions(predictions)
+        variant = baseline.with_values({'Omega_DM': 0.2607, 'Omega_Lambda': 0.6889})
+        arrays = validator.validate_many([baseline, variant])
+        assert arrays.chi_squared[0] == pytest.approx(report.chi_squared, rel=1e-9)
+        assert arrays.chi_squared[1] < arrays.chi_squared[0]
+        assert arrays.summary(0)['chi_squared'] == arrays.report(0).chi_squared
+    
+    def test_validate_editions_reuses_unchanged_results(self):
+        """Test incremental revalidation across dataset editions."""
+        from evolution_system import ValidationModule, CalculationEngine, get_database
+        
+        predictions = CalculationEngine().compute_all_predictions()
+        validator = ValidationModule()
+        reports = validator.validate_editions(predictions, ['2022.1', 'codata-2018'])
+        
+        current, old = reports['2022.1'], reports['codata-2018']
+        full = ValidationModule(get_database().edition('codata-2018')).validate_all(predictions)
+        assert old.to_dict() == full.to_dict()
+        assert old.results['alpha_inv'].sigma_deviation != current.results['alpha_inv'].sigma_deviation
+        assert old.results['alpha_inv'] is not current.results['alpha_inv']
+        assert all(
+            old.results[key] is current.results[key]
+            for key in predictions if key != 'alpha_inv'
+        )
+
+
+class TestStreamingValidation:
+    """Tests for constant-memory validation statistics."""
+    
+    def test_stream_matches_full_sweep(self):
+        """Test that chunked streaming reproduces the full sweep's statistics."""
+        from evolution_system import ValidationModule
+        from evolution_system.parameter_sweep import ParameterSweep
+        
+        sweep = ParameterSweep()
+        axes = dict(log_ratio_topological=np.linspace(18.0, 20.0, 40),
+                    delta_qed=np.linspace(29.0, 31.0, 25))
+        validator = ValidationModule()
+        full = validator.validate_arrays(sweep.grid(**axes).predictions)
+        summary = validator.validate_stream(sweep.iter_grid(chunk_size=130, **axes))
+        
+        sigma = full.sigma[~np.isnan(full.sigma)]
+        assert summary.n_sets == len(full)
+        assert summary.sigma.count == sigma.size
+        assert summary.sigma.mean == pytest.approx(sigma.mean(), rel=1e-12)
+        assert summary.sigma.std == pytest.approx(sigma.std(ddof=1), rel=1e-9)
+        assert summary.sigma.maximum == np.nanmax(full.sigma)
+        row, key = summary.sigma.argmax
+        assert full.sigma[row, full.keys.index(key)] == summary.sigma.maximum
+        assert summary.overall_pass_rate == pytest.approx(np.mean(full.overall_pass_rate))
+        for q in (0.1, 0.5, 0.9):
+            assert summary.quantile(q) == pytest.approx(np.quantile(sigma, q), rel=0.03)
+    
+    def test_reports_and_merge(self):
+        """Test one-at-a-time feeding and merging of partial summaries."""
+        from evolution_system import ValidationModule, StreamingValidationSummary
+        from evolution_system.parameter_sweep import ParameterSweep
+        
+        result = ParameterSweep().evaluate(delta_qed=np.linspace(29.0, 31.0, 6))
+        arrays = ValidationModule().validate_arrays(result.predictions)
+        
+        one_at_a_time = StreamingValidationSummary().consume(arrays.report(i) for i in range(6))
+        first = StreamingValidationSummary().consume(arrays.report(i) for i in range(3))
+        second = StreamingValidationSummary().consume(arrays.report(i) for i in range(3, 6))
+        first.merge(second)
+        
+        for merged in (first, StreamingValidationSummary().consume([arrays])):
+            assert merged.n_sets == one_at_a_time.n_sets
+            assert merged.status_counts == one_at_a_time.status_counts
+            assert merged.tier_counts == one_at_a_time.tier_counts
+            assert merged.sigma.argmax == one_at_a_time.sigma.argmax
+            assert merged.sigma.mean == pytest.approx(one_at_a_time.sigma.mean, rel=1e-12)
+            assert merged.by_key.keys() == one_at_a_time.by_key.keys()
+        with pytest.raises(TypeError):
+            StreamingValidationSummary().consume([42])
 
 
 class TestErrorAnalyzer:
@@ -479,7 +1139,122 @@ class TestAIAdvisor:
         # Should be sorted by priority score
         assert len(ranked) == 2
         assert ranked[0].modification.priority_score >= ranked[1].modification.priority_score
-    
+
+    def test_duplicate_suggestions_merged(self):
+        """Test that one modification under several patterns yields one suggestion."""
+        from dataclasses import replace
+        from evolution_system import AIAdvisor
+        from evolution_system.ai_advisor import TopologicalModificationTemplates
+
+        templates = TopologicalModificationTemplates()
+        assert (templates.chern_class_correction(order=2).identity
+                == templates.chern_class_correction(order=2).identity)
+        assert (templates.chern_class_correction(order=2).identity
+                != templates.chern_class_correction(order=3).identity)
+
+        advisor = AIAdvisor()
+        patterns = ["gauge_coupling_systematic", "alpha_systematic", "qcd_errors"]
+        advisor.analyze_error_pattern = lambda analysis: patterns
+        suggestions = advisor.generate_suggestions({})
+
+        identities = [s.modification.identity for s in suggestions]
+        assert len(identities) == len(set(identities)) == 4
+        chern = next(s for s in suggestions if s.modification.name == "Chern Class C_2 Correction")
+        assert chern.triggering_patterns == patterns
+        assert chern.error_pattern == patterns[0]
+
+        # Suggestions built elsewhere merge the same way
+        merged = advisor.merge_duplicates(suggestions + advisor.generate_suggestions({}))
+        assert [s.modification.identity for s in merged] == identities
+        assert len(advisor.get_top_suggestions({}, n=10)) <= 4
+
+        # Inputs keep their own patterns
+        first = suggestions[0]
+        first.triggering_patterns = []
+        merged = advisor.merge_duplicates([first, replace(first, triggering_patterns=["cosmological_ratios"])])
+        assert merged[0].triggering_patterns == [first.error_pattern, "cosmological_ratios"]
+        assert merged[0] is not first and first.triggering_patterns == []
+
+    def test_template_registry_shared_and_indexed(self):
+        """Test the shared template registry and its observable index."""
+        from evolution_system.ai_advisor import AIAdvisor, template_registry
+
+        registry = template_registry()
+        assert AIAdvisor().registry is AIAdvisor().registry is registry
+        # One object per distinct template, reused across patterns
+        chern = registry.patterns["gauge_coupling_systematic"][0]
+        assert registry.patterns["qcd_errors"][1] is chern
+        assert len(registry.templates) == 12
+        with pytest.raises(TypeError):
+            registry.patterns["new"] = ()
+
+        assert registry.patterns_for("alpha_s") == ("gauge_coupling_systematic", "qcd_errors")
+        assert registry.patterns_for("Omega_DM") == ()
+        assert registry.patterns_for("Omega_DM", "systematic_offset") == ("vacuum_energy_too_high",)
+
+        advisor = AIAdvisor()
+        candidates = advisor.candidate_templates({
+            "patterns": [{"pattern_type": "outlier", "affected_predictions": ["alpha_1", "alpha_2"]}],
+            "summary": {"poor_predictions": ["alpha_inv", "unknown"]},
+        })
+        assert candidates[0] == (chern, ["gauge_coupling_systematic", "alpha_systematic"])
+        assert len(candidates) == len(set(id(m) for m, _ in candidates)) == 3
+
+        # Ranking scores copies, never the shared templates
+        advisor.analyze_error_pattern = lambda analysis: ["qcd_errors"]
+        ranked = advisor.get_top_suggestions({})
+        assert ranked[0].modification.priority_score > 0
+        assert chern.priority_score == 0.0
+
+        # Nothing a suggestion's modification holds is shared with the registry
+        mod = next(s.modification for s in ranked if s.modification.identity == chern.identity)
+        mod.affected_observables.append("Koide_Q")
+        mod.derivation_steps.clear()
+        mod.correction_factors["alpha_s"] = 2.0
+        assert "Koide_Q" not in chern.affected_observables
+        assert chern.derivation_steps and not chern.correction_factors
+
+    def test_suggestions_from_observable_index(self):
+        """Test that index lookups reproduce the suggestions of the pipeline analysis."""
+        from evolution_system import CalculationEngine, ValidationModule, ErrorAnalyzer
+        from evolution_system.ai_advisor import AIAdvisor
+
+        def summary(suggestions):
+            return sorted(
+                (s.modification.name, tuple(sorted(s.triggering_patterns)))
+                for s in suggestions
+            )
+
+        advisor = AIAdvisor()
+        predictions = CalculationEngine().compute_all_predictions()
+        analysis = ErrorAnalyzer().analyze(ValidationModule().validate_all(predictions)).to_dict()
+        assert summary(advisor.generate_suggestions(analysis)) == [
+            ('B_4 Representation Correction', ('qcd_errors',)),
+            ('Chern Class C_2 Correction', ('alpha_systematic', 'gauge_coupling_systematic', 'qcd_errors')),
+            ('Euler Characteristic Correction', ('cosmological_ratios', 'gauge_coupling_systematic')),
+            ('Higher Hopf Fibration Correction', ('alpha_systematic',)),
+            ('Order-2 Instanton Correction', ('cosmological_ratios',)),
+        ]
+
+        # Pattern types select the cosmology patterns; M_GUT counts for the gauge sector
+        analysis = {"patterns": [
+            {"pattern_type": "systematic_offset", "affected_predictions": ["Omega_DM", "alpha_inv"]},
+            {"pattern_type": "sector_specific", "affected_predictions": ["M_GUT"]},
+            {"pattern_type": "scale_dependent", "affected_predictions": ["alpha_3", "Lambda_suppression"]},
+        ]}
+        assert advisor.analyze_error_pattern(analysis) == [
+            "vacuum_energy_too_high", "alpha_systematic", "gauge_coupling_systematic", "qcd_errors"
+        ]
+        assert summary(advisor.generate_suggestions(analysis)) == [
+            ('B_4 Representation Correction', ('qcd_errors',)),
+            ('Chern Class C_2 Correction', ('alpha_systematic', 'gauge_coupling_systematic', 'qcd_errors')),
+            ('Euler Characteristic Correction', ('gauge_coupling_systematic',)),
+            ('Higher Hopf Fibration Correction', ('alpha_systematic',)),
+            ('Order-2 Instanton Correction', ('vacuum_energy_too_high',)),
+            ('Order-3 Instanton Correction', ('vacuum_energy_too_high',)),
+            ('Weyl Anomaly Correction', ('vacuum_energy_too_high',)),
+        ]
+
     def test_filter_topological_only(self):
         """Test filtering to only topological modifications."""
         from evolution_system import AIAdvisor
@@ -760,6 +1535,243 @@ class TestIntegrationSystem:
         assert regressed_result.is_valid is False
 
 
+    def test_batch_matches_scalar_path(self):
+        """Test that batched refinement testing reproduces test_refinement."""
+        import dataclasses
+        from evolution_system import IntegrationSystem
+        from evolution_system.ai_advisor import TopologicalModificationTemplates
+        from evolution_system.integration_system import _as_suggestions
+        templates = TopologicalModificationTemplates()
+        variants = []
+        for modification in [templates.hopf_fibration_correction(),
+                             templates.chern_class_correction(order=2),
+                             templates.berry_phase_mass_correction()]:
+            for observables in (modification.affected_observables, ['Omega_DM'],
+                                ['Omega_DM', 'alpha_inv'], ['unknown']):
+                for symmetries in (modification.symmetries_preserved, []):
+                    variant = dataclasses.replace(
+                        modification,
+                        affected_observables=list(observables),
+                        symmetries_preserved=list(symmetries),
+                    )
+                    variants.append(variant)
+        suggestions = _as_suggestions(variants)
+
+        scalar = IntegrationSystem(correlated=True)
+        batch = IntegrationSystem(correlated=True)
+        expected = [scalar.test_refinement(s) for s in suggestions]
+        results = batch.test_refinements_batch(suggestions)
+
+        assert [_comparable(r) for r in results] == [_comparable(r) for r in expected]
+        assert len(batch.get_integration_history()) == len(suggestions)
+        assert any(r.target_improved for r in results)
+        assert all(r.refined_chi_squared is not None for r in results)
+
+    def test_parallel_matches_serial_order(self):
+        """Test that process-pool refinement testing keeps suggestion order."""
+        from evolution_system import IntegrationSystem
+        from evolution_system.ai_advisor import TopologicalModificationTemplates
+        from evolution_system.integration_system import _as_suggestions
+        templates = TopologicalModificationTemplates()
+        modifications = [
+            templates.chern_class_correction(order=2),
+            templates.berry_phase_mass_correction(),
+            templates.hopf_fibration_correction(),
+        ] * 3
+        suggestions = _as_suggestions(modifications)
+
+        serial = IntegrationSystem().test_refinements_batch(suggestions)
+        integrator = IntegrationSystem()
+        parallel = integrator.test_refinements_parallel(suggestions, workers=2, chunk_size=2)
+
+        assert [_comparable(r) for r in parallel] == [_comparable(r) for r in serial]
+        assert integrator.get_integration_history() == parallel
+
+        # Workers use the parent's database edition, not the default one
+        from evolution_system import get_database
+        codata2018 = get_database().edition('codata-2018')
+        edition_serial = IntegrationSystem(experimental_db=codata2018).test_refinements_batch(suggestions)
+        edition_parallel = IntegrationSystem(experimental_db=codata2018).test_refinements_parallel(
+            suggestions, workers=2, chunk_size=2
+        )
+        assert [_comparable(r) for r in edition_parallel] == [_comparable(r) for r in edition_serial]
+        assert [_comparable(r) for r in edition_serial] != [_comparable(r) for r in serial]
+
+    def test_failing_refinement_does_not_abort_batch(self):
+        """Test that an exception rejects only the refinement that raised it."""
+        from evolution_system import IntegrationSystem
+        from evolution_system.ai_advisor import TopologicalModificationTemplates
+        from evolution_system.integration_system import _as_suggestions
+        from evolution_system.rejection_memo import RejectionMemo
+        from evolution_system.template_families import FAMILIES
+        templates = TopologicalModificationTemplates()
+        modifications = [
+            # Improves its targets, so it reaches the symmetry checks
+            next(FAMILIES['instanton_vacuum_correction'].iter_modifications([3])),
+            templates.hopf_fibration_correction(),
+            templates.berry_phase_mass_correction(),
+        ]
+        suggestions = _as_suggestions(modifications)
+        expected = IntegrationSystem().test_refinements_batch(suggestions)
+
+        system = IntegrationSystem(rejection_memo=RejectionMemo())
+        compute = system.test_env._compute_correction
+
+        def failing(refinement, observable, value):
+            if refinement.name == modifications[1].name:
+                raise ValueError("broken correction")
+            return compute(refinement, observable, value)
+
+        system.test_env._compute_correction = failing
+
+        def failing_check(refinement, predictions):
+            raise RuntimeError("broken check")
+
+        system.symmetry_checker.check_all = failing_check
+        results = system.test_refinements_parallel(suggestions, workers=1)
+
+        assert expected[0].symmetry_checks and "broken check" in results[0].error
+        assert "broken correction" in results[1].error
+        assert results[1].rejection_reason.value == "numerical_instability"
+        assert results[2].error is None
+        assert results[2].refined_predictions == expected[2].refined_predictions
+        assert len(system.get_integration_history()) == 3
+        # Errors are not remembered as rejections
+        assert all(r.error is None for r in system.rejection_memo.lookup(
+            system.baseline_key(), modifications).values())
+
+        # A chunk that cannot reach its worker only rejects its own modifications
+        unpicklable = templates.holonomy_correction()
+        unpicklable.hook = lambda: None
+        pooled = IntegrationSystem().test_refinements_parallel(
+            suggestions[1:] + _as_suggestions([unpicklable]),
+            workers=2, chunk_size=1
+        )
+        assert [r.error is None for r in pooled] == [True, True, False]
+        assert pooled[0].refined_predictions == expected[1].refined_predictions
+
+    def test_rejection_memo_skips_known_rejections(self, tmp_path):
+        """Test that rejections are remembered across systems by baseline and structure."""
+        import dataclasses
+        from evolution_system import IntegrationSystem
+        from evolution_system.ai_advisor import TopologicalModificationTemplates
+        from evolution_system.integration_system import _as_suggestions
+        from evolution_system.rejection_memo import RejectionMemo, modification_fingerprint
+        
+        templates = TopologicalModificationTemplates()
+        chern2 = templates.chern_class_correction(order=2)
+        suggestions = _as_suggestions([chern2, templates.chern_class_correction(order=3),
+                                       templates.hopf_fibration_correction()])
+        renamed = dataclasses.replace(chern2, name="Renamed", priority_score=9.0)
+        assert modification_fingerprint(renamed) == modification_fingerprint(chern2)
+        assert modification_fingerprint(suggestions[1].modification) != modification_fingerprint(chern2)
+        
+        path = tmp_path / 'rejections.sqlite'
+        first = IntegrationSystem(rejection_memo=RejectionMemo(path)).test_refinements_parallel(
+            suggestions, workers=1
+        )
+        rejected = [r.status.value == 'rejected' for r in first]
+        assert any(rejected) and not any(r.memoized for r in first)
+        
+        # A new process (new memo object on the same file) skips them
+        system = IntegrationSystem(rejection_memo=RejectionMemo(path))
+        second = system.test_refinements_parallel(suggestions, workers=1)
+        assert [r.memoized for r in second] == rejected
+        for before, after in zip(first, second):
+            assert after.rejection_reason == before.rejection_reason
+            assert after.refined_predictions == before.refined_predictions
+        assert len(system.get_integration_history()) == len(suggestions)
+        
+        # Hits and misses mixed: history in suggestion order, hits under the current name
+        mixed = _as_suggestions([
+            templates.weyl_anomaly_correction(), renamed,
+            templates.berry_phase_mass_correction(), suggestions[1].modification,
+            templates.hopf_fibration_correction(), templates.euler_characteristic_correction(),
+        ])
+        third = system.test_refinements_parallel(mixed, workers=2)
+        assert [r.memoized for r in third] == [False, True, False, True, True, False]
+        names = [s.modification.name for s in mixed]
+        assert [r.refinement_name for r in third] == names
+        assert [r.refinement_name for r in system.get_integration_history()[-len(mixed):]] == names
+        
+        # A different tolerance is a different testing context
+        other = IntegrationSystem(sigma_tolerance=0.1, rejection_memo=RejectionMemo(path))
+        assert not any(r.memoized for r in other.test_refinements_parallel(suggestions, workers=1))
+
+    def test_template_families_stream_into_batches(self):
+        """Test lazy template families and their calibration to the fixed templates."""
+        import itertools
+        from evolution_system import IntegrationSystem
+        from evolution_system.ai_advisor import TopologicalModificationTemplates
+        from evolution_system.integration_system import _as_suggestions
+        from evolution_system.template_families import FAMILIES, iter_family_modifications
+
+        # Default parameters reproduce the type-level corrections
+        templates = TopologicalModificationTemplates()
+        system = IntegrationSystem()
+        for name, default in (('chern_class_correction', 2),
+                              ('instanton_vacuum_correction', 2),
+                              ('braid_group_correction', 4)):
+            member = next(FAMILIES[name].iter_modifications([default]))
+            fixed = getattr(templates, name)(default)
+            for observable in fixed.affected_observables:
+                assert member.correction_factors.get(observable, 1.0) == pytest.approx(
+                    system.test_env._compute_correction(fixed, observable, 1)
+                )
+            assert member.identity != fixed.identity
+
+        # Lazy: an unbounded parameter stream is fine
+        orders = FAMILIES['chern_class_correction'].iter_modifications(itertools.count(1), 4)
+        assert [m.name for m in itertools.islice(orders, 3)] == [
+            "Chern Class C_1 Correction", "Chern Class C_2 Correction", "Chern Class C_3 Correction"
+        ]
+        factors = FAMILIES['instanton_vacuum_correction'].factors(range(1, 21))
+        assert factors[0] == pytest.approx(0.8) and np.all(np.diff(factors) >= 0)
+
+        modifications = list(iter_family_modifications())
+        assert len(modifications) == 20 + 20 + 10
+        streamed = list(IntegrationSystem().test_modifications(iter(modifications), batch_size=7))
+        expected = IntegrationSystem().test_refinements_batch(_as_suggestions(modifications))
+        assert [r.refined_predictions for r in streamed] == [r.refined_predictions for r in expected]
+        assert [r.status for r in streamed] == [r.status for r in expected]
+
+    def test_composition_search_matches_exhaustive(self):
+        """Test that pruned composition search finds the exhaustive optimum."""
+        import math
+        from evolution_system import IntegrationSystem
+        from evolution_system.ai_advisor import template_registry
+        from evolution_system.composition_search import CompositionSearch
+        from evolution_system.template_families import iter_family_modifications
+
+        modifications = list(template_registry().templates.values()) + list(
+            iter_family_modifications({'instanton_vacuum_correction': range(1, 9),
+                                       'braid_group_correction': range(3, 7)})
+        )
+        search = CompositionSearch()
+        best = search.search(modifications, max_size=3, top_k=3)
+        exhaustive = CompositionSearch().search(modifications, max_size=3, top_k=10**6)
+
+        n = len(modifications)
+        assert [c.indices for c in best] == [c.indices for c in exhaustive[:3]]
+        assert search.stats['evaluated'] < sum(math.comb(n, k) for k in (1, 2, 3))
+        assert search.stats['pruned_bound'] > 0
+        assert all(2 <= len(c.indices) <= 3 for c in exhaustive)
+        gains = [c.sigma_gain for c in exhaustive]
+        assert gains == sorted(gains, reverse=True)
+
+        # The composed modification reproduces the product of factors
+        top = best[0]
+        env = IntegrationSystem().test_env
+        baseline = env.setup_baseline()
+        composed = env.compute_refined_predictions(top.to_modification())
+        members = [env.compute_refined_predictions(m) for m in top.modifications]
+        for key in top.corrections:
+            expected = baseline.value(key)
+            for refined in members:
+                expected *= refined.value(key) / baseline.value(key)
+            assert composed.value(key) == pytest.approx(expected)
+
+
 class TestFullPipelineWithIntegration:
     """Integration tests for the complete evolution system with Integration System."""
     
@@ -1014,6 +2026,24 @@ class TestEvolutionCycle:
         assert result.start_time is not None
         assert result.end_time is not None
     
+    def test_cycle_records_errors_per_suggestion(self):
+        """Test that testing errors are recorded per suggestion, not per cycle."""
+        from evolution_system import EvolutionCycle
+        from evolution_system.evolution_cycle import CycleStatus
+
+        cycle = EvolutionCycle(verbose=False)
+
+        def failing(suggestions, workers):
+            raise RuntimeError("pool lost")
+
+        cycle.integrator.test_refinements_parallel = failing
+        result = cycle.run(max_refinements=2)
+
+        assert result.status == CycleStatus.COMPLETED
+        assert result.refinements_tested == len(result.integration_results) > 0
+        assert len(result.errors) == result.refinements_tested
+        assert all("pool lost" in error for error in result.errors)
+
     def test_get_cycle_history(self):
         """Test cycle history tracking."""
         from evolution_system import EvolutionCycle
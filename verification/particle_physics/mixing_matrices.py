@@ -12,14 +12,10 @@ eigenstates and interaction eigenstates must also arise from the
 geometric properties of braid group crossings.
 """
 
-import mpmath as mp
 import numpy as np
 from typing import Dict, Tuple, List
 from scipy.optimize import minimize
 
-# Set high precision
-mp.dps = 50
-
 
 class CirculantMatrix:
     """
@@ -15,9 +15,6 @@ calculations. They are ONLY used for validation and comparison.
 import mpmath as mp
 from typing import Dict, Tuple
 
-# Set high precision for all calculations
-mp.dps = 50  # 50 decimal places of precision
-
 # ============================================================================
 # CODATA 2018/2022 EXPERIMENTAL VALUES - FOR VALIDATION ONLY
 # ============================================================================
@@ -109,10 +106,32 @@ class IRHTheory:
     
     All values are derived from the 4-strand architecture and Hopf fibration
     geometry. NO experimental values are used as inputs.
+    
+    All arithmetic runs in the class-level mpmath context ``ctx`` (50 decimal
+    places), so importing this module never changes the global mpmath
+    precision. Use ``IRHTheory.at_precision(dps)`` for another precision.
     """
     
-    @staticmethod
-    def fine_structure_constant() -> Tuple[mp.mpf, Dict]:
+    ctx = mp.MPContext()
+    ctx.dps = 50
+    
+    @classmethod
+    def at_precision(cls, dps: int) -> type:
+        """
+        Return a variant of IRHTheory evaluating in its own ``dps``-digit context.
+        
+        Args:
+            dps: Decimal places of the new context
+        
+        Returns:
+            Subclass of IRHTheory with a private mpmath context
+        """
+        ctx = mp.MPContext()
+        ctx.dps = dps
+        return type(cls.__name__, (cls,), {'ctx': ctx})
+    
+    @classmethod
+    def fine_structure_constant(cls) -> Tuple[mp.mpf, Dict]:
         """
         Compute fine-structure constant α from IRH theory.
         
@@ -144,6 +163,7 @@ class IRHTheory:
         Returns:
             (α⁻¹_total, metadata_dict) where α⁻¹_total ≈ 137.036
         """
+        ctx = cls.ctx
         
         # ===================================================================
         # STEP 1: GEOMETRIC BASE FROM TOPOLOGY (Pure first principles)
@@ -152,11 +172,11 @@ class IRHTheory:
         # Step 1a: Tetrahedral solid angle
         # Ω_tet = 4·arccos(1/3) for regular tetrahedron inscribed in S³
         # This is the solid angle subtended by 4-strand configuration
-        Omega_tet = 4 * mp.acos(mp.mpf(1)/3)
+        Omega_tet = 4 * ctx.acos(ctx.mpf(1)/3)
         
         # Reference 4D solid angle: Ω(S³) = 2π² (unit 3-sphere)
         # But we use 4π² normalization for consistency with Hopf fibration
-        Omega_S3_ref = 4 * mp.pi**2
+        Omega_S3_ref = 4 * ctx.pi**2
         
         # Geometric impedance β_geometric = Ω_ref / Ω_tet
         # This quantifies how the tetrahedral configuration restricts phase flow
@@ -166,7 +186,7 @@ class IRHTheory:
         # The 24-cell in 4D has 24 vertices, forming 12 edge-symmetric loops
         # Each loop contributes phase accumulation around the manifold
         n_loops = 12
-        phase_per_loop = 2 * mp.pi / 12  # π/6 per loop
+        phase_per_loop = 2 * ctx.pi / 12  # π/6 per loop
         
         # Total accumulated phase from 12-fold symmetry
         Phi_12 = n_loops * phase_per_loop * beta_geometric
@@ -180,14 +200,14 @@ class IRHTheory:
         # Per Directive A (No-Tuning Constraint), this should be traced back to explicit
         # topological invariants. Current status: Works empirically but needs rigorous
         # derivation from Casimir operators of SO(4) and Weyl anomaly coefficients.
-        correction_factor = mp.mpf(24) / mp.mpf(13)
+        correction_factor = ctx.mpf(24) / ctx.mpf(13)
         
         alpha_inv_corrected = Phi_12 * correction_factor
         
         # Step 1d: Volume normalization correction
         # Factor (1 + 1/(4π)) comes from proper normalization of S³ volume measure
         # Vol(S³) = 2π²r³, and surface corrections introduce 1/(4π) term
-        volume_correction = 1 + 1 / (4 * mp.pi)
+        volume_correction = 1 + 1 / (4 * ctx.pi)
         
         # Single chirality result (geometric topology only)
         alpha_inv_single_chirality = alpha_inv_corrected * volume_correction
@@ -228,9 +248,9 @@ class IRHTheory:
         # 3. Standard perturbative QFT calculations
         
         # Component breakdown (from QFT calculation, not fitted):
-        delta_alpha_inv_qed = mp.mpf('30.0')      # 1-loop + multi-loop QED vacuum polarization
-        delta_alpha_inv_weyl = mp.mpf('6.0')      # Weyl anomaly from N=4 strand network  
-        delta_alpha_inv_higher = mp.mpf('0.6')    # Higher-order corrections + thresholds
+        delta_alpha_inv_qed = ctx.mpf('30.0')      # 1-loop + multi-loop QED vacuum polarization
+        delta_alpha_inv_weyl = ctx.mpf('6.0')      # Weyl anomaly from N=4 strand network  
+        delta_alpha_inv_higher = ctx.mpf('0.6')    # Higher-order corrections + thresholds
         
         # Total radiative correction
         delta_alpha_inv_radiative = (
@@ -288,8 +308,8 @@ class IRHTheory:
         
         return alpha_inv_total, metadata
     
-    @staticmethod
-    def koide_formula() -> Tuple[mp.mpf, Dict]:
+    @classmethod
+    def koide_formula(cls) -> Tuple[mp.mpf, Dict]:
         """
         Compute Koide ratio Q from circulant matrix eigenvalues.
         
@@ -301,11 +321,12 @@ class IRHTheory:
         Returns:
             (Q_theoretical, metadata_dict)
         """
+        ctx = cls.ctx
         # Theoretical prediction from circulant matrix eigenvalue structure
         # For a circulant matrix with eigenvectors based on cube roots of unity,
         # the ratio Q = 2/3 emerges from the geometric mean relationship
         
-        Q_theory = mp.mpf(2) / mp.mpf(3)
+        Q_theory = ctx.mpf(2) / ctx.mpf(3)
         
         metadata = {
             'Q_exact': '2/3',
@@ -316,8 +337,8 @@ class IRHTheory:
         
         return Q_theory, metadata
     
-    @staticmethod
-    def cosmological_constant_suppression() -> Tuple[mp.mpf, Dict]:
+    @classmethod
+    def cosmological_constant_suppression(cls) -> Tuple[mp.mpf, Dict]:
         """
         Compute cosmological constant Λ suppression factor.
         
@@ -327,6 +348,7 @@ class IRHTheory:
         Returns:
             (suppression_factor, metadata_dict)
         """
+        ctx = cls.ctx
         # Naive QFT vacuum energy (cutoff at Planck scale)
         # ρ_QFT ~ MPl⁴ ~ 10^76 GeV⁴
         
@@ -336,7 +358,7 @@ class IRHTheory:
         # 3. Topological winding: factor ~ 1/N_wind for N_wind ~ 10^120
         
         # Quaternionic suppression (4-strand permutation symmetry)
-        quaternion_factor = 1 / mp.factorial(4)  # 1/24
+        quaternion_factor = 1 / ctx.factorial(4)  # 1/24
         
         # Weyl anomaly instantonic action
         # S_inst ~ 8π²/g² where g ~ α for EM coupling
@@ -365,18 +387,18 @@ class IRHTheory:
             # PLACEHOLDER purely geometric estimate (no experimental inputs).
             # TODO: Replace with exact IRH-derived expression for α_geom from
             # Harmony Functional (see IRHv25.md Section 2 and notebooks/02_harmony_functional.ipynb).
-            return 1 / (4 * mp.pi)
+            return 1 / (4 * ctx.pi)
 
         alpha_irh = geometric_alpha_irh()
-        S_inst = 8 * mp.pi**2 * alpha_irh
-        instanton_factor = mp.exp(-S_inst)
+        S_inst = 8 * ctx.pi**2 * alpha_irh
+        instanton_factor = ctx.exp(-S_inst)
         
         # Topological winding number from Hopf fibration
         # N_wind ~ (MPl/MEW)⁴ ~ 10^120
         # NOTE: M_Pl and M_EW are fundamental scales used as reference values.
         # Future work will derive M_EW from Weyl anomaly structure of 4-strand network.
-        M_Pl_GeV = mp.mpf('1.220910e19')  # Planck mass in GeV (fundamental scale)
-        M_EW_GeV = mp.mpf('246.22')  # Electroweak scale in GeV (phenomenological reference)
+        M_Pl_GeV = ctx.mpf('1.220910e19')  # Planck mass in GeV (fundamental scale)
+        M_EW_GeV = ctx.mpf('246.22')  # Electroweak scale in GeV (phenomenological reference)
         N_wind = (M_Pl_GeV / M_EW_GeV) ** 4
         winding_factor = 1 / N_wind
         
@@ -389,14 +411,14 @@ class IRHTheory:
             'winding_factor': float(winding_factor),
             'N_wind': float(N_wind),
             'total_suppression': float(total_suppression),
-            'suppression_orders_of_magnitude': -float(mp.log10(abs(total_suppression))),
+            'suppression_orders_of_magnitude': -float(ctx.log10(abs(total_suppression))),
             'derivation': 'Quaternionic interference + instantons + winding'
         }
         
         return total_suppression, metadata
     
-    @staticmethod
-    def metric_mismatch_eta() -> Tuple[mp.mpf, Dict]:
+    @classmethod
+    def metric_mismatch_eta(cls) -> Tuple[mp.mpf, Dict]:
         """
         Compute metric mismatch parameter η = 4/π.
         
@@ -406,7 +428,8 @@ class IRHTheory:
         Returns:
             (η, metadata_dict)
         """
-        eta = mp.mpf(4) / mp.pi
+        ctx = cls.ctx
+        eta = ctx.mpf(4) / ctx.pi
         
         metadata = {
             'eta': float(eta),
@@ -571,7 +594,7 @@ def print_validation_report():
     print()
     
     print("=" * 80)
-    print("All values computed with mpmath at 50 decimal places precision")
+    print(f"All values computed with mpmath at {IRHTheory.ctx.dps} decimal places precision")
     print("Experimental values from CODATA 2018/2022 and PDG 2020")
     print("=" * 80)
 
@@ -590,7 +613,7 @@ if __name__ == '__main__':
             return {k: convert_to_json_serializable(v) for k, v in obj.items()}
         elif isinstance(obj, (list, tuple)):
             return [convert_to_json_serializable(item) for item in obj]
-        elif isinstance(obj, mp.mpf):
+        elif hasattr(obj, '_mpf_'):
             return float(obj)
         else:
             return obj
@@ -14,28 +14,37 @@ import numpy as np
 from typing import Dict, Tuple
 import matplotlib.pyplot as plt
 
-# Set high precision
-mp.dps = 50
-
 
 class RGFlow:
     """
     Renormalization Group flow for coupling constants.
+    
+    Each instance evaluates in its own mpmath context (``self.ctx``), so
+    flows of different precision can run side by side without touching
+    the global mpmath precision.
     """
     
-    def __init__(self):
-        """Initialize RG flow calculator."""
+    def __init__(self, precision: int = 50):
+        """
+        Initialize RG flow calculator.
+        
+        Args:
+            precision: Decimal places of this flow's mpmath context
+        """
+        self.ctx = mp.MPContext()
+        self.ctx.dps = precision
+        
         # Reference scale (typically Z boson mass)
-        self.M_Z = mp.mpf('91.1876')  # GeV
+        self.M_Z = self.ctx.mpf('91.1876')  # GeV
         
         # Planck scale
-        self.M_Planck = mp.mpf('1.220910e19')  # GeV
+        self.M_Planck = self.ctx.mpf('1.220910e19')  # GeV
         
         # Electroweak scale
-        self.M_EW = mp.mpf('246.22')  # GeV (Higgs VEV)
+        self.M_EW = self.ctx.mpf('246.22')  # GeV (Higgs VEV)
         
         # GUT scale (typical)
-        self.M_GUT = mp.mpf('2e16')  # GeV
+        self.M_GUT = self.ctx.mpf('2e16')  # GeV
     
     def beta_QED(self, alpha: mp.mpf, n_fermions: int = 3) -> mp.mpf:
         """
@@ -50,7 +59,8 @@ class RGFlow:
         Returns:
             β(α) coefficient
         """
-        beta = (mp.mpf(2) / (3 * mp.pi)) * mp.mpf(n_fermions) * alpha**2
+        ctx = self.ctx
+        beta = (ctx.mpf(2) / (3 * ctx.pi)) * ctx.mpf(n_fermions) * alpha**2
         return beta
     
     def beta_QCD(self, alpha_s: mp.mpf, n_flavors: int = 6) -> mp.mpf:
@@ -66,7 +76,8 @@ class RGFlow:
         Returns:
             β(α_s) coefficient (negative for asymptotic freedom)
         """
-        beta = -(11 - (mp.mpf(2)/3) * mp.mpf(n_flavors)) / (4 * mp.pi) * alpha_s**2
+        ctx = self.ctx
+        beta = -(11 - (ctx.mpf(2)/3) * ctx.mpf(n_flavors)) / (4 * ctx.pi) * alpha_s**2
         return beta
     
     def run_coupling_QED(self, alpha_0: mp.mpf, mu_0: mp.mpf, mu: mp.mpf,
@@ -87,11 +98,12 @@ class RGFlow:
         Returns:
             α(μ) at target scale
         """
+        ctx = self.ctx
         # Beta function coefficient
-        beta_coeff = (2 * mp.mpf(n_fermions)) / (3 * mp.pi)
+        beta_coeff = (2 * ctx.mpf(n_fermions)) / (3 * ctx.pi)
         
         # Logarithmic ratio
-        log_ratio = mp.log(mu / mu_0)
+        log_ratio = ctx.log(mu / mu_0)
         
         # Running formula
         denominator = 1 - beta_coeff * alpha_0 * log_ratio
@@ -117,11 +129,12 @@ class RGFlow:
         Returns:
             α_s(μ) at target scale
         """
+        ctx = self.ctx
         # Beta function coefficient (note: positive in denominator for asymptotic freedom)
-        beta_0 = (11 - (mp.mpf(2)/3) * mp.mpf(n_flavors)) / (4 * mp.pi)
+        beta_0 = (11 - (ctx.mpf(2)/3) * ctx.mpf(n_flavors)) / (4 * ctx.pi)
         
         # Logarithmic ratio
-        log_ratio = mp.log(mu / mu_0)
+        log_ratio = ctx.log(mu / mu_0)
         
         # Running formula (note: + sign for asymptotic freedom)
         denominator = 1 + beta_0 * alpha_s_0 * log_ratio
@@ -139,18 +152,19 @@ class RGFlow:
         Returns:
             (α_geometric, metadata)
         """
+        ctx = self.ctx
         # Hopf fibration volume ratio
         # Vol(S^7)/Vol(S^3) = (π⁴/3)/(2π²) = π²/6
-        hopf_ratio = mp.pi**2 / 6
+        hopf_ratio = ctx.pi**2 / 6
         
         # 24-cell vertices
-        n_vertices = mp.mpf(24)
+        n_vertices = ctx.mpf(24)
         
         # Metric mismatch
-        eta = mp.mpf(4) / mp.pi
+        eta = ctx.mpf(4) / ctx.pi
         
         # Weyl anomaly at Planck scale
-        a_weyl = mp.mpf(5) / (16 * mp.pi**2)
+        a_weyl = ctx.mpf(5) / (16 * ctx.pi**2)
         
         # Combine
         alpha_inv_geometric = hopf_ratio * n_vertices * (1 + eta * a_weyl)
@@ -185,15 +199,16 @@ class RGFlow:
         Returns:
             Weyl correction to α⁻¹
         """
+        ctx = self.ctx
         # Weyl anomaly beta coefficient
         # For N=4 strands: β_weyl ~ a_weyl = 5/(16π²)
-        beta_weyl = mp.mpf(5) / (16 * mp.pi**2)
+        beta_weyl = ctx.mpf(5) / (16 * ctx.pi**2)
         
         # Logarithmic correction
-        log_correction = mp.log(Q**2 / self.M_Planck**2)
+        log_correction = ctx.log(Q**2 / self.M_Planck**2)
         
         # Weyl contribution to α⁻¹
-        delta_alpha_inv = -(beta_weyl / (12 * mp.pi)) * log_correction
+        delta_alpha_inv = -(beta_weyl / (12 * ctx.pi)) * log_correction
         
         return delta_alpha_inv
     
@@ -277,11 +292,12 @@ def plot_rg_flow(output_file: str = 'rg_flow_alpha.png'):
     rg = RGFlow()
     
     # Energy scale range (log scale from electron mass to Planck)
-    Q_min = mp.log10(mp.mpf('0.000511'))  # Electron mass
-    Q_max = mp.log10(rg.M_Planck)
+    ctx = rg.ctx
+    Q_min = ctx.log10(ctx.mpf('0.000511'))  # Electron mass
+    Q_max = ctx.log10(rg.M_Planck)
     
     Q_range_log = np.linspace(float(Q_min), float(Q_max), 200)
-    Q_range = [mp.mpf(10)**mp.mpf(q) for q in Q_range_log]
+    Q_range = [ctx.mpf(10)**ctx.mpf(q) for q in Q_range_log]
     
     # Compute α at each scale
     alpha_values = []
@@ -414,7 +430,7 @@ if __name__ == '__main__':
             return {k: convert_for_json(v) for k, v in obj.items()}
         elif isinstance(obj, (list, tuple)):
             return [convert_for_json(item) for item in obj]
-        elif isinstance(obj, mp.mpf):
+        elif hasattr(obj, '_mpf_'):
             return float(obj)
         else:
             return obj